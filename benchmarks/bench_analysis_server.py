@@ -0,0 +1,127 @@
+# Client de test du serveur d'analyse : des centaines de requêtes simultanées sur plusieurs connexions,
+# avec des positions répétées (déduplication), des délais courts et des annulations.
+#
+#   python -m benchmarks.bench_analysis_server                     # serveur lancé dans ce processus
+#   python -m benchmarks.bench_analysis_server --port 8765         # serveur déjà lancé (python -m game.analysis_server)
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from game.ai import get_ai_move
+from game.analysis_server import AnalysisServer, AnalysisClient, parse_request, percentiles
+
+POSITIONS_FILE = os.path.join(os.path.dirname(__file__), 'positions.json')
+DEFAULT_REQUESTS = 300
+DEFAULT_CONNECTIONS = 8
+DEADLINE_SHARE = 0.1  # Part des requêtes envoyées avec un délai court
+CANCEL_SHARE = 0.05  # Part des requêtes annulées juste après leur envoi
+
+
+def build_requests(count, seed):
+    """Requêtes tirées des positions de référence (profondeur réduite) : beaucoup de positions reviennent."""
+    with open(POSITIONS_FILE) as f:
+        positions = json.load(f)['positions']
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(count):
+        position = rng.choice(positions)
+        request = {'rows': position['rows'], 'cols': position['cols'], 'win_condition': position['win_condition'],
+                   'moves': position['moves'], 'depth': min(position['depth'], rng.choice((2, 3)))}
+        draw = rng.random()
+        if draw < DEADLINE_SHARE:
+            request['deadline_ms'] = rng.choice((5, 20, 50))
+        elif draw < DEADLINE_SHARE + CANCEL_SHARE:
+            request['cancel'] = True
+        requests.append(request)
+    return requests
+
+
+# Une connexion : envoie toutes ses requêtes sans attendre, puis récupère les réponses
+async def run_connection(client, requests):
+    futures = []
+    for index, request in enumerate(requests):
+        cancel = request.pop('cancel', False)
+        request['id'] = index
+        futures.append((request, client.send(request)))
+        if cancel:
+            client.send({'op': 'cancel', 'target': index})
+    return [(request, await future) for request, future in futures]
+
+
+async def run_load(requests, connections, port, path):
+    clients = [await AnalysisClient.connect(port=port, path=path) for _ in range(connections)]
+    start = time.perf_counter()
+    chunks = [requests[index::connections] for index in range(connections)]
+    results = await asyncio.gather(*(run_connection(client, chunk) for client, chunk in zip(clients, chunks)))
+    elapsed = time.perf_counter() - start
+    metrics = await clients[0].metrics()
+    for client in clients:
+        await client.close()
+    return [pair for chunk in results for pair in chunk], elapsed, metrics
+
+
+# Vérifie les réponses complètes (sans délai) contre get_ai_move appelé directement
+def verify(responses):
+    checked, mismatches = {}, []
+    for request, response in responses:
+        if response['status'] != 'ok' or 'deadline_ms' in request:
+            continue
+        key, payload = parse_request(request)
+        if key not in checked:
+            checked[key] = get_ai_move(payload['board'], payload['difficulty'], payload['win_condition'],
+                                       depth=payload['depth'], rng=payload['seed'])
+        if checked[key] != response['col']:
+            mismatches.append((request, response, checked[key]))
+    return len(checked), mismatches
+
+
+async def main(args):
+    requests = build_requests(args.requests, args.seed)
+    server = None
+    path = None
+    if args.port is None:
+        path = os.path.join(tempfile.mkdtemp(), "analysis.sock")
+        server = AnalysisServer(args.workers, args.batch_size)
+        await server.start(path=path)
+    try:
+        responses, elapsed, metrics = await run_load(requests, args.connections, args.port, path)
+    finally:
+        if server is not None:
+            await server.close()
+
+    statuses = {}
+    for _, response in responses:
+        statuses[response['status']] = statuses.get(response['status'], 0) + 1
+    latency = percentiles([response['latency_ms'] for _, response in responses if response['status'] == 'ok'])
+    print(f"{len(responses)} requêtes sur {args.connections} connexions en {elapsed:.2f} s "
+          f"({len(responses) / elapsed:.1f} requêtes/s)")
+    print(f"Statuts : {statuses}")
+    print(f"Recherches lancées : {metrics['searches']}, évitées : {metrics['skipped_searches']}, "
+          f"réponses partagées : {metrics['shared']}")
+    print(f"File d'attente maximale : {metrics['max_queue_depth']}")
+    if latency is not None:
+        print(f"Latence (ms) : p50 {latency['p50']:.1f}  p95 {latency['p95']:.1f}  p99 {latency['p99']:.1f}  "
+              f"max {latency['max']:.1f}")
+
+    if args.verify:
+        count, mismatches = verify(responses)
+        print(f"Vérification : {count} positions, {len(mismatches)} coups différents de get_ai_move")
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Charge du serveur d'analyse")
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument('--connections', type=int, default=DEFAULT_CONNECTIONS)
+    parser.add_argument('--workers', type=int, default=None, help="Processus du serveur lancé localement")
+    parser.add_argument('--batch-size', type=int, default=4)
+    parser.add_argument('--port', type=int, default=None, help="Serveur TCP déjà lancé (sinon serveur local)")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--verify', action='store_true', help="Comparer les coups à get_ai_move")
+    args = parser.parse_args()
+    asyncio.run(main(args))
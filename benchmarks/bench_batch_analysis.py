@@ -0,0 +1,75 @@
+# Analyse d'un lot de positions : get_ai_move appelé position par position contre get_ai_moves (une seule
+# recherche vectorisée pour tout le lot). Les positions sont celles de benchmarks/positions.json, rejouées
+# depuis plusieurs ouvertures aléatoires pour former des lots plus grands.
+#
+#   python -m benchmarks.bench_batch_analysis [--size 64] [--depth 3]
+import os
+import json
+import time
+import random
+import argparse
+import numpy as np
+from game.ai import get_ai_move, get_ai_moves
+from game.game_logic import is_valid_location, get_next_open_row, drop_piece, winning_move
+from benchmarks.bench_positions import side_to_move_board
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+POSITIONS_FILE = os.path.join(os.path.dirname(__file__), 'positions.json')
+
+
+# Lot de positions d'une configuration : les positions de référence, puis des variantes à deux coups aléatoires près
+def build_batch(positions, size, rng):
+    boards = []
+    while len(boards) < size:
+        position = rng.choice(positions)
+        board = side_to_move_board(position['rows'], position['cols'], position['moves'])
+        if boards:
+            for piece in (AI_PIECE, PLAYER_PIECE):
+                valid = [col for col in range(board.shape[1]) if is_valid_location(board, col)]
+                if not valid:
+                    break
+                col = rng.choice(valid)
+                drop_piece(board, get_next_open_row(board, col), col, piece)
+        win_condition = position['win_condition']
+        if not (winning_move(board, AI_PIECE, win_condition) or winning_move(board, PLAYER_PIECE, win_condition)):
+            boards.append(board)
+    return np.stack(boards)
+
+
+def run(size, depth, seed):
+    with open(POSITIONS_FILE) as f:
+        positions = json.load(f)['positions']
+    configs = {}
+    for position in positions:
+        configs.setdefault((position['rows'], position['cols'], position['win_condition']), []).append(position)
+
+    rng = random.Random(seed)
+    print(f"{'plateau':<10}{'positions':>10}{'profondeur':>12}{'boucle (s)':>12}{'lot (s)':>10}{'gain':>8}{'accord':>9}")
+    for (rows, cols, win_condition), group in configs.items():
+        boards = build_batch(group, size, rng)
+        search_depth = depth or min(position['depth'] for position in group)
+
+        start = time.perf_counter()
+        loop_moves = [get_ai_move(board.copy(), "hard", win_condition, depth=search_depth, rng=seed)
+                      for board in boards]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_moves, scores = get_ai_moves(boards, "hard", win_condition, depth=search_depth, rng=seed)
+        batch_time = time.perf_counter() - start
+
+        # Les positions où tout coup perd sont jouées au hasard par les deux méthodes
+        decided = scores != float("-inf")
+        agreement = np.mean(np.array(loop_moves)[decided] == batch_moves[decided]) if decided.any() else 1.0
+        label = f"{rows}x{cols}/{win_condition}"
+        print(f"{label:<10}{len(boards):>10}{search_depth:>12}{loop_time:>12.2f}{batch_time:>10.2f}"
+              f"{loop_time / batch_time:>7.1f}x{agreement * 100:>8.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="get_ai_move en boucle contre get_ai_moves sur un lot")
+    parser.add_argument('--size', type=int, default=64, help="Positions par configuration")
+    parser.add_argument('--depth', type=int, default=3, help="Profondeur (0 = celle des positions de référence)")
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+    run(args.size, args.depth, args.seed)
@@ -0,0 +1,47 @@
+# Compare le débit (parties/seconde) d'une simulation partie par partie, sur le modèle de
+# AIMatchTester.run_match, avec celui de BatchSimulator, pour une même politique aléatoire
+import time
+import random
+import argparse
+import numpy as np
+from game.game_logic import winning_move, get_next_open_row, drop_piece, is_valid_location
+from game.batch_simulation import BatchSimulator, random_policy
+
+
+# Boucle de référence : mêmes appels que run_match, une partie à la fois
+def play_sequential(num_games, rows, cols, win_condition):
+    for match_index in range(num_games):
+        grid = np.zeros((rows, cols))
+        turn = 1 if match_index % 2 == 0 else 2
+        while True:
+            col = random.choice([c for c in range(cols) if is_valid_location(grid, c)])
+            row = get_next_open_row(grid, col)
+            drop_piece(grid, row, col, turn)
+            if winning_move(grid, turn, win_condition) or np.all(grid != 0):
+                break
+            turn = 2 if turn == 1 else 1
+
+
+def play_batched(num_games, rows, cols, win_condition):
+    BatchSimulator(num_games, rows, cols, win_condition).run(random_policy, rng=np.random.default_rng(0))
+
+
+def measure(function, num_games, rows, cols, win_condition):
+    start = time.perf_counter()
+    function(num_games, rows, cols, win_condition)
+    return num_games / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit de la simulation par lot")
+    parser.add_argument('--sequential-games', type=int, default=200)
+    parser.add_argument('--batch-games', type=int, default=20000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"{'plateau':<10} {'séquentiel':>14} {'par lot':>14} {'gain':>8}")
+    for rows, cols, win_condition in [(6, 7, 4), (5, 5, 3), (10, 10, 5)]:
+        sequential = measure(play_sequential, args.sequential_games, rows, cols, win_condition)
+        batched = measure(play_batched, args.batch_games, rows, cols, win_condition)
+        label = f"{rows}x{cols}/{win_condition}"
+        print(f"{label:<10} {sequential:>10.0f} p/s {batched:>10.0f} p/s {batched / sequential:>7.0f}x")
@@ -0,0 +1,50 @@
+# Passage à l'échelle de l'analyse d'après-partie (tournament/blunder_analysis.py) : positions uniques analysées
+# par seconde selon le nombre de processus de travail, et vérification que les scores ne dépendent pas de ce
+# nombre. Les matchs viennent de match_results.json (ou d'un autre fichier de résultats).
+#
+#   python -m benchmarks.bench_blunder_analysis [--input match_results.json] [--depth 4] [--workers 1 2 4]
+import os
+import time
+import argparse
+from tournament.blunder_analysis import iter_games, normalize_game, replay_positions, analyse_positions
+from game.ai import DIFFICULTY_DEPTHS
+
+
+def load_positions(path, limit):
+    unique = set()
+    with open(path) as f:
+        for index, game in enumerate(iter_games(f)):
+            if limit is not None and index >= limit:
+                break
+            board_config, starting_player, moves, _, _ = normalize_game(game, (6, 7, 4))
+            unique.update(key for key, _ in replay_positions(board_config, starting_player, moves))
+    return unique
+
+
+def run(path, depth, worker_counts, limit):
+    keys = load_positions(path, limit)
+    print(f"{len(keys)} positions uniques, profondeur {depth}, {os.cpu_count()} cœurs")
+    print(f"{'processus':>10}{'durée (s)':>11}{'positions/s':>13}{'accélération':>14}{'efficacité':>12}")
+    reference, base_rate = None, None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        scores = analyse_positions(keys, depth, workers)
+        elapsed = time.perf_counter() - start
+        rate = len(keys) / elapsed
+        if reference is None:
+            reference, base_rate = scores, rate
+        assert scores == reference  # Mêmes scores quel que soit le découpage
+        print(f"{workers:>10}{elapsed:>11.2f}{rate:>13.1f}{rate / base_rate:>13.2f}x"
+              f"{rate / base_rate / workers * 100:>11.0f}%")
+
+
+if __name__ == "__main__":
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Analyse d'après-partie : débit selon le nombre de processus")
+    parser.add_argument('--input', default='match_results.json', help="Fichier de résultats des matchs")
+    parser.add_argument('--depth', type=int, default=DIFFICULTY_DEPTHS['hard'])
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, *(2 ** i for i in range(1, cores.bit_length()) if 2 ** i <= cores), cores}))
+    parser.add_argument('--limit', type=int, default=None, help="Nombre maximal de matchs lus")
+    args = parser.parse_args()
+    run(args.input, args.depth, args.workers, args.limit)
@@ -0,0 +1,87 @@
+# Nœuds cherchés par coup au fil d'une partie : get_ai_move sans état, Engine remis à zéro avant chaque coup
+# (table de transposition et historique limités à la recherche en cours) et Engine conservé pendant toute la
+# partie. Les trois modes analysent exactement les mêmes positions : la partie suit les coups de get_ai_move.
+# « gain table » mesure la table de transposition dans une recherche (sans état / remis à zéro), « gain session »
+# la réutilisation des tables d'un coup à l'autre (remis à zéro / session).
+#
+#   python -m benchmarks.bench_engine_session [--difficulty hard] [--games 2]
+import time
+import random
+import argparse
+import numpy as np
+from game.ai import get_ai_move
+from game.engine import Engine
+from game.game_logic import winning_move, get_next_open_row, drop_piece, is_valid_location
+from game.search_stats import SearchStats
+
+MODES = ('sans état', 'remis à zéro', 'session')
+BOARDS = [(6, 7, 4), (7, 7, 5), (8, 9, 5)]
+
+
+# Partie de référence : ouverture aléatoire de deux coups, puis coups de get_ai_move des deux côtés
+def reference_game(rows, cols, win_condition, difficulty, rng):
+    grid = np.zeros((rows, cols))
+    moves, turn = [], 1
+    while True:
+        if len(moves) < 2:
+            col = rng.choice([c for c in range(cols) if is_valid_location(grid, c)])
+        else:
+            col = get_ai_move(grid, difficulty, win_condition, rng=random.Random(0))
+        drop_piece(grid, get_next_open_row(grid, col), col, turn)
+        moves.append(col)
+        if winning_move(grid, turn, win_condition) or np.all(grid != 0):
+            return moves
+        turn = 2 if turn == 1 else 1
+
+
+# Nœuds et durée de chaque recherche de la partie `moves` (à partir du troisième coup) dans un mode donné
+def search_game(rows, cols, win_condition, difficulty, moves, mode):
+    grid = np.zeros((rows, cols))
+    engines = {turn: Engine(rows, cols, win_condition) for turn in (1, 2)}
+    nodes, elapsed, turn = [], 0.0, 1
+    for ply, col in enumerate(moves):
+        if ply >= 2:
+            stats = SearchStats()
+            start = time.perf_counter()
+            if mode == 'sans état':
+                get_ai_move(grid, difficulty, win_condition, stats=stats, rng=random.Random(0))
+            else:
+                if mode == 'remis à zéro':
+                    engines[turn].reset()
+                engines[turn].best_move(grid, difficulty, stats=stats, rng=random.Random(0))
+            elapsed += time.perf_counter() - start
+            nodes.append(stats.nodes)
+        drop_piece(grid, get_next_open_row(grid, col), col, turn)
+        for engine in engines.values():
+            engine.play(col, turn)
+        turn = 2 if turn == 1 else 1
+    return nodes, elapsed
+
+
+def run(difficulty, games, seed):
+    rng = random.Random(seed)
+    print(f"Nœuds par partie ({difficulty}, {games} parties par plateau, coups après l'ouverture)")
+    print(f"{'plateau':<10}" + "".join(f"{mode:>16}{'(s)':>7}" for mode in MODES)
+          + f"{'gain table':>12}{'gain session':>14}")
+    for rows, cols, win_condition in BOARDS:
+        totals = {mode: [0, 0.0] for mode in MODES}
+        for _ in range(games):
+            moves = reference_game(rows, cols, win_condition, difficulty, rng)
+            for mode in MODES:
+                # Le premier coup cherché est le même dans les trois modes : seuls les suivants sont comparés
+                nodes, elapsed = search_game(rows, cols, win_condition, difficulty, moves, mode)
+                totals[mode][0] += sum(nodes[1:])
+                totals[mode][1] += elapsed
+        label = f"{rows}x{cols}/{win_condition}"
+        print(f"{label:<10}" + "".join(f"{totals[mode][0]:>16}{totals[mode][1]:>7.1f}" for mode in MODES)
+              + f"{totals['sans état'][0] / totals['remis à zéro'][0]:>11.2f}x"
+              + f"{totals['remis à zéro'][0] / totals['session'][0]:>13.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nœuds par coup : get_ai_move sans état vs session Engine")
+    parser.add_argument('--difficulty', default='hard', choices=('easy', 'medium', 'hard'))
+    parser.add_argument('--games', type=int, default=2, help="Parties par plateau")
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+    run(args.difficulty, args.games, args.seed)
@@ -0,0 +1,67 @@
+# Mesure le coût CPU d'une image de GameScreen : dessin complet historique (chaque case et chaque pion
+# redessinés, écran poussé deux fois) comparé au rendu incrémental (grille pré-rendue + rectangles modifiés)
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Aucune fenêtre nécessaire
+
+import time
+import argparse
+import pygame
+from settings.constants import BASE_WIDTH, BASE_HEIGHT, BLACK, BLUE, RED, YELLOW, PLAYER_PIECE, AI_PIECE
+from game.game_screen import GameScreen
+
+
+# Reproduction du dessin d'origine de GameScreen.draw, pour comparaison
+def legacy_draw(game_screen, screen):
+    screen.fill(BLACK)
+    cell = game_screen.cell_size
+    start_x = (screen.get_width() - game_screen.cols * cell) // 2
+    start_y = (screen.get_height() - game_screen.rows * cell) // 2
+    for row in range(game_screen.rows):
+        for col in range(game_screen.cols):
+            pygame.draw.rect(screen, BLUE, pygame.Rect(start_x + col * cell, start_y + row * cell, cell, cell), 2)
+    for row in range(game_screen.rows):
+        for col in range(game_screen.cols):
+            if game_screen.grid[row][col] in (PLAYER_PIECE, AI_PIECE):
+                color = RED if game_screen.grid[row][col] == PLAYER_PIECE else YELLOW
+                center = (start_x + col * cell + cell // 2, start_y + row * cell + cell // 2)
+                pygame.draw.circle(screen, color, center, cell // 2 - 5)
+    pygame.display.update()
+    pygame.display.flip()
+
+
+# Rendu actuel : le même chemin que Game.run
+def incremental_draw(game_screen, screen):
+    dirty_rects = game_screen.draw(screen)
+    if dirty_rects is None:
+        pygame.display.flip()
+    elif dirty_rects:
+        pygame.display.update(dirty_rects)
+
+
+def measure(draw, frames, rows, cols, move_every):
+    screen = pygame.display.get_surface()
+    game_screen = GameScreen(rows, cols, 4, "easy", None, lambda: None, 1)
+    free = [(row, col) for row in range(rows - 1, -1, -1) for col in range(cols)]
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % move_every == 0 and free:
+            row, col = free.pop(0)
+            game_screen.play_piece(row, col, PLAYER_PIECE if frame % 2 else AI_PIECE)
+        draw(game_screen, screen)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Coût par image de l'écran de jeu")
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--move-every', type=int, default=30, help="Un pion posé toutes les N images")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((BASE_WIDTH, BASE_HEIGHT))
+    for rows, cols in [(6, 7), (10, 10)]:
+        legacy = measure(legacy_draw, args.frames, rows, cols, args.move_every)
+        incremental = measure(incremental_draw, args.frames, rows, cols, args.move_every)
+        print(f"{rows}x{cols} : historique {legacy:.3f} ms/image, incrémental {incremental:.3f} ms/image "
+              f"({legacy / incremental:.0f}x)")
+    pygame.quit()
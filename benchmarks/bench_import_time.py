@@ -0,0 +1,48 @@
+# Mesure le temps de démarrage et la mémoire d'un processus qui importe le moteur,
+# comparé à un processus qui charge aussi les constantes graphiques (pygame + polices)
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+# Code exécuté dans chaque processus mesuré : importe les modules puis rapporte ses mesures
+PROBE = """
+import time, resource, sys, json
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'import_time': elapsed,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'pygame_loaded': 'pygame' in sys.modules
+}}))
+"""
+
+CASES = [
+    ("moteur (game.ai)", ["game.ai"]),
+    ("tournoi (ai_match_tester)", ["tournament.ai_match_tester"]),
+    ("évaluation (game.evaluation)", ["game.evaluation"]),
+    ("moteur + constantes pygame", ["game.ai", "settings.constants"]),
+]
+
+
+# Fonction qui lance un processus et retourne ses mesures
+def probe(modules):
+    output = subprocess.run([sys.executable, "-c", PROBE.format(modules=modules)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Temps d'import du moteur avec et sans pygame")
+    parser.add_argument('--repeat', type=int, default=5, help="Nombre de processus par cas (médiane)")
+    args = parser.parse_args()
+
+    print(f"{'cas':<30} {'import (ms)':>12} {'RSS max (Mo)':>13} {'pygame':>7}")
+    for label, modules in CASES:
+        runs = [probe(modules) for _ in range(args.repeat)]
+        import_ms = statistics.median(run['import_time'] for run in runs) * 1000
+        rss_mb = statistics.median(run['max_rss_kb'] for run in runs) / 1024
+        print(f"{label:<30} {import_ms:>12.1f} {rss_mb:>13.1f} {'oui' if runs[0]['pygame_loaded'] else 'non':>7}")
@@ -0,0 +1,106 @@
+# Grands plateaux (10x10, 15x15, 20x20, victoire à 5) : coût d'un coup joué puis annulé avec son évaluation et
+# son test de victoire (score_position + winning_move sur tout le plateau contre la mise à jour incrémentale de
+# LargeBoard), puis recherche complète (get_ai_move contre get_large_move) : durée par coup, nœuds et nœuds/s.
+# Les positions sont des milieux de partie tirés au hasard autour du centre (graine fixe).
+#
+#   python -m benchmarks.bench_large_board [--positions 10] [--plies 20] [--depths 2 3 4] [--reference-depth 3]
+import time
+import random
+import argparse
+import numpy as np
+from game.ai import get_ai_move, score_position, get_valid_locations, simulate_move, undo_move, get_next_open_row
+from game.game_logic import winning_move
+from game.large_board import LargeBoard, get_large_move
+from game.search_stats import SearchStats
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+SIZES = ((10, 10), (15, 15), (20, 20))
+WIN_CONDITION = 5
+
+
+# Milieu de partie : `plies` coups tirés à moins de 3 colonnes du centre, sans alignement gagnant
+def random_position(rows, cols, plies, rng):
+    while True:
+        board = np.zeros((rows, cols))
+        piece = PLAYER_PIECE
+        for _ in range(plies):
+            col = min(cols - 1, max(0, cols // 2 + rng.randint(-3, 3)))
+            if board[0][col] != 0:
+                break
+            simulate_move(board, get_next_open_row(board, col), col, piece)
+            if winning_move(board, piece, WIN_CONDITION):
+                break
+            piece = 3 - piece
+        else:
+            return board
+
+
+# Microsecondes par coup (jouer, évaluer, tester la victoire, annuler) sur toutes les colonnes jouables
+def full_board_move(board, repeat):
+    columns = get_valid_locations(board)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for col in columns:
+            row = get_next_open_row(board, col)
+            simulate_move(board, row, col, AI_PIECE)
+            winning_move(board, AI_PIECE, WIN_CONDITION)
+            score_position(board, AI_PIECE)
+            undo_move(board, row, col)
+    return (time.perf_counter() - start) / (repeat * len(columns)) * 1e6
+
+
+def incremental_move(board, repeat):
+    large = LargeBoard(board, WIN_CONDITION)
+    columns = get_valid_locations(board)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for col in columns:
+            large.play(col, AI_PIECE)
+            large.score
+            large.undo(col)
+    return (time.perf_counter() - start) / (repeat * len(columns)) * 1e6
+
+
+def search(function, boards, depth):
+    stats = SearchStats()
+    for board in boards:
+        function(board.copy(), 'hard', WIN_CONDITION, depth=depth, stats=stats, rng=random.Random(0))
+    return stats
+
+
+def run(count, plies, depths, reference_depth):
+    rng = random.Random(0)
+    print("Coup joué + évaluation + test de victoire + annulation (µs par coup)")
+    print(f"{'plateau':<10}{'plateau complet':>17}{'incrémental':>13}{'gain':>8}")
+    positions = {}
+    for rows, cols in SIZES:
+        boards = [random_position(rows, cols, plies, rng) for _ in range(count)]
+        positions[(rows, cols)] = boards
+        for board in boards:  # Le score incrémental est celui de score_position
+            assert LargeBoard(board, WIN_CONDITION).score == score_position(board, AI_PIECE)
+        full = sum(full_board_move(board, 5) for board in boards) / count
+        incremental = sum(incremental_move(board, 5) for board in boards) / count
+        print(f"{f'{rows}x{cols}/{WIN_CONDITION}':<10}{full:>17.1f}{incremental:>13.1f}{full / incremental:>7.1f}x")
+
+    print(f"\nRecherche ({count} positions de {plies} demi-coups par plateau)")
+    print(f"{'plateau':<10}{'moteur':<10}{'prof.':>6}{'ms/coup':>10}{'nœuds':>10}{'nœuds/s':>10}")
+    for (rows, cols), boards in positions.items():
+        for depth in depths:
+            engines = [('large', get_large_move)]
+            if depth <= reference_depth:
+                engines.insert(0, ('minimax', get_ai_move))
+            for name, function in engines:
+                stats = search(function, boards, depth)
+                print(f"{f'{rows}x{cols}/{WIN_CONDITION}':<10}{name:<10}{depth:>6}"
+                      f"{stats.elapsed / count * 1000:>10.1f}{stats.nodes:>10}{stats.nodes / stats.elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grands plateaux : minimax sur tout le plateau vs moteur incrémental")
+    parser.add_argument('--positions', type=int, default=10, help="Positions par plateau")
+    parser.add_argument('--plies', type=int, default=20, help="Demi-coups joués avant chaque position")
+    parser.add_argument('--depths', type=int, nargs='+', default=[2, 3, 4, 5])
+    parser.add_argument('--reference-depth', type=int, default=3,
+                        help="Profondeur maximale de la recherche de référence (get_ai_move)")
+    args = parser.parse_args()
+    run(args.positions, args.plies, args.depths, args.reference_depth)
@@ -0,0 +1,76 @@
+# Score de chaque coup d'une position : minimax appelé une fois par colonne (fenêtre complète, sans table)
+# contre Engine.multi_pv (une table de transposition partagée par les recherches des coups de la racine),
+# pour les N meilleurs coups et pour tous les coups. Positions : benchmarks/positions.json.
+#
+#   python -m benchmarks.bench_multi_pv [--top 3] [--depth 0]
+import os
+import json
+import time
+import random
+import argparse
+from game.ai import minimax, get_valid_locations, get_next_open_row, simulate_move, undo_move
+from game.engine import Engine
+from game.search_stats import SearchStats
+from benchmarks.bench_positions import side_to_move_board
+from settings.game_constants import AI_PIECE
+
+POSITIONS_FILE = os.path.join(os.path.dirname(__file__), 'positions.json')
+
+
+# Référence : une recherche complète par colonne jouable
+def scores_per_column(board, depth, win_condition, stats):
+    scores = {}
+    for col in get_valid_locations(board):
+        row = get_next_open_row(board, col)
+        simulate_move(board, row, col, AI_PIECE)
+        scores[col] = minimax(board, depth - 1, float("-inf"), float("inf"), False, win_condition, stats=stats,
+                              rng=random.Random(0))[1]
+        undo_move(board, row, col)
+    return scores
+
+
+def run(top, depth):
+    with open(POSITIONS_FILE) as f:
+        positions = json.load(f)['positions']
+    configs = {}
+    for position in positions:
+        board = side_to_move_board(position['rows'], position['cols'], position['moves'])
+        if get_valid_locations(board):
+            key = (position['rows'], position['cols'], position['win_condition'])
+            configs.setdefault(key, []).append((board, depth or position['depth']))
+
+    modes = ('par colonne', f'multi-PV {top}', 'multi-PV tous')
+    print("Nœuds et durée pour scorer les coups de chaque position (toutes les positions d'un plateau)")
+    print(f"{'plateau':<10}" + "".join(f"{mode:>16}{'(s)':>7}" for mode in modes) + f"{'gain N':>8}{'gain tous':>10}")
+    for (rows, cols, win_condition), group in configs.items():
+        totals = {mode: [0, 0.0] for mode in modes}
+        for board, search_depth in group:
+            stats = SearchStats()
+            start = time.perf_counter()
+            reference = scores_per_column(board, search_depth, win_condition, stats)
+            totals[modes[0]][0] += stats.nodes
+            totals[modes[0]][1] += time.perf_counter() - start
+            expected = sorted(reference.values(), reverse=True)
+
+            for mode, count in ((modes[1], top), (modes[2], None)):
+                stats = SearchStats()
+                start = time.perf_counter()
+                lines = Engine(rows, cols, win_condition).multi_pv(board, search_depth, count, stats=stats,
+                                                                    rng=random.Random(0))
+                totals[mode][0] += stats.nodes
+                totals[mode][1] += time.perf_counter() - start
+                # Mêmes scores que la référence, pour les mêmes coups
+                assert [score for _, score, _ in lines] == expected[:len(lines)]
+                assert all(reference[col] == score for col, score, _ in lines)
+
+        label = f"{rows}x{cols}/{win_condition}"
+        print(f"{label:<10}" + "".join(f"{totals[mode][0]:>16}{totals[mode][1]:>7.2f}" for mode in modes)
+              + f"{totals[modes[0]][1] / totals[modes[1]][1]:>7.1f}x{totals[modes[0]][1] / totals[modes[2]][1]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scores de tous les coups : une recherche par colonne vs multi-PV")
+    parser.add_argument('--top', type=int, default=3, help="Nombre de coups du mode multi-PV partiel")
+    parser.add_argument('--depth', type=int, default=0, help="Profondeur (0 = celle des positions de référence)")
+    args = parser.parse_args()
+    run(args.top, args.depth)
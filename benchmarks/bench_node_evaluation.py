@@ -0,0 +1,97 @@
+# Coût par nœud de l'évaluation des enfants dans minimax : enfant par enfant (score_simulated_move,
+# winning_move, score_position) contre tous les enfants d'un coup (game/vectorized.py), puis effet sur une
+# recherche complète (ai.VECTORIZED_CHILDREN). Positions : benchmarks/positions.json.
+#
+#   python -m benchmarks.bench_node_evaluation [--repeat 20]
+import os
+import json
+import time
+import random
+import argparse
+import game.ai as ai
+from game.ai import (score_simulated_move, score_position, get_valid_locations, simulate_move, undo_move,
+                     get_next_open_row, minimax, _order_children)
+from game.game_logic import winning_move
+from game.search_stats import SearchStats
+from benchmarks.bench_positions import side_to_move_board
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+POSITIONS_FILE = os.path.join(os.path.dirname(__file__), 'positions.json')
+
+
+# Ancienne évaluation d'un nœud : tri par score_simulated_move, puis (profondeur 1) chaque feuille testée et évaluée
+def scalar_node(board, piece, depth, win_condition):
+    valid_locations = get_valid_locations(board)
+    valid_locations.sort(key=lambda col: score_simulated_move(board, col, piece), reverse=piece == AI_PIECE)
+    if depth == 1:
+        for col in valid_locations:
+            row = get_next_open_row(board, col)
+            simulate_move(board, row, col, piece)
+            if not (winning_move(board, AI_PIECE, win_condition) or winning_move(board, PLAYER_PIECE, win_condition)) \
+                    and get_valid_locations(board):
+                score_position(board, AI_PIECE)
+            undo_move(board, row, col)
+
+
+def vectorized_node(board, piece, depth, win_condition):
+    _order_children(board, get_valid_locations(board), piece, depth, win_condition, None)
+
+
+def time_per_node(function, boards, piece, depth, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board, win_condition in boards:
+            function(board, piece, depth, win_condition)
+    return (time.perf_counter() - start) / (repeat * len(boards)) * 1e6
+
+
+def time_search(boards, depth, vectorized):
+    ai.VECTORIZED_CHILDREN = vectorized
+    stats = SearchStats()
+    start = time.perf_counter()
+    for board, win_condition in boards:
+        minimax(board.copy(), depth, float("-inf"), float("inf"), True, win_condition, stats=stats,
+                rng=random.Random(0))
+    elapsed = time.perf_counter() - start
+    ai.VECTORIZED_CHILDREN = True
+    return elapsed, stats.nodes
+
+
+def run(repeat):
+    with open(POSITIONS_FILE) as f:
+        positions = json.load(f)['positions']
+    configs = {}
+    for position in positions:
+        board = side_to_move_board(position['rows'], position['cols'], position['moves'])
+        if get_valid_locations(board):
+            key = (position['rows'], position['cols'], position['win_condition'])
+            configs.setdefault(key, []).append((board, position['win_condition'], position['depth']))
+
+    print("Coût moyen par nœud (µs) : tri des coups (profondeur > 1) et nœud frontière (profondeur 1)")
+    print(f"{'plateau':<10}{'tri boucle':>12}{'tri vect.':>11}{'gain':>7}{'front. boucle':>15}{'front. vect.':>14}"
+          f"{'gain':>7}{'recherche boucle':>18}{'vect.':>8}{'gain':>7}")
+    for (rows, cols, win_condition), group in configs.items():
+        boards = [(board, wc) for board, wc, _ in group]
+        results = []
+        for depth in (2, 1):
+            scalar = sum(time_per_node(scalar_node, boards, piece, depth, repeat) for piece in (AI_PIECE, PLAYER_PIECE)) / 2
+            vector = sum(time_per_node(vectorized_node, boards, piece, depth, repeat)
+                         for piece in (AI_PIECE, PLAYER_PIECE)) / 2
+            results.append((scalar, vector))
+        # Recherche complète à une profondeur réduite d'un cran (quelques secondes en mode boucle)
+        search_depth = max(1, min(depth for _, _, depth in group) - 1)
+        loop_time, loop_nodes = time_search(boards, search_depth, False)
+        vector_time, vector_nodes = time_search(boards, search_depth, True)
+        assert loop_nodes == vector_nodes  # Même arbre exploré
+        label = f"{rows}x{cols}/{win_condition}"
+        (sort_loop, sort_vec), (front_loop, front_vec) = results
+        print(f"{label:<10}{sort_loop:>12.0f}{sort_vec:>11.0f}{sort_loop / sort_vec:>6.1f}x{front_loop:>15.0f}"
+              f"{front_vec:>14.0f}{front_loop / front_vec:>6.1f}x{loop_time:>16.2f} s{vector_time:>6.2f} s"
+              f"{loop_time / vector_time:>6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Coût par nœud : évaluation enfant par enfant vs vectorisée")
+    parser.add_argument('--repeat', type=int, default=20, help="Répétitions de la mesure par nœud")
+    args = parser.parse_args()
+    run(args.repeat)
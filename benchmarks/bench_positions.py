@@ -0,0 +1,278 @@
+# Benchmark du moteur sur des positions fixes : temps par profondeur, nœuds par seconde et accord
+# du meilleur coup avec les réponses de référence de benchmarks/positions.json.
+#
+#   python -m benchmarks.bench_positions --output bench.json          # mesure
+#   python -m benchmarks.bench_positions --baseline bench.json        # comparaison avec une mesure sauvegardée
+#   python -m benchmarks.bench_positions --generate                   # régénère les positions et les références
+import os
+import sys
+import json
+import random
+import argparse
+import platform
+from game.ai import get_ai_move, get_valid_locations, minimax, simulate_move, undo_move
+from game.game_logic import board_from_moves, create_board, drop_piece, get_next_open_row, winning_move
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+POSITIONS_FILE = os.path.join(os.path.dirname(__file__), 'positions.json')
+SEARCH_SEED = 0  # Graine fixée avant chaque recherche : nombre de nœuds reproductible
+REGRESSION_TOLERANCE = 0.10  # Ralentissement relatif toléré avant de signaler une régression
+MIN_SIGNIFICANT_TIME = 0.005  # En dessous (en secondes), les écarts de temps sont du bruit
+
+# Configurations de plateau couvertes : (lignes, colonnes, victoire, profondeur de référence)
+CONFIGS = [
+    (5, 5, 3, 6),
+    (6, 7, 4, 5),
+    (7, 7, 5, 4),
+    (8, 8, 5, 4),
+    (9, 9, 6, 3),
+    (10, 10, 7, 3),
+]
+# Positions tirées par configuration : (catégorie, nombre de coups joués)
+CATEGORIES = [
+    ('opening', 2),
+    ('midgame', 8),
+    ('late', 16),
+    ('win', None),    # L'IA a un coup gagnant immédiat
+    ('block', None),  # L'adversaire menace de gagner au prochain coup
+]
+
+
+def side_to_move_board(rows, cols, moves):
+    """Plateau d'une position de la suite : le premier joueur est choisi pour que ce soit à AI_PIECE de jouer."""
+    first_piece = PLAYER_PIECE if len(moves) % 2 else AI_PIECE
+    return board_from_moves(rows, cols, moves, first_piece)
+
+
+def encode_score(score):
+    """JSON standard ne connaît pas l'infini : les scores de victoire ou défaite forcées sont notés en texte."""
+    if score in (float("inf"), float("-inf")):
+        return "inf" if score > 0 else "-inf"
+    return score
+
+
+# Réponse de référence : valeur exacte de chaque coup (minimax sans fenêtre réduite à la racine)
+def reference_answer(board, depth, win_condition):
+    for col in get_valid_locations(board):
+        row = get_next_open_row(board, col)
+        simulate_move(board, row, col, AI_PIECE)
+        won = winning_move(board, AI_PIECE, win_condition)
+        undo_move(board, row, col)
+        if won:
+            # get_ai_move joue tout coup gagnant immédiat sans chercher
+            return [c for c in get_valid_locations(board) if _wins(board, c, win_condition)], "inf"
+
+    scores = {}
+    for col in get_valid_locations(board):
+        row = get_next_open_row(board, col)
+        simulate_move(board, row, col, AI_PIECE)
+        _, scores[col] = minimax(board, depth - 1, float("-inf"), float("inf"), False, win_condition)
+        undo_move(board, row, col)
+    best = max(scores.values())
+    return [col for col, score in scores.items() if score == best], encode_score(best)
+
+
+def _wins(board, col, win_condition):
+    row = get_next_open_row(board, col)
+    simulate_move(board, row, col, AI_PIECE)
+    won = winning_move(board, AI_PIECE, win_condition)
+    undo_move(board, row, col)
+    return won
+
+
+def _threatened(board, win_condition):
+    """True si PLAYER_PIECE gagnerait en jouant une des colonnes libres."""
+    for col in get_valid_locations(board):
+        row = get_next_open_row(board, col)
+        simulate_move(board, row, col, PLAYER_PIECE)
+        won = winning_move(board, PLAYER_PIECE, win_condition)
+        undo_move(board, row, col)
+        if won:
+            return True
+    return False
+
+
+# Tire des parties aléatoires (sans jamais les terminer) jusqu'à une position de la catégorie voulue
+def sample_position(rng, rows, cols, win_condition, category, num_moves):
+    for _ in range(10000):
+        board = create_board(rows, cols)
+        piece = AI_PIECE  # Nombre pair de coups joués <=> c'est à AI_PIECE de jouer
+        moves = []
+        while True:
+            if len(moves) % 2 == 0 and len(moves) >= 2:
+                can_win = any(_wins(board, col, win_condition) for col in get_valid_locations(board))
+                threatened = _threatened(board, win_condition)
+                if num_moves is not None:
+                    if len(moves) >= num_moves:
+                        if not can_win and not threatened:
+                            return moves
+                        break
+                elif category == 'win' and can_win:
+                    return moves
+                elif category == 'block' and threatened and not can_win:
+                    return moves
+
+            valid_locations = get_valid_locations(board)
+            if len(valid_locations) <= 1:
+                break
+            col = rng.choice(valid_locations)
+            drop_piece(board, get_next_open_row(board, col), col, piece)
+            if winning_move(board, piece, win_condition):
+                break
+            moves.append(col)
+            piece = 3 - piece
+    raise RuntimeError(f"Aucune position '{category}' trouvée pour {rows}x{cols}/{win_condition}")
+
+
+def generate_positions(seed=2024):
+    rng = random.Random(seed)
+    positions = []
+    for rows, cols, win_condition, depth in CONFIGS:
+        for category, num_moves in CATEGORIES:
+            moves = sample_position(rng, rows, cols, win_condition, category, num_moves)
+            board = side_to_move_board(rows, cols, moves)
+            best_moves, score = reference_answer(board, depth, win_condition)
+            positions.append({
+                'id': f"{rows}x{cols}w{win_condition}-{category}",
+                'rows': rows,
+                'cols': cols,
+                'win_condition': win_condition,
+                'depth': depth,
+                'moves': moves,
+                'best_moves': best_moves,
+                'score': score
+            })
+            print(f"  {positions[-1]['id']:<22} {len(moves):>3} coups, références {best_moves} (score {score})")
+    return {'version': 1, 'seed': seed, 'positions': positions}
+
+
+# Mesure une position : une recherche à profondeur fixe pour chaque profondeur de 1 à la profondeur de référence
+def run_position(position, repeat):
+    board = side_to_move_board(position['rows'], position['cols'], position['moves'])
+    time_to_depth = []
+    for depth in range(1, position['depth'] + 1):
+        best_time = None
+        for _ in range(repeat):
+            col, stats = get_ai_move(board, 'hard', position['win_condition'], depth=depth, return_stats=True,
+                                     rng=SEARCH_SEED)
+            best_time = stats.elapsed if best_time is None else min(best_time, stats.elapsed)
+        time_to_depth.append(best_time)
+
+    return {
+        'id': position['id'],
+        'best_move': col,
+        'agreed': col in position['best_moves'],
+        'nodes': stats.nodes,
+        'elapsed': best_time,
+        'nodes_per_second': stats.nodes / best_time if best_time > 0 else 0.0,
+        'time_to_depth': time_to_depth
+    }
+
+
+def run_suite(suite, repeat=1, only=None, verbose=True):
+    results = []
+    for position in suite['positions']:
+        if only and not position['id'].startswith(only):
+            continue
+        result = run_position(position, repeat)
+        results.append(result)
+        if verbose:
+            print(f"{result['id']:<22} d{position['depth']}  {result['elapsed'] * 1000:>9.1f} ms  "
+                  f"{result['nodes']:>8} nœuds  {result['nodes_per_second'] / 1000:>6.1f} k/s  "
+                  f"coup {result['best_move']} {'ok' if result['agreed'] else 'DIFFÉRENT ' + str(position['best_moves'])}")
+
+    total_time = sum(result['elapsed'] for result in results)
+    total_nodes = sum(result['nodes'] for result in results)
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'positions': results,
+        'summary': {
+            'positions': len(results),
+            'agreement': sum(result['agreed'] for result in results) / len(results) if results else None,
+            'total_time': total_time,
+            'total_nodes': total_nodes,
+            'nodes_per_second': total_nodes / total_time if total_time > 0 else 0.0
+        }
+    }
+
+
+# Compare une mesure à une mesure de référence et retourne la liste des régressions
+def compare(report, baseline, tolerance=REGRESSION_TOLERANCE):
+    regressions = []
+    previous = {result['id']: result for result in baseline['positions']}
+    common = [(previous[result['id']], result) for result in report['positions'] if result['id'] in previous]
+    for before, result in common:
+        ratio = result['elapsed'] / before['elapsed'] if before['elapsed'] > 0 else 1.0
+        marker = ""
+        if result['elapsed'] - before['elapsed'] > MIN_SIGNIFICANT_TIME and ratio > 1 + tolerance:
+            regressions.append(f"{result['id']} : {ratio:.2f}x plus lent")
+            marker = "  << RÉGRESSION"
+        if before['agreed'] and not result['agreed']:
+            regressions.append(f"{result['id']} : meilleur coup différent de la référence")
+            marker = "  << RÉGRESSION"
+        nodes_note = "" if result['nodes'] == before['nodes'] else f" (nœuds {before['nodes']} -> {result['nodes']})"
+        print(f"{result['id']:<22} {before['elapsed'] * 1000:>9.1f} -> {result['elapsed'] * 1000:>9.1f} ms  "
+              f"{ratio:>5.2f}x{nodes_note}{marker}")
+    if not common:
+        print("Aucune position en commun avec la référence")
+        return regressions
+
+    # Totaux calculés sur les seules positions mesurées des deux côtés
+    totals = []
+    for side in (0, 1):
+        elapsed = sum(pair[side]['elapsed'] for pair in common)
+        nodes = sum(pair[side]['nodes'] for pair in common)
+        agreed = sum(pair[side]['agreed'] for pair in common) / len(common)
+        totals.append((elapsed, nodes / elapsed if elapsed > 0 else 0.0, agreed))
+    (time_before, nps_before, agreed_before), (time_after, nps_after, agreed_after) = totals
+    nps_ratio = nps_after / nps_before if nps_before else 1.0
+    print(f"\nTotal : {time_before:.3f} -> {time_after:.3f} s, "
+          f"nœuds/s {nps_before / 1000:.1f} -> {nps_after / 1000:.1f} k ({nps_ratio:.2f}x), "
+          f"accord {agreed_before:.0%} -> {agreed_after:.0%}")
+    if nps_ratio < 1 - tolerance:
+        regressions.append(f"nœuds par seconde : {nps_ratio:.2f}x")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark du moteur sur des positions fixes")
+    parser.add_argument('--positions', default=POSITIONS_FILE, help="Fichier des positions et références")
+    parser.add_argument('--output', default=None, help="Fichier JSON du rapport")
+    parser.add_argument('--baseline', default=None, help="Rapport précédent à comparer (code de sortie 1 si régression)")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help="Ralentissement relatif toléré (0.10 = 10 %%)")
+    parser.add_argument('--repeat', type=int, default=1, help="Mesures par recherche (le minimum est retenu)")
+    parser.add_argument('--only', default=None, help="Préfixe des positions à mesurer (ex : 6x7w4)")
+    parser.add_argument('--generate', action='store_true', help="Régénérer les positions et leurs références")
+    args = parser.parse_args()
+
+    if args.generate:
+        print(f"Génération de {args.positions} (réponses de référence par minimax complet)...")
+        suite = generate_positions()
+        with open(args.positions, 'w') as f:
+            json.dump(suite, f, indent=1)
+        sys.exit(0)
+
+    with open(args.positions) as f:
+        suite = json.load(f)
+    report = run_suite(suite, args.repeat, args.only)
+    summary = report['summary']
+    print(f"\n{summary['positions']} positions en {summary['total_time']:.3f} s, "
+          f"{summary['nodes_per_second'] / 1000:.1f} k nœuds/s, accord {summary['agreement']:.0%}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\n=== Comparaison avec {args.baseline} ===")
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("\nRégressions :")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("Aucune régression")
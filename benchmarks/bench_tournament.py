@@ -0,0 +1,212 @@
+# Débit et latence de bout en bout d'un tournoi AIMatchTester : parties et coups par seconde,
+# latence par coup (p50/p95/p99/max) par difficulté et par plateau, mémoire maximale et démarrage.
+#
+#   python -m benchmarks.bench_tournament --output tournament_bench.json
+#   python -m benchmarks.bench_tournament --baseline tournament_bench.json   # comparaison entre versions
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import resource
+import statistics
+import subprocess
+import multiprocessing as mp
+from queue import Empty
+from tournament.ai_match_tester import AIMatchTester, MATCHUPS
+
+DEFAULT_BOARDS = ['5x5x3', '6x7x4']  # Plateaux mesurés : lignes x colonnes x victoire
+DEFAULT_GAMES = 2  # Matchs par duel et par plateau (le premier joueur alterne)
+DEFAULT_SEED = 1234
+PERCENTILES = (50, 95, 99)
+REGRESSION_TOLERANCE = 0.15  # Dégradation relative tolérée avant de signaler une régression
+POLL_INTERVAL = 1.0  # Secondes entre deux vérifications que le processus d'un plateau est toujours en vie
+
+# Code exécuté par le processus dont on mesure le démarrage : imports puis création du tournoi
+STARTUP_PROBE = "from tournament.ai_match_tester import AIMatchTester; AIMatchTester()"
+
+
+def parse_board(text):
+    rows, cols, win_condition = (int(value) for value in text.lower().split('x'))
+    return rows, cols, win_condition
+
+
+def percentile(sorted_values, p):
+    """Percentile par rang (la valeur sous laquelle se trouvent p % des mesures)."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(latencies):
+    values = sorted(latencies)
+    summary = {'count': len(values), 'mean': statistics.fmean(values) if values else None}
+    for p in PERCENTILES:
+        summary[f'p{p}'] = percentile(values, p)
+    summary['max'] = values[-1] if values else None
+    return summary
+
+
+# Exécuté dans un processus neuf : joue tous les duels sur un plateau et renvoie les mesures
+def run_board(board, num_games, seed, queue):
+    rows, cols, win_condition = board
+    tester = AIMatchTester(rows, cols, win_condition, num_games=num_games, seed=seed, record_latency=True)
+    random.seed(seed)
+    start = time.perf_counter()
+    for _ in tester.play_matchups():  # Mêmes duels qu'evaluate, sans affichage ni fichier de résultats
+        pass
+    elapsed = time.perf_counter() - start
+    games = len(tester.match_history)
+    moves = sum(len(record['moves']) for record in tester.match_history)
+    queue.put({
+        'games': games,
+        'moves': moves,
+        'elapsed': elapsed,
+        'games_per_second': games / elapsed,
+        'moves_per_second': moves / elapsed,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'latency': {difficulty: latency_summary(latencies)
+                    for difficulty, latencies in tester.move_latencies.items() if latencies}
+    })
+
+
+def measure_board(board, num_games, seed):
+    # Processus « spawn » : la mémoire maximale ne comprend que l'interpréteur et ce plateau
+    ctx = mp.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=run_board, args=(board, num_games, seed, queue))
+    process.start()
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=POLL_INTERVAL)
+        except Empty:
+            if process.exitcode is None:
+                continue  # Plateau encore en cours
+            try:
+                result = queue.get(timeout=POLL_INTERVAL)  # Résultat envoyé juste avant la fin du processus
+            except Empty:
+                raise RuntimeError(f"le processus du plateau {board} s'est arrêté sans résultat "
+                                   f"(code de sortie {process.exitcode})") from None
+    process.join()
+    return result
+
+
+def measure_startup(repeat):
+    """Durée médiane (en secondes) entre le lancement de l'interpréteur et un tournoi prêt à jouer."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", STARTUP_PROBE], check=True)
+        runs.append(time.perf_counter() - start)
+    return {'median': statistics.median(runs), 'min': min(runs), 'runs': runs}
+
+
+def run_benchmark(boards, num_games, seed, startup_repeat, verbose=True):
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'config': {'boards': boards, 'games_per_matchup': num_games, 'seed': seed,
+                   'matchups': [list(matchup) for matchup in MATCHUPS]},
+        'startup': measure_startup(startup_repeat),
+        'boards': {}
+    }
+    if verbose:
+        print(f"Démarrage : {report['startup']['median'] * 1000:.0f} ms (médiane de {startup_repeat})")
+
+    for board_text in boards:
+        board = parse_board(board_text)
+        result = measure_board(board, num_games, seed)
+        key = f"{board[0]}x{board[1]}/{board[2]}"
+        report['boards'][key] = result
+        if verbose:
+            print(f"\n=== Plateau {key} : {result['games']} parties, {result['moves']} coups en {result['elapsed']:.1f} s ===")
+            print(f"  {result['games_per_second']:.3f} parties/s, {result['moves_per_second']:.1f} coups/s, "
+                  f"mémoire max {result['peak_rss_kb'] / 1024:.1f} Mo")
+            for difficulty, latency in result['latency'].items():
+                print(f"  {difficulty:<7} {latency['count']:>5} coups  p50 {latency['p50'] * 1000:>8.1f} ms  "
+                      f"p95 {latency['p95'] * 1000:>8.1f} ms  p99 {latency['p99'] * 1000:>8.1f} ms  "
+                      f"max {latency['max'] * 1000:>8.1f} ms")
+
+    games = sum(result['games'] for result in report['boards'].values())
+    moves = sum(result['moves'] for result in report['boards'].values())
+    elapsed = sum(result['elapsed'] for result in report['boards'].values())
+    report['totals'] = {
+        'games': games,
+        'moves': moves,
+        'elapsed': elapsed,
+        'games_per_second': games / elapsed if elapsed > 0 else 0.0,
+        'moves_per_second': moves / elapsed if elapsed > 0 else 0.0,
+        'peak_rss_kb': max((result['peak_rss_kb'] for result in report['boards'].values()), default=0)
+    }
+    return report
+
+
+# Compare deux rapports et retourne la liste des régressions
+def compare(report, baseline, tolerance=REGRESSION_TOLERANCE):
+    regressions = []
+
+    def check(label, before, after, higher_is_better):
+        if not before or after is None:
+            return
+        ratio = after / before
+        worse = ratio < 1 - tolerance if higher_is_better else ratio > 1 + tolerance
+        print(f"  {label:<32} {before:>12.4f} -> {after:>12.4f}  {ratio:>5.2f}x{'  << RÉGRESSION' if worse else ''}")
+        if worse:
+            regressions.append(f"{label} : {ratio:.2f}x")
+
+    if baseline['config'] != report['config']:
+        print("Attention : configurations différentes, la comparaison n'est qu'indicative")
+    check("démarrage (s)", baseline['startup']['median'], report['startup']['median'], False)
+    for key, result in report['boards'].items():
+        before = baseline['boards'].get(key)
+        if before is None:
+            continue
+        print(f"Plateau {key}")
+        check(f"{key} parties/s", before['games_per_second'], result['games_per_second'], True)
+        check(f"{key} coups/s", before['moves_per_second'], result['moves_per_second'], True)
+        check(f"{key} mémoire max (Ko)", before['peak_rss_kb'], result['peak_rss_kb'], False)
+        for difficulty, latency in result['latency'].items():
+            previous = before['latency'].get(difficulty)
+            if previous is not None:
+                check(f"{key} {difficulty} p95 (s)", previous['p95'], latency['p95'], False)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit et latence des tournois entre IA")
+    parser.add_argument('--boards', nargs='+', default=DEFAULT_BOARDS, help="Plateaux, ex : 5x5x3 6x7x4")
+    parser.add_argument('--num-games', type=int, default=DEFAULT_GAMES, help="Matchs par duel et par plateau")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--startup-repeat', type=int, default=5, help="Mesures du démarrage (médiane)")
+    parser.add_argument('--output', default=None, help="Fichier JSON du rapport")
+    parser.add_argument('--baseline', default=None, help="Rapport précédent à comparer (code de sortie 1 si régression)")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE)
+    args = parser.parse_args()
+
+    try:
+        report = run_benchmark(args.boards, args.num_games, args.seed, args.startup_repeat)
+    except RuntimeError as e:
+        sys.exit(f"Erreur : {e}")
+    totals = report['totals']
+    print(f"\nTotal : {totals['games']} parties, {totals['games_per_second']:.3f} parties/s, "
+          f"{totals['moves_per_second']:.1f} coups/s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\n=== Comparaison avec {args.baseline} ===")
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("\nRégressions :")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("Aucune régression")
@@ -0,0 +1,59 @@
+# Mesure le nombre de rendus de texte (font.render) et le temps par image des écrans de l'interface,
+# avec et sans le cache de texte partagé de ui/interface.py
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Aucune fenêtre nécessaire
+
+import time
+import argparse
+import pygame
+from settings.constants import BASE_WIDTH, BASE_HEIGHT
+from ui.interface import TEXT_CACHE, OVERLAY_CACHE
+from menu.main_menu import MainMenu
+from settings.settings_screen import SettingsScreen
+from ui.credits_screen import CreditsScreen
+from game.game_screen import GameScreen
+
+
+def build_screens():
+    paused_game = GameScreen(6, 7, 4, "easy", None, lambda: None, 1)
+    paused_game.toggle_pause()
+    return [
+        ("menu principal", MainMenu(lambda mode: None, lambda: None)),
+        ("paramètres IA vs IA", SettingsScreen(lambda *args: None, lambda: None, mode="ai_vs_ai")),
+        ("crédits", CreditsScreen(lambda: None)),
+        ("jeu en pause", paused_game),
+    ]
+
+
+def measure(screen_object, screen, frames):
+    TEXT_CACHE.hits = TEXT_CACHE.misses = 0
+    OVERLAY_CACHE.hits = OVERLAY_CACHE.misses = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        if isinstance(screen_object, GameScreen):
+            screen_object.full_redraw = True  # Pire cas : overlay et boutons redessinés à chaque image
+        screen_object.draw(screen)
+    elapsed = (time.perf_counter() - start) / frames * 1000
+    return elapsed, TEXT_CACHE.misses / frames, OVERLAY_CACHE.misses / frames
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rendus de texte par image de l'interface")
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((BASE_WIDTH, BASE_HEIGHT))
+    screens = build_screens()
+
+    print(f"{'écran':<22} {'sans cache':>24} {'avec cache':>24}")
+    for label, screen_object in screens:
+        TEXT_CACHE.max_size = 0  # Cache désactivé : chaque texte est rendu à chaque image
+        TEXT_CACHE.clear()
+        off_ms, off_renders, _ = measure(screen_object, screen, args.frames)
+        TEXT_CACHE.max_size = 256
+        measure(screen_object, screen, 1)  # Remplissage du cache
+        on_ms, on_renders, overlays = measure(screen_object, screen, args.frames)
+        print(f"{label:<22} {off_ms:>7.3f} ms {off_renders:>5.1f} rendus "
+              f"{on_ms:>7.3f} ms {on_renders:>5.1f} rendus  ({overlays:.1f} overlays créés/image)")
+    pygame.quit()
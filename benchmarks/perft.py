@@ -0,0 +1,182 @@
+# Perft : compte les positions de l'arbre de jeu jusqu'à une profondeur donnée, avec les seules fonctions
+# de game/game_logic.py. Les comptes de référence (benchmarks/perft_reference.json) vérifient qu'une autre
+# représentation du plateau génère exactement le même arbre ; les durées mesurent la vitesse de game_logic.
+#
+#   python -m benchmarks.perft                                       # vérifie toutes les références
+#   python -m benchmarks.perft --rows 6 --cols 7 --win 4 --depth 6   # position libre (--moves 3 3 4 ...)
+#   python -m benchmarks.perft --generate                            # régénère les références
+import os
+import sys
+import json
+import time
+import argparse
+from game.game_logic import board_from_moves, get_next_open_row, drop_piece, is_valid_location, winning_move
+
+REFERENCE_FILE = os.path.join(os.path.dirname(__file__), 'perft_reference.json')
+
+# Positions de référence : (identifiant, lignes, colonnes, victoire, coups joués, profondeur maximale)
+REFERENCE_POSITIONS = [
+    ('5x5w3-empty', 5, 5, 3, [], 6),
+    ('5x5w3-midgame', 5, 5, 3, [1, 3, 4, 3, 3, 4, 1, 1], 5),
+    ('6x7w4-empty', 6, 7, 4, [], 5),
+    ('6x7w4-late', 6, 7, 4, [6, 2, 5, 2, 1, 1, 2, 4, 1, 2, 2, 1, 4, 6, 3, 0], 4),
+    ('6x7w4-endgame', 6, 7, 4, [3, 0, 2, 5, 0, 2, 6, 1, 1, 5, 1, 0, 1, 2, 4, 6, 6, 1, 4, 3, 3, 6, 6, 6, 1, 2, 3, 3, 2, 4,
+                                4, 5, 2, 4, 5, 3], 6),
+    ('7x7w5-empty', 7, 7, 5, [], 4),
+    ('8x8w5-midgame', 8, 8, 5, [7, 0, 5, 2, 6, 6, 6, 0], 3),
+    ('10x10w7-empty', 10, 10, 7, [], 3),
+]
+
+
+class PerftCounts:
+    """Résultat d'un perft à une profondeur donnée."""
+
+    def __init__(self):
+        self.nodes = 0  # Suites de `depth` coups jouables (la partie n'est pas terminée avant le dernier)
+        self.wins = 0  # Parmi elles, celles dont le dernier coup gagne
+        self.draws = 0  # Celles dont le dernier coup remplit le plateau sans gagner
+
+    def to_dict(self):
+        return {'nodes': self.nodes, 'wins': self.wins, 'draws': self.draws}
+
+
+def next_piece(moves):
+    """Pièce du joueur au trait après `moves` (le joueur 1 commence)."""
+    return 1 if len(moves) % 2 == 0 else 2
+
+
+def perft(board, depth, piece, win_condition, counts=None, results=True):
+    """
+    Compte les positions atteignables en exactement `depth` coups depuis `board`.
+
+    Une partie gagnée ou nulle n'est pas prolongée. Au dernier demi-coup, si `results` est False,
+    les coups sont comptés en bloc (nombre de colonnes jouables) sans être joués ; sinon chacun est
+    joué pour compter les victoires et les nuls.
+
+    Args:
+        board (ndarray): Plateau (modifié pendant le calcul puis restauré).
+        depth (int): Nombre de demi-coups.
+        piece (int): Pièce du joueur au trait.
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        counts (PerftCounts): Compteurs à compléter (un nouvel objet si None).
+        results (bool): Compter aussi les victoires et les nuls du dernier demi-coup.
+
+    Returns:
+        PerftCounts: Compteurs.
+    """
+    if counts is None:
+        counts = PerftCounts()
+    valid_locations = [col for col in range(board.shape[1]) if is_valid_location(board, col)]
+
+    if depth == 1 and not results:
+        counts.nodes += len(valid_locations)  # Comptage en bloc
+        return counts
+
+    for col in valid_locations:
+        row = get_next_open_row(board, col)
+        drop_piece(board, row, col, piece)
+        if depth == 1:
+            counts.nodes += 1
+            if winning_move(board, piece, win_condition):
+                counts.wins += 1
+            elif row == 0 and all(board[0] != 0):
+                counts.draws += 1
+        elif not winning_move(board, piece, win_condition) and not (row == 0 and all(board[0] != 0)):
+            perft(board, depth - 1, 3 - piece, win_condition, counts, results)
+        drop_piece(board, row, col, 0)
+    return counts
+
+
+def run_perft(rows, cols, win_condition, moves, max_depth, results=True, verbose=True):
+    """
+    Perft de la profondeur 1 à max_depth.
+
+    Returns:
+        list: Pour chaque profondeur, {'depth', 'nodes', 'wins', 'draws', 'elapsed'}.
+    """
+    board = board_from_moves(rows, cols, moves)
+    piece = next_piece(moves)
+    if winning_move(board, 1, win_condition) or winning_move(board, 2, win_condition):
+        raise ValueError("La position de départ est déjà gagnée")
+
+    table = []
+    for depth in range(1, max_depth + 1):
+        start = time.perf_counter()
+        counts = perft(board, depth, piece, win_condition, results=results)
+        elapsed = time.perf_counter() - start
+        table.append({'depth': depth, **counts.to_dict(), 'elapsed': elapsed})
+        if verbose:
+            speed = counts.nodes / elapsed / 1000 if elapsed > 0 else 0.0
+            print(f"  profondeur {depth:>2} : {counts.nodes:>10} positions  {counts.wins:>8} victoires  "
+                  f"{counts.draws:>6} nuls  {elapsed * 1000:>9.1f} ms  ({speed:.1f} k positions/s)")
+    return table
+
+
+def generate_reference():
+    reference = []
+    for position_id, rows, cols, win_condition, moves, max_depth in REFERENCE_POSITIONS:
+        print(position_id)
+        table = run_perft(rows, cols, win_condition, moves, max_depth)
+        reference.append({
+            'id': position_id, 'rows': rows, 'cols': cols, 'win_condition': win_condition, 'moves': moves,
+            'counts': [{key: entry[key] for key in ('depth', 'nodes', 'wins', 'draws')} for entry in table]
+        })
+    return {'version': 1, 'positions': reference}
+
+
+# Recalcule chaque position de référence et retourne la liste des écarts
+def check_reference(reference, results=True, max_depth=None):
+    mismatches = []
+    total_nodes, total_time = 0, 0.0
+    for position in reference['positions']:
+        expected = position['counts']
+        depth = expected[-1]['depth'] if max_depth is None else min(max_depth, expected[-1]['depth'])
+        print(position['id'])
+        table = run_perft(position['rows'], position['cols'], position['win_condition'], position['moves'],
+                          depth, results)
+        for entry, wanted in zip(table, expected):
+            keys = ('nodes', 'wins', 'draws') if results else ('nodes',)
+            for key in keys:
+                if entry[key] != wanted[key]:
+                    mismatches.append(f"{position['id']} profondeur {entry['depth']} : {key} = {entry[key]} "
+                                      f"(attendu {wanted[key]})")
+            total_nodes += entry['nodes']
+            total_time += entry['elapsed']
+    print(f"\n{total_nodes} positions en {total_time:.2f} s ({total_nodes / total_time / 1000:.1f} k positions/s)")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Perft : comptage de l'arbre de jeu")
+    parser.add_argument('--reference', default=REFERENCE_FILE, help="Fichier des comptes de référence")
+    parser.add_argument('--generate', action='store_true', help="Régénérer les comptes de référence")
+    parser.add_argument('--rows', type=int, help="Position libre : nombre de lignes")
+    parser.add_argument('--cols', type=int, help="Position libre : nombre de colonnes")
+    parser.add_argument('--win', type=int, default=4, help="Position libre : condition de victoire")
+    parser.add_argument('--moves', type=int, nargs='*', default=[], help="Position libre : colonnes déjà jouées")
+    parser.add_argument('--depth', type=int, default=None, help="Profondeur maximale")
+    parser.add_argument('--bulk', action='store_true',
+                        help="Comptage en bloc au dernier demi-coup (positions seulement, sans victoires ni nuls)")
+    args = parser.parse_args()
+
+    if args.generate:
+        reference = generate_reference()
+        with open(args.reference, 'w') as f:
+            json.dump(reference, f, indent=1)
+        sys.exit(0)
+
+    if args.rows is not None or args.cols is not None:
+        if args.rows is None or args.cols is None:
+            parser.error("--rows et --cols vont ensemble")
+        run_perft(args.rows, args.cols, args.win, args.moves, args.depth or 4, results=not args.bulk)
+        sys.exit(0)
+
+    with open(args.reference) as f:
+        reference = json.load(f)
+    mismatches = check_reference(reference, results=not args.bulk, max_depth=args.depth)
+    if mismatches:
+        print("\nÉcarts avec les comptes de référence :")
+        for mismatch in mismatches:
+            print(f"  - {mismatch}")
+        sys.exit(1)
+    print("Tous les comptes correspondent aux références")
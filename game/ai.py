@@ -1,4 +1,5 @@
 import random
+import time
 import numpy as np
 from game.game_logic import (
     is_valid_location,
@@ -6,7 +7,79 @@ from game.game_logic import (
     drop_piece,
     winning_move
 )
-from settings.constants import PLAYER_PIECE, AI_PIECE
+from game import profiling, search_stats
+from game.search_stats import SearchStats
+from game.vectorized import score_positions, score_positions_both, winning_mask, play_columns, child_boards
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+# Poids de la fonction d'évaluation (modifiables par configuration, ex : tournois)
+DEFAULT_WEIGHTS = {
+    "four": 100,       # 4 pions alignés
+    "three": 10,       # 3 pions + 1 case vide
+    "two": 5,          # 2 pions + 2 cases vides
+    "opp_three": -80,  # Menace adverse : 3 pions adverses + 1 case vide
+    "center": 3        # Bonus par pion dans la colonne centrale
+}
+
+# Profondeur de recherche associée à chaque niveau de difficulté
+DIFFICULTY_DEPTHS = {"easy": 1, "medium": 3, "hard": 4}
+DEFAULT_DEPTH = 2  # Profondeur utilisée pour une difficulté inconnue
+
+# Les enfants d'un nœud sont générés et évalués ensemble (game/vectorized.py) pour l'ordre des coups et les
+# nœuds de profondeur 1 ; False rétablit l'évaluation enfant par enfant (mêmes résultats, pour comparaison)
+VECTORIZED_CHILDREN = True
+
+class SearchTimeout(Exception):
+    """Levée lorsqu'une limite de la recherche (temps, nœuds, arrêt demandé) est atteinte."""
+
+class SearchLimits:
+    """
+    Limites d'une recherche, vérifiées à chaque nœud de minimax.
+
+    Args:
+        deadline (float): Instant (time.perf_counter()) au-delà duquel la recherche est interrompue.
+        max_nodes (int): Nombre maximal de nœuds visités (cumulé sur toutes les recherches utilisant ces limites).
+        stop_event (threading.Event): Interrompt la recherche dès qu'il est positionné (depuis un autre thread).
+    """
+    def __init__(self, deadline=None, max_nodes=None, stop_event=None):
+        self.deadline = deadline
+        self.max_nodes = max_nodes
+        self.stop_event = stop_event
+        self.nodes = 0  # Nœuds vérifiés jusqu'ici
+
+    def check(self):
+        """Lève SearchTimeout si une limite est dépassée."""
+        self.nodes += 1
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SearchTimeout()
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchTimeout()
+
+class SearchUpdate:
+    """
+    Résultat d'une itération terminée d'anytime_search.
+
+    Attributes:
+        depth (int): Profondeur terminée.
+        col (int): Meilleur coup à cette profondeur.
+        score (float): Score associé (du point de vue de AI_PIECE).
+        pv (list): Variation principale (suite de coups attendue, commençant par col).
+        nodes (int): Nœuds visités depuis le début de la recherche.
+        elapsed (float): Secondes écoulées depuis le début de la recherche.
+    """
+    def __init__(self, depth, col, score, pv, nodes, elapsed):
+        self.depth = depth
+        self.col = col
+        self.score = score
+        self.pv = pv
+        self.nodes = nodes
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (f"SearchUpdate(depth={self.depth}, col={self.col}, score={self.score}, pv={self.pv}, "
+                f"nodes={self.nodes}, elapsed={self.elapsed:.3f})")
 
 def get_valid_locations(board):
     """
@@ -20,76 +93,82 @@ def get_valid_locations(board):
     """
     return [col for col in range(board.shape[1]) if is_valid_location(board, col)]
 
-def evaluate_window(window, piece):
+def evaluate_window(window, piece, weights=None):
     """
     Évalue un ensemble de 4 cases (une "fenêtre") pour en déterminer la valeur stratégique.
 
     Args:
         window (list): Liste de 4 cases (ligne, colonne ou diagonale).
         piece (int): Pièce du joueur évalué (AI_PIECE ou PLAYER_PIECE).
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
 
     Returns:
         int: Score attribué à la fenêtre.
     """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
     score = 0
     opp_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
 
     if window.count(piece) == 4:
-        score += 100
+        score += weights["four"]
     elif window.count(piece) == 3 and window.count(0) == 1:
-        score += 10
+        score += weights["three"]
     elif window.count(piece) == 2 and window.count(0) == 2:
-        score += 5
+        score += weights["two"]
 
     if window.count(opp_piece) == 3 and window.count(0) == 1:
-        score -= 80  # Défense forte contre menace adverse
+        score += weights["opp_three"]  # Défense forte contre menace adverse
 
     return score
 
-def score_position(board, piece):
+def score_position(board, piece, weights=None):
     """
     Calcule un score global du plateau pour un joueur donné.
 
     Args:
         board (ndarray): Plateau de jeu.
         piece (int): Pièce du joueur.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
 
     Returns:
         int: Score global du plateau.
     """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
     score = 0
     rows, cols = board.shape
 
     # Contrôle central : favorise le centre du plateau
     center_col = cols // 2
     center_array = [int(board[r][center_col]) for r in range(rows)]
-    score += center_array.count(piece) * 3
+    score += center_array.count(piece) * weights["center"]
 
     # Évaluations horizontales
     for r in range(rows):
         row_array = list(board[r])
         for c in range(cols - 3):
             window = row_array[c:c+4]
-            score += evaluate_window(window, piece)
+            score += evaluate_window(window, piece, weights)
 
     # Évaluations verticales
     for c in range(cols):
         col_array = [board[r][c] for r in range(rows)]
         for r in range(rows - 3):
             window = col_array[r:r+4]
-            score += evaluate_window(window, piece)
+            score += evaluate_window(window, piece, weights)
 
     # Évaluations diagonales ↘
     for r in range(rows - 3):
         for c in range(cols - 3):
             window = [board[r+i][c+i] for i in range(4)]
-            score += evaluate_window(window, piece)
+            score += evaluate_window(window, piece, weights)
 
     # Évaluations diagonales ↙
     for r in range(3, rows):
         for c in range(cols - 3):
             window = [board[r-i][c+i] for i in range(4)]
-            score += evaluate_window(window, piece)
+            score += evaluate_window(window, piece, weights)
 
     return score
 
@@ -101,7 +180,7 @@ def undo_move(board, row, col):
     """Annule un coup précédemment simulé."""
     board[row][col] = 0
 
-def score_simulated_move(board, col, piece):
+def score_simulated_move(board, col, piece, weights=None):
     """
     Simule un coup dans une colonne donnée et retourne le score associé.
 
@@ -109,17 +188,19 @@ def score_simulated_move(board, col, piece):
         board (ndarray): Plateau de jeu.
         col (int): Colonne à simuler.
         piece (int): Pièce du joueur.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
 
     Returns:
         int: Score du plateau après simulation.
     """
     row = get_next_open_row(board, col)
     simulate_move(board, row, col, piece)
-    score = score_position(board, piece)
+    score = score_position(board, piece, weights)
     undo_move(board, row, col)
     return score
 
-def minimax(board, depth, alpha, beta, maximizing_player, win_condition):
+def minimax(board, depth, alpha, beta, maximizing_player, win_condition, weights=None, limits=None, stats=None,
+            ply=0, rng=None, pv=None):
     """
     Algorithme Minimax avec élagage alpha-bêta.
 
@@ -130,67 +211,229 @@ def minimax(board, depth, alpha, beta, maximizing_player, win_condition):
         beta (float): Meilleur score pour le joueur minimisé.
         maximizing_player (bool): True si c’est à l’IA de jouer.
         win_condition (int): Nombre de pièces alignées pour gagner.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        limits (SearchLimits): Limites de la recherche (aucune si None).
+        stats (SearchStats): Compteurs à incrémenter (aucun comptage si None).
+        ply (int): Distance à la racine en demi-coups (renseignée par les appels récursifs).
+        rng (random.Random): Générateur qui départage les coups de même score (module random si None).
+        pv (list): Si fourni, remplacé par la variation principale (meilleure suite de coups) depuis ce nœud.
 
     Returns:
         tuple: (colonne choisie, score associé)
+
+    Raises:
+        SearchTimeout: Si une limite de `limits` est dépassée.
     """
-    valid_locations = get_valid_locations(board)
-    is_terminal = (
-        not valid_locations or 
-        winning_move(board, PLAYER_PIECE, win_condition) or 
-        winning_move(board, AI_PIECE, win_condition)
-    )
+    if limits is not None:
+        limits.check()
 
-    if depth == 0 or is_terminal:
-        if winning_move(board, AI_PIECE, win_condition):
+    valid_locations = get_valid_locations(board)
+    # Chaque victoire n'est testée qu'une fois par nœud (y compris sur les feuilles)
+    ai_wins = winning_move(board, AI_PIECE, win_condition)
+    player_wins = winning_move(board, PLAYER_PIECE, win_condition)
+    if stats is not None:
+        stats.nodes += 1
+        stats.win_checks += 2
+        if ply > stats.max_depth:
+            stats.max_depth = ply
+
+    if depth == 0 or not valid_locations or ai_wins or player_wins:
+        if ai_wins:
             return (None, float("inf"))
-        elif winning_move(board, PLAYER_PIECE, win_condition):
+        elif player_wins:
             return (None, float("-inf"))
         elif not valid_locations:
             return (None, 0)
         else:
-            return (None, score_position(board, AI_PIECE))
+            if stats is not None:
+                stats.leaf_evaluations += 1
+            return (None, score_position(board, AI_PIECE, weights))
+
+    if stats is not None:
+        stats.ordering_evaluations += len(valid_locations)
 
     if maximizing_player:
         value = float("-inf")
-        best_col = random.choice(valid_locations)
+        best_col = (random if rng is None else rng).choice(valid_locations)
 
         # Exploration plus intelligente : les coups prometteurs en premier
-        valid_locations.sort(key=lambda col: score_simulated_move(board, col, AI_PIECE), reverse=True)
-
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            simulate_move(board, row, col, AI_PIECE)
-            _, new_score = minimax(board, depth - 1, alpha, beta, False, win_condition)
-            undo_move(board, row, col)
+        if VECTORIZED_CHILDREN:
+            leaves = _order_children(board, valid_locations, AI_PIECE, depth, win_condition, weights)
+        else:
+            valid_locations.sort(key=lambda col: score_simulated_move(board, col, AI_PIECE, weights), reverse=True)
+            leaves = None
+
+        for index, col in enumerate(valid_locations):
+            child_pv = None if pv is None else []
+            if leaves is not None:
+                new_score = _visit_leaf(leaves[col], limits, stats, ply + 1)
+            else:
+                row = get_next_open_row(board, col)
+                simulate_move(board, row, col, AI_PIECE)
+                _, new_score = minimax(board, depth - 1, alpha, beta, False, win_condition, weights, limits, stats,
+                                       ply + 1, rng, child_pv)
+                undo_move(board, row, col)
             if new_score > value:
                 value = new_score
                 best_col = col
+                if pv is not None:
+                    pv[:] = [col] + child_pv
             alpha = max(alpha, value)
             if alpha >= beta:
+                if stats is not None:
+                    stats.beta_cutoffs += 1
+                    if index == 0:
+                        stats.first_move_cutoffs += 1
                 break  # Élagage beta
         return best_col, value
 
     else:
         value = float("inf")
-        best_col = random.choice(valid_locations)
-
-        valid_locations.sort(key=lambda col: score_simulated_move(board, col, PLAYER_PIECE))
+        best_col = (random if rng is None else rng).choice(valid_locations)
 
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            simulate_move(board, row, col, PLAYER_PIECE)
-            _, new_score = minimax(board, depth - 1, alpha, beta, True, win_condition)
-            undo_move(board, row, col)
+        if VECTORIZED_CHILDREN:
+            leaves = _order_children(board, valid_locations, PLAYER_PIECE, depth, win_condition, weights)
+        else:
+            valid_locations.sort(key=lambda col: score_simulated_move(board, col, PLAYER_PIECE, weights))
+            leaves = None
+
+        for index, col in enumerate(valid_locations):
+            child_pv = None if pv is None else []
+            if leaves is not None:
+                new_score = _visit_leaf(leaves[col], limits, stats, ply + 1)
+            else:
+                row = get_next_open_row(board, col)
+                simulate_move(board, row, col, PLAYER_PIECE)
+                _, new_score = minimax(board, depth - 1, alpha, beta, True, win_condition, weights, limits, stats,
+                                       ply + 1, rng, child_pv)
+                undo_move(board, row, col)
             if new_score < value:
                 value = new_score
                 best_col = col
+                if pv is not None:
+                    pv[:] = [col] + child_pv
             beta = min(beta, value)
             if alpha >= beta:
+                if stats is not None:
+                    stats.beta_cutoffs += 1
+                    if index == 0:
+                        stats.first_move_cutoffs += 1
                 break  # Élagage alpha
         return best_col, value
 
-def get_ai_move(board, difficulty, win_condition=4):
+def _order_children(board, valid_locations, piece, depth, win_condition, weights):
+    """
+    Trie valid_locations dans l'ordre d'exploration de minimax en évaluant tous les enfants d'un seul coup.
+
+    À la profondeur 1, les enfants sont des feuilles : leur résultat (victoire, plateau plein ou évaluation
+    pour AI_PIECE) est calculé dans le même passage.
+
+    Returns:
+        dict or None: Colonne -> (score, évaluée) pour les feuilles de profondeur 1, None au-delà.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    children = child_boards(board, valid_locations, piece)
+    if depth == 1 and piece == PLAYER_PIECE:
+        keys, ai_scores = score_positions_both(children, weights)
+    else:
+        keys = ai_scores = score_positions(children, piece, weights)
+
+    # Tri stable comme score_simulated_move : à score égal, l'ordre des colonnes est conservé
+    order = dict(zip(valid_locations, keys.tolist()))
+    valid_locations.sort(key=order.__getitem__, reverse=piece == AI_PIECE)
+    if depth != 1:
+        return None
+
+    # Le parent n'étant pas terminé, seul le joueur qui vient de jouer peut avoir gagné
+    wins = winning_mask(children, piece, win_condition)
+    full = np.all(children[:, 0, :] != 0, axis=1)
+    win_score = float("inf") if piece == AI_PIECE else float("-inf")
+    leaves = {}
+    for col, won, filled, score in zip(order, wins.tolist(), full.tolist(), ai_scores.tolist()):
+        if won:
+            leaves[col] = (win_score, False)
+        elif filled:
+            leaves[col] = (0, False)
+        else:
+            leaves[col] = (int(score) if score.is_integer() else score, True)  # Même type que score_position
+    return leaves
+
+def _visit_leaf(leaf, limits, stats, ply):
+    """Visite d'une feuille déjà évaluée par _order_children : mêmes limites et compteurs qu'un appel à minimax."""
+    if limits is not None:
+        limits.check()
+    score, evaluated = leaf
+    if stats is not None:
+        stats.nodes += 1
+        stats.win_checks += 2
+        if ply > stats.max_depth:
+            stats.max_depth = ply
+        if evaluated:
+            stats.leaf_evaluations += 1
+    return score
+
+def anytime_search(board, max_depth, win_condition, weights=None, limits=None, stats=None, rng=None,
+                   search=None):
+    """
+    Approfondissement itératif sous forme de générateur : un SearchUpdate est produit à chaque profondeur
+    terminée, du meilleur coup connu le plus tôt possible au plus précis.
+
+    Le consommateur peut s'arrêter entre deux itérations (break, close) en gardant le dernier résultat ;
+    une itération en cours s'interrompt par les limites (délai, nœuds ou stop_event positionné depuis un
+    autre thread) et n'est alors pas produite. Le générateur s'arrête aussi à max_depth ou dès qu'une issue
+    forcée est trouvée. `board` est modifié temporairement pendant chaque itération (puis rétabli, y compris
+    après une interruption) et ne doit pas être changé par le consommateur tant que le générateur est utilisé.
+
+    Args:
+        board (ndarray): Plateau de jeu (AI_PIECE au trait).
+        max_depth (int): Profondeur maximale de recherche.
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        limits (SearchLimits): Limites de la recherche (aucune si None).
+        stats (SearchStats): Compteurs à remplir (comptés en interne si None, pour SearchUpdate.nodes).
+        rng (random.Random): Générateur qui départage les coups de même score (module random si None).
+        search (callable): Fonction de recherche de même signature que minimax (minimax si None).
+
+    Yields:
+        SearchUpdate: Résultat de chaque profondeur terminée.
+    """
+    if search is None:
+        search = minimax
+    counted = stats if stats is not None else SearchStats()
+    start_nodes = counted.nodes
+    start = time.perf_counter()
+    original = board.copy()
+    for depth in range(1, max_depth + 1):
+        pv = []
+        try:
+            col, score = search(board, depth, float("-inf"), float("inf"), True, win_condition, weights, limits,
+                                counted, rng=rng, pv=pv)
+        except SearchTimeout:
+            # Les coups simulés par l'itération interrompue n'ont pas été annulés
+            board[:] = original
+            return
+        counted.depth = max(counted.depth, depth)
+        yield SearchUpdate(depth, col, score, pv or [col], counted.nodes - start_nodes, time.perf_counter() - start)
+        if score in (float("inf"), float("-inf")):
+            return  # Issue forcée trouvée : inutile d'aller plus profond
+
+def iterative_deepening(board, max_depth, win_condition, weights=None, limits=None, stats=None, rng=None,
+                        search=None):
+    """
+    Lance minimax à profondeur croissante jusqu'à max_depth ou jusqu'à épuisement des limites
+    (dernier résultat d'anytime_search).
+
+    Returns:
+        tuple: (colonne, score) de la dernière itération terminée, (None, None) si aucune ne l'est.
+    """
+    best_col, best_score = None, None
+    for update in anytime_search(board, max_depth, win_condition, weights, limits, stats, rng, search):
+        best_col, best_score = update.col, update.score
+    return best_col, best_score
+
+def get_ai_move(board, difficulty, win_condition=4, depth=None, time_budget=None, weights=None, cache=None,
+                stats=None, return_stats=False, rng=None, search=None):
     """
     Calcule le meilleur coup à jouer selon le niveau de difficulté.
 
@@ -198,10 +441,46 @@ def get_ai_move(board, difficulty, win_condition=4):
         board (ndarray): Plateau de jeu.
         difficulty (str): "easy", "medium", ou "hard".
         win_condition (int): Nombre de pièces alignées pour gagner.
+        depth (int): Profondeur de recherche imposée (remplace celle de la difficulté).
+        time_budget (float): Temps maximal de réflexion en secondes. La recherche procède alors
+            par approfondissement itératif et retourne le résultat de la dernière profondeur terminée.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        cache (PositionCache): Cache persistant consulté avant la recherche et complété après
+            (uniquement pour les recherches à profondeur fixe, sans budget de temps).
+        stats (SearchStats): Compteurs de la recherche à remplir (nœuds, feuilles, élagages, cache, durée...).
+            Les compteurs sont ajoutés à ceux déjà présents : un même objet peut cumuler plusieurs recherches.
+        return_stats (bool): Si True, retourne aussi les compteurs de la recherche (`stats` ou un nouveau
+            SearchStats). Si search_stats.ENABLED vaut False, get_ai_move ne fait aucun comptage.
+        rng (random.Random or int): Générateur (ou graine) utilisé pour départager les coups de même score
+            et pour les coups de secours. Avec un générateur ou une graine, le coup ne dépend que de la
+            position et de ce générateur ; avec None, le module random global est utilisé.
+        search (callable): Fonction de recherche de même signature que minimax (minimax si None),
+            par exemple Engine.search qui conserve ses tables d'un coup à l'autre.
 
     Returns:
         int or None: Colonne choisie pour le coup de l'IA, ou None si aucune possible.
+        Avec return_stats : tuple (colonne, SearchStats).
     """
+    if search is None:
+        search = minimax
+    if return_stats and stats is None:
+        stats = SearchStats()
+    if isinstance(rng, int):
+        rng = random.Random(rng)
+    counted = stats if search_stats.ENABLED else None
+
+    start = time.perf_counter()
+    with profiling.phase('search'):
+        col = _choose_move(board, difficulty, win_condition, depth, time_budget, weights, cache, counted, rng,
+                           search)
+    if counted is not None:
+        counted.elapsed += time.perf_counter() - start
+        counted.searches += 1
+    return (col, stats) if return_stats else col
+
+def _choose_move(board, difficulty, win_condition, depth, time_budget, weights, cache, stats, rng, search):
+    """Corps de get_ai_move (voir sa documentation)."""
+    random_source = random if rng is None else rng
     valid_locations = get_valid_locations(board)
     if not valid_locations:
         return None
@@ -210,17 +489,203 @@ def get_ai_move(board, difficulty, win_condition=4):
     for col in valid_locations:
         row = get_next_open_row(board, col)
         simulate_move(board, row, col, AI_PIECE)
+        if stats is not None:
+            stats.win_checks += 1
         if winning_move(board, AI_PIECE, win_condition):
             undo_move(board, row, col)
+            if stats is not None:
+                stats.depth = max(stats.depth, 1)
             return col
         undo_move(board, row, col)
 
     # Détermine la profondeur de recherche selon la difficulté
-    depth = {"easy":1, "medium":3 , "hard": 4}.get(difficulty, 2)
+    if depth is None:
+        depth = DIFFICULTY_DEPTHS.get(difficulty, DEFAULT_DEPTH)
+
+    if cache is not None and time_budget is None:
+        cached = cache.get(board, win_condition, depth, weights)
+        if stats is not None:
+            if cached is None:
+                stats.cache_misses += 1
+            else:
+                stats.cache_hits += 1
+        if cached is not None and cached[0] in valid_locations:
+            if stats is not None:
+                stats.depth = max(stats.depth, depth)
+            return cached[0]
 
     try:
-        best_col, _ = minimax(board, depth, float("-inf"), float("inf"), True, win_condition)
-        return best_col if best_col in valid_locations else random.choice(valid_locations)
+        if time_budget is not None:
+            limits = SearchLimits(deadline=time.perf_counter() + time_budget)
+            best_col, score = iterative_deepening(board, depth, win_condition, weights, limits, stats, rng, search)
+        else:
+            best_col, score = search(board, depth, float("-inf"), float("inf"), True, win_condition, weights,
+                                     stats=stats, rng=rng)
+            if stats is not None:
+                stats.depth = max(stats.depth, depth)
     except Exception as e:
         print(f"Erreur dans l'IA : {e}")
-        return random.choice(valid_locations)
\ No newline at end of file
+        return random_source.choice(valid_locations)
+
+    if best_col not in valid_locations:
+        return random_source.choice(valid_locations)
+    if cache is not None and time_budget is None:
+        cache.put(board, win_condition, depth, best_col, score, weights)
+    return best_col
+
+LEAF_BUDGET = 200000  # Feuilles générées au plus par lot de get_ai_moves (borne la mémoire)
+
+def get_ai_moves(boards, difficulty="hard", win_condition=4, depth=None, weights=None, rng=None):
+    """
+    Calcule le coup de l'IA (AI_PIECE) pour une pile de positions, en une recherche vectorisée.
+
+    L'arbre minimax complet (sans élagage) est développé niveau par niveau : toutes les positions d'un niveau,
+    pour toutes les recherches du lot, sont générées, testées et, aux feuilles, évaluées par des appels NumPy
+    communs. Le score est celui de minimax ; la colonne est celle que get_ai_move choisirait (coup gagnant
+    immédiat, sinon premier meilleur coup dans l'ordre d'exploration), sauf quand tous les coups perdent
+    (colonne tirée au hasard). La mémoire croît comme colonnes ** profondeur par position.
+
+    Args:
+        boards (ndarray): Positions (N x lignes x colonnes), AI_PIECE au trait.
+        difficulty (str): "easy", "medium", ou "hard".
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        depth (int): Profondeur de recherche imposée (remplace celle de la difficulté).
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        rng (random.Random or int): Générateur (ou graine) des coups tirés au hasard.
+
+    Returns:
+        tuple: (colonnes, scores) en ndarray de taille N. La colonne vaut -1 pour une position déjà
+        terminée ou sans coup jouable.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 3:
+        raise ValueError("get_ai_moves attend une pile de plateaux (N x lignes x colonnes)")
+    if depth is None:
+        depth = DIFFICULTY_DEPTHS.get(difficulty, DEFAULT_DEPTH)
+    if depth < 1:
+        raise ValueError("La profondeur doit être au moins 1")
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    if isinstance(rng, int):
+        rng = random.Random(rng)
+    random_source = random if rng is None else rng
+
+    count, _, cols = boards.shape
+    moves = np.full(count, -1, dtype=np.intp)
+    scores = np.zeros(count)
+    chunk = max(1, LEAF_BUDGET // cols ** depth)
+    with profiling.phase('search'):
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            moves[start:stop], scores[start:stop] = _search_stack(boards[start:stop].astype(np.int8), depth,
+                                                                  win_condition, weights, random_source)
+    return moves, scores
+
+def score_moves(boards, win_condition=4, depth=4, weights=None):
+    """
+    Score minimax de chaque coup jouable d'une pile de positions, en une recherche vectorisée
+    (même arbre complet que get_ai_moves).
+
+    Args:
+        boards (ndarray): Positions (N x lignes x colonnes), AI_PIECE au trait.
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        depth (int): Profondeur de recherche depuis chaque position (au moins 1).
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+
+    Returns:
+        ndarray: Scores (N x colonnes) : celui que minimax donne à la position après chaque coup, cherchée à
+        la profondeur depth - 1 ; NaN pour une colonne pleine ou une position déjà terminée.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 3:
+        raise ValueError("score_moves attend une pile de plateaux (N x lignes x colonnes)")
+    if depth < 1:
+        raise ValueError("La profondeur doit être au moins 1")
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+
+    count, _, cols = boards.shape
+    scores = np.full((count, cols), np.nan)
+    chunk = max(1, LEAF_BUDGET // cols ** depth)
+    with profiling.phase('search'):
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            levels = _expand_stack(boards[start:stop].astype(np.int8), depth, win_condition, weights)
+            if len(levels) > 1:
+                values, _, roots_of, cols_played, _ = levels[1]
+                scores[start + roots_of, cols_played] = values
+    return scores
+
+def _expand_stack(roots, depth, win_condition, weights):
+    """
+    Arbre complet d'un lot de positions, développé niveau par niveau, valeurs minimax remontées.
+
+    Returns:
+        list: Par niveau : (valeurs, nœuds terminaux, parent, colonne jouée, victoire de l'IA).
+    """
+    levels = []
+    frontier = roots
+    parent = np.arange(len(roots))
+    played = np.full(len(roots), -1, dtype=np.intp)
+
+    for level in range(depth + 1):
+        ai_wins = winning_mask(frontier, AI_PIECE, win_condition)
+        player_wins = winning_mask(frontier, PLAYER_PIECE, win_condition)
+        valid = frontier[:, 0, :] == 0
+        has_moves = valid.any(axis=1)
+
+        # Mêmes cas terminaux, dans le même ordre, que minimax
+        values = np.zeros(len(frontier))
+        values[player_wins] = float("-inf")
+        values[ai_wins] = float("inf")
+        terminal = ai_wins | player_wins | ~has_moves
+        if level == depth:
+            leaves = ~terminal
+            values[leaves] = score_positions(frontier[leaves], AI_PIECE, weights)
+            terminal[:] = True
+        levels.append((values, terminal, parent, played, ai_wins))
+
+        parent, played = np.nonzero(valid & ~terminal[:, None])
+        if len(parent) == 0:
+            break
+        frontier = play_columns(frontier[parent], played, AI_PIECE if level % 2 == 0 else PLAYER_PIECE)
+
+    # Remontée des valeurs : niveaux pairs maximisés (IA au trait), impairs minimisés
+    for level in range(len(levels) - 1, 0, -1):
+        child_values, _, child_parent, _, _ = levels[level]
+        values, terminal, _, _, _ = levels[level - 1]
+        if level % 2 == 1:
+            backed = np.full(len(values), float("-inf"))
+            np.maximum.at(backed, child_parent, child_values)
+        else:
+            backed = np.full(len(values), float("inf"))
+            np.minimum.at(backed, child_parent, child_values)
+        values[~terminal] = backed[~terminal]
+    return levels
+
+def _search_stack(roots, depth, win_condition, weights, random_source):
+    """Corps de get_ai_moves pour un lot de positions (voir sa documentation)."""
+    cols = roots.shape[2]
+    levels = _expand_stack(roots, depth, win_condition, weights)
+    root_values = levels[0][0]
+    moves = np.full(len(roots), -1, dtype=np.intp)
+    if len(levels) == 1:
+        return moves, root_values
+
+    values, _, roots_of, cols_played, ai_wins = levels[1]
+    # Ordre d'exploration de minimax : score après le coup décroissant, puis colonne croissante
+    ordering = score_positions(play_columns(roots[roots_of], cols_played, AI_PIECE), AI_PIECE, weights)
+    order = np.lexsort((cols_played, -ordering, -values, roots_of))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = roots_of[order][1:] != roots_of[order][:-1]
+    moves[roots_of[order][first]] = cols_played[order][first]
+
+    # Coup gagnant immédiat : get_ai_move retient le premier dans l'ordre des colonnes
+    winning = np.full(len(roots), cols, dtype=np.intp)
+    np.minimum.at(winning, roots_of[ai_wins], cols_played[ai_wins])
+    moves = np.where(winning < cols, winning, moves)
+
+    # Tous les coups perdent : minimax garde sa colonne tirée au hasard
+    for root in np.flatnonzero((moves >= 0) & (root_values == float("-inf"))):
+        moves[root] = random_source.choice([int(col) for col in np.flatnonzero(roots[root, 0] == 0)])
+    return moves, root_values
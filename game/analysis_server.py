@@ -0,0 +1,458 @@
+"""
+Serveur d'analyse local partagé par plusieurs outils (interface, tableaux de bord de tournoi, scripts).
+
+    python -m game.analysis_server [--host 127.0.0.1] [--port 8765 | --unix CHEMIN] [--workers N]
+
+Chaque ligne reçue est une requête JSON, chaque ligne envoyée une réponse JSON portant le même "id" :
+
+    {"id": 1, "rows": 6, "cols": 7, "win_condition": 4, "moves": [3, 3, 4], "depth": 4, "deadline_ms": 500}
+    {"id": 1, "status": "ok", "col": 2, "depth": 4, "nodes": 1318, "search_ms": 610.2, "latency_ms": 615.8,
+     "shared": false}
+
+Champs d'une analyse : rows, cols (au plus 10), win_condition (6, 7, 4 par défaut), moves (colonnes jouées
+depuis le plateau vide, le joueur 1 commence ; liste ou chaîne "334"), difficulty ("hard" par défaut), depth,
+time_budget (secondes), weights (objet donnant chacun des poids de DEFAULT_WEIGHTS), seed (0 par défaut) et
+deadline_ms (délai de réponse). La réponse donne le coup du joueur au trait tel que get_ai_move le jouerait.
+
+Autres opérations : {"op": "cancel", "target": ID} annule une requête en attente de la même connexion,
+{"op": "metrics"} retourne la file d'attente, les compteurs et les latences. Statuts possibles : "ok",
+"timeout" (délai dépassé), "cancelled" et "error".
+
+Les positions identiques en cours de calcul ne sont cherchées qu'une fois ("shared" : true pour les
+requêtes servies par le calcul d'une autre). Les recherches attendent dans une file puis partent par lots
+vers un groupe de processus ; une recherche dont plus personne n'attend la réponse n'est pas lancée, et une
+recherche lancée avec un délai s'arrête à ce délai (approfondissement itératif).
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import collections
+import concurrent.futures
+from game.ai import get_ai_move, DIFFICULTY_DEPTHS, DEFAULT_WEIGHTS
+from game.game_logic import board_from_moves, winning_move
+from game.position_cache import PositionCache
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_BATCH_SIZE = 4  # Recherches envoyées ensemble à un processus (moins d'allers-retours entre processus)
+DEADLINE_GRACE = 0.1  # Marge (s) laissée après le délai pour recevoir le résultat d'une recherche interrompue
+LATENCY_WINDOW = 1000  # Nombre de requêtes récentes prises en compte dans les latences
+# Dimension maximale d'un plateau, comme dans le scheduler pour minimax : une recherche sur un plateau démesuré
+# occuperait un processus de calcul sans pouvoir être interrompue
+MAX_SIZE = 10
+
+_worker_cache = None  # Cache des positions propre à chaque processus de calcul
+
+
+def _init_worker(cache_path):
+    global _worker_cache
+    if cache_path:
+        _worker_cache = PositionCache(cache_path)
+
+
+def analyse_payload(payload):
+    """
+    Cherche le coup d'une position (exécuté dans un processus de calcul).
+
+    Args:
+        payload (dict): Plateau vu du joueur au trait (AI_PIECE) et paramètres de la recherche.
+
+    Returns:
+        dict: Réponse de l'analyse ({"status": "ok", "col", "depth", "nodes", "search_ms"} ou "timeout").
+    """
+    time_budget = payload['time_budget']
+    if payload['deadline'] is not None:
+        remaining = payload['deadline'] - time.time()
+        if remaining <= 0:
+            return {'status': 'timeout'}
+        time_budget = remaining if time_budget is None else min(time_budget, remaining)
+
+    col, stats = get_ai_move(payload['board'], payload['difficulty'], payload['win_condition'],
+                             depth=payload['depth'], time_budget=time_budget, weights=payload['weights'],
+                             cache=_worker_cache, return_stats=True, rng=payload['seed'])
+    return {'status': 'ok', 'col': col, 'depth': stats.depth, 'nodes': stats.nodes,
+            'search_ms': round(stats.elapsed * 1000, 3)}
+
+
+def analyse_batch(payloads):
+    return [analyse_payload(payload) for payload in payloads]
+
+
+def percentiles(values):
+    """Moyenne, p50, p95, p99 et maximum (percentiles par rang) d'une série de mesures."""
+    if not values:
+        return None
+    values = sorted(values)
+    summary = {'mean': round(sum(values) / len(values), 3)}
+    for p in (50, 95, 99):
+        summary[f'p{p}'] = round(values[max(1, -(-p * len(values) // 100)) - 1], 3)
+    summary['max'] = round(values[-1], 3)
+    return summary
+
+
+class _Job:
+    """Recherche d'une position, partagée par toutes les requêtes identiques qui l'attendent."""
+
+    def __init__(self, key, payload, future):
+        self.key = key
+        self.payload = payload
+        self.deadline = payload['deadline']  # Délai de la requête qui a lancé la recherche (None : aucun)
+        self.future = future
+        self.waiters = 0
+
+    def covers(self, deadline):
+        """
+        Une requête de délai `deadline` peut-elle attendre cette recherche ? Seulement si la recherche se termine
+        à temps pour elle : une recherche sans délai ne sert que les requêtes sans délai, une recherche avec délai
+        celles dont le délai n'arrive pas avant le sien.
+        """
+        if self.deadline is None:
+            return deadline is None
+        return deadline is not None and self.deadline <= deadline
+
+
+class AnalysisServer:
+    """
+    Serveur asyncio : une connexion par client, une tâche par requête, des processus pour les recherches.
+
+    Args:
+        workers (int): Nombre de processus de calcul (nombre de cœurs si None).
+        batch_size (int): Nombre maximal de recherches envoyées ensemble à un processus.
+        cache_path (str): Cache persistant des positions partagé par les processus (aucun si None).
+    """
+
+    def __init__(self, workers=None, batch_size=DEFAULT_BATCH_SIZE, cache_path=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.cache_path = cache_path
+        self.jobs = {}  # Clé de la position -> recherche en cours ou en attente
+        self.queue = None
+        self.executor = None
+        self.server = None
+        self._dispatchers = []
+
+        self.counters = collections.Counter()
+        self.max_queue_depth = 0
+        self.running = 0
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.search_times = collections.deque(maxlen=LATENCY_WINDOW)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """Démarre les processus et écoute sur host:port, ou sur le socket Unix `path` s'il est donné."""
+        self.queue = asyncio.Queue()
+        self.executor = concurrent.futures.ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                               initargs=(self.cache_path,))
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_connection, path)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def metrics(self):
+        return {
+            'queue_depth': self.queue.qsize() if self.queue is not None else 0,
+            'max_queue_depth': self.max_queue_depth,
+            'running': self.running,
+            'in_flight': len(self.jobs),
+            'waiting_requests': sum(job.waiters for job in self.jobs.values()),
+            'workers': self.workers,
+            **{name: self.counters[name] for name in ('requests', 'ok', 'shared', 'timeout', 'cancelled', 'error',
+                                                      'searches', 'skipped_searches')},
+            'latency_ms': percentiles(self.latencies),
+            'search_ms': percentiles(self.search_times),
+        }
+
+    # Lit les requêtes d'un client ; les analyses sont traitées en parallèle et répondent dans le désordre
+    async def _handle_connection(self, reader, writer):
+        write_lock = asyncio.Lock()
+        tasks = {}
+
+        async def send(response):
+            async with write_lock:
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode())
+                await writer.drain()
+
+        try:
+            async for line in reader:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("objet JSON attendu")
+                except ValueError as e:
+                    await send({'id': None, 'status': 'error', 'error': f"requête illisible : {e}"})
+                    continue
+
+                op = request.get('op', 'analyse')
+                if op == 'analyse':
+                    # L'analyse est une tâche distincte de la réponse : annulée avant même d'avoir démarré,
+                    # elle reçoit quand même sa réponse "cancelled"
+                    request_id = request.get('id')
+                    analysis = asyncio.ensure_future(self._analyse(request))
+                    tasks[request_id] = analysis
+                    analysis.add_done_callback(lambda done, key=request_id: tasks.pop(key, None)
+                                               if tasks.get(key) is done else None)
+                    asyncio.create_task(self._answer(request, analysis, send))
+                elif op == 'cancel':
+                    task = tasks.get(request.get('target'))
+                    if task is not None:
+                        task.cancel()
+                    await send({'id': request.get('id'), 'status': 'ok', 'cancelled': task is not None})
+                elif op == 'metrics':
+                    await send({'id': request.get('id'), 'status': 'ok', 'metrics': self.metrics()})
+                else:
+                    await send({'id': request.get('id'), 'status': 'error', 'error': f"opération inconnue : {op}"})
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Client déconnecté ou serveur arrêté
+        finally:
+            # Client parti : ses requêtes n'attendent plus de réponse
+            for task in list(tasks.values()):
+                task.cancel()
+            writer.close()
+
+    async def _answer(self, request, analysis, send):
+        start = time.perf_counter()
+        self.counters['requests'] += 1
+        try:
+            response = await analysis
+        except asyncio.CancelledError:
+            response = {'status': 'cancelled'}
+        except Exception as e:  # Requête invalide (ValueError, OverflowError...) : toujours une réponse
+            response = {'status': 'error', 'error': str(e) or type(e).__name__}
+        self.counters[response['status']] += 1
+        latency = (time.perf_counter() - start) * 1000
+        if response['status'] == 'ok':
+            self.latencies.append(latency)
+        response = {'id': request.get('id'), **response, 'latency_ms': round(latency, 3)}
+        try:
+            await send(response)
+        except ConnectionError:
+            pass
+
+    async def _analyse(self, request):
+        key, payload = parse_request(request)
+        job = self.jobs.get(key)
+        shared = job is not None and job.covers(payload['deadline'])
+        if shared:
+            self.counters['shared'] += 1
+        else:
+            job = _Job(key, payload, asyncio.get_running_loop().create_future())
+            self.jobs[key] = job
+            self.queue.put_nowait(job)
+            self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+        job.waiters += 1
+        try:
+            timeout = None if payload['deadline'] is None else \
+                max(0.0, payload['deadline'] - time.time()) + DEADLINE_GRACE
+            result = await asyncio.wait_for(asyncio.shield(job.future), timeout)
+        except asyncio.TimeoutError:
+            return {'status': 'timeout'}
+        finally:
+            job.waiters -= 1
+        return {**result, 'shared': shared} if result['status'] == 'ok' else dict(result)
+
+    # Une tâche par processus : prend un lot dans la file, l'envoie au processus et distribue les résultats
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            now = time.time()
+            live = []
+            for job in batch:
+                if job.waiters == 0 or (job.deadline is not None and job.deadline <= now):
+                    # Personne n'attend plus cette réponse : la recherche n'est pas lancée
+                    self.counters['skipped_searches'] += 1
+                    self._finish(job, {'status': 'cancelled' if job.waiters == 0 else 'timeout'})
+                else:
+                    live.append(job)
+            if not live:
+                continue
+
+            self.running += len(live)
+            try:
+                results = await loop.run_in_executor(self.executor, analyse_batch, [job.payload for job in live])
+            except concurrent.futures.BrokenExecutor as e:
+                results = [{'status': 'error', 'error': f"processus de calcul arrêté : {e}"}] * len(live)
+            except Exception as e:  # Le répartiteur doit survivre à une recherche en échec
+                results = [{'status': 'error', 'error': f"échec de la recherche : {e!r}"}] * len(live)
+            finally:
+                self.running -= len(live)
+            self.counters['searches'] += len(live)
+            for job, result in zip(live, results):
+                if result['status'] == 'ok':
+                    self.search_times.append(result['search_ms'])
+                self._finish(job, result)
+
+    def _finish(self, job, result):
+        if self.jobs.get(job.key) is job:
+            del self.jobs[job.key]
+        if not job.future.done():
+            job.future.set_result(result)
+
+
+def parse_request(request):
+    """
+    Valide une requête d'analyse.
+
+    Returns:
+        tuple: (clé de déduplication, paramètres de la recherche envoyés au processus de calcul).
+
+    Raises:
+        ValueError: Si la configuration (au plus MAX_SIZE lignes et colonnes), les coups ou les paramètres sont
+            invalides. Les conversions de nombres peuvent aussi lever TypeError ou OverflowError.
+    """
+    rows = int(request.get('rows', 6))
+    cols = int(request.get('cols', 7))
+    win_condition = int(request.get('win_condition', 4))
+    if not (1 <= rows <= MAX_SIZE and 1 <= cols <= MAX_SIZE) or not 1 < win_condition <= max(rows, cols):
+        raise ValueError(f"configuration impossible : {rows}x{cols}, victoire {win_condition}")
+
+    moves = request.get('moves', [])
+    if isinstance(moves, str):
+        moves = list(moves)  # Notation accolée : un chiffre par coup
+    moves = [int(move) for move in moves]
+    # Le joueur au trait reçoit AI_PIECE : get_ai_move cherche toujours pour cette pièce
+    first_piece = PLAYER_PIECE if len(moves) % 2 else AI_PIECE
+    board = board_from_moves(rows, cols, moves, first_piece)
+    if winning_move(board, PLAYER_PIECE, win_condition) or winning_move(board, AI_PIECE, win_condition):
+        raise ValueError("la partie est déjà terminée dans cette position")
+
+    difficulty = request.get('difficulty', 'hard')
+    if difficulty not in DIFFICULTY_DEPTHS:
+        raise ValueError(f"difficulté inconnue : {difficulty}")
+    depth = request.get('depth')
+    depth = None if depth is None else int(depth)
+    time_budget = request.get('time_budget')
+    time_budget = None if time_budget is None else float(time_budget)
+    if (depth is not None and depth < 1) or (time_budget is not None and time_budget <= 0):
+        raise ValueError("depth et time_budget doivent être positifs")
+    weights = request.get('weights')
+    if weights is not None:
+        if not isinstance(weights, dict):
+            raise ValueError("weights doit être un objet {nom: poids}")
+        unknown = set(weights) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"poids inconnus : {sorted(unknown)}")
+        missing = set(DEFAULT_WEIGHTS) - set(weights)
+        if missing:
+            raise ValueError(f"poids manquants : {sorted(missing)}")
+        if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in weights.values()):
+            raise ValueError("les poids doivent être des nombres")
+    seed = int(request.get('seed', 0))
+    deadline_ms = request.get('deadline_ms')
+    deadline = None if deadline_ms is None else time.time() + float(deadline_ms) / 1000
+
+    key = (rows, cols, win_condition, board.tobytes(), difficulty, depth, time_budget, seed,
+           json.dumps(weights, sort_keys=True))
+    payload = {'board': board, 'win_condition': win_condition, 'difficulty': difficulty, 'depth': depth,
+               'time_budget': time_budget, 'weights': weights, 'seed': seed, 'deadline': deadline}
+    return key, payload
+
+
+class AnalysisClient:
+    """
+    Client asyncio du serveur d'analyse : plusieurs requêtes peuvent être en attente sur une même connexion.
+
+    Utilisation :
+        client = await AnalysisClient.connect(port=8765)
+        response = await client.analyse({'moves': [3, 3, 4], 'depth': 4})
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}  # id -> future de la réponse
+        self.next_id = 0
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    def send(self, request):
+        """Envoie une requête (un "id" est attribué s'il manque) et retourne le future de sa réponse."""
+        if 'id' not in request:
+            self.next_id += 1
+            request = {**request, 'id': f"c{self.next_id}"}
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request['id']] = future
+        self.writer.write((json.dumps(request) + "\n").encode())
+        return future
+
+    async def analyse(self, request):
+        return await self.send(request)
+
+    async def cancel(self, request_id):
+        return await self.send({'op': 'cancel', 'target': request_id})
+
+    async def metrics(self):
+        return (await self.send({'op': 'metrics'}))['metrics']
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._reader_task.cancel()
+
+    async def _read_responses(self):
+        async for line in self.reader:
+            response = json.loads(line)
+            future = self.pending.pop(response.get('id'), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("connexion fermée par le serveur"))
+
+
+async def serve(host, port, path, workers, batch_size, cache_path):
+    server = AnalysisServer(workers, batch_size, cache_path)
+    await server.start(host, port, path)
+    address = path if path is not None else f"{host}:{port}"
+    print(f"Serveur d'analyse sur {address} ({server.workers} processus)", flush=True)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur d'analyse Puissance X (JSON par ligne)")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, help="Écouter sur ce socket Unix plutôt qu'en TCP")
+    parser.add_argument('--workers', type=int, default=None, help="Processus de calcul (nombre de cœurs par défaut)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--cache', default=None, help="Cache persistant des positions")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.batch_size, args.cache))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
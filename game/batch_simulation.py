@@ -0,0 +1,170 @@
+import numpy as np
+
+# Directions de recherche d'un alignement : horizontale, verticale et les deux diagonales
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+class BatchSimulator:
+    """
+    Simule un grand nombre de parties en parallèle, coup par coup et en lockstep.
+
+    Toutes les parties sont stockées dans un seul tableau NumPy (N x lignes x colonnes) :
+    chaque étape joue un coup dans chaque partie encore en cours, puis détecte victoires
+    et matchs nuls pour tout le lot par des opérations vectorisées.
+    """
+
+    def __init__(self, num_games, rows=6, cols=7, win_condition=4, starting_players=None):
+        """
+        Args:
+            num_games (int): Nombre de parties simulées simultanément.
+            rows (int): Nombre de lignes du plateau.
+            cols (int): Nombre de colonnes du plateau.
+            win_condition (int): Nombre de pions alignés nécessaires pour gagner.
+            starting_players (ndarray): Joueur qui commence chaque partie (1 ou 2).
+                Par défaut, alternance comme dans AIMatchTester (partie paire → joueur 1).
+        """
+        self.num_games = num_games
+        self.rows = rows
+        self.cols = cols
+        self.win_condition = win_condition
+
+        self.boards = np.zeros((num_games, rows, cols), dtype=np.int8)
+        self.heights = np.full((num_games, cols), rows - 1, dtype=np.int16)  # Prochaine ligne libre (-1 = colonne pleine)
+        if starting_players is None:
+            starting_players = np.where(np.arange(num_games) % 2 == 0, 1, 2)
+        self.starting_players = np.asarray(starting_players, dtype=np.int8)
+        self.turn = self.starting_players.copy()  # Joueur qui doit jouer dans chaque partie
+        self.winner = np.zeros(num_games, dtype=np.int8)  # 0 = pas de vainqueur (en cours ou nul)
+        self.done = np.zeros(num_games, dtype=bool)
+        self.num_moves = np.zeros(num_games, dtype=np.int16)
+        self.moves = []  # Colonne jouée par partie à chaque étape (-1 si la partie était finie)
+
+    def valid_mask(self, games=None):
+        """
+        Retourne le masque (N x colonnes) des colonnes jouables.
+
+        Args:
+            games (ndarray): Indices des parties concernées (toutes si None).
+        """
+        heights = self.heights if games is None else self.heights[games]
+        return heights >= 0
+
+    def active_games(self):
+        """Indices des parties encore en cours."""
+        return np.flatnonzero(~self.done)
+
+    def step(self, games, cols):
+        """
+        Joue un coup dans chacune des parties indiquées.
+
+        Args:
+            games (ndarray): Indices des parties (en cours) où jouer.
+            cols (ndarray): Colonne jouée dans chaque partie.
+
+        Raises:
+            ValueError: Si une colonne est pleine ou hors du plateau.
+        """
+        cols = np.asarray(cols, dtype=np.intp)
+        if np.any((cols < 0) | (cols >= self.cols)):
+            raise ValueError("Colonne hors du plateau")
+        rows = self.heights[games, cols]
+        if np.any(rows < 0):
+            raise ValueError("Coup joué dans une colonne pleine")
+
+        pieces = self.turn[games]
+        self.boards[games, rows, cols] = pieces
+        self.heights[games, cols] -= 1
+        self.num_moves[games] += 1
+
+        step_moves = np.full(self.num_games, -1, dtype=np.int16)
+        step_moves[games] = cols
+        self.moves.append(step_moves)
+
+        won = self._wins_through(games, rows.astype(np.intp), cols, pieces)
+        self.winner[games[won]] = pieces[won]
+        full = self.num_moves[games] == self.rows * self.cols
+        self.done[games[won | full]] = True
+        self.turn[games] = 3 - pieces  # 1 ↔ 2
+
+    def _wins_through(self, games, rows, cols, pieces):
+        """Vérifie, pour tout le lot, si le pion posé en (rows, cols) complète un alignement."""
+        won = np.zeros(len(games), dtype=bool)
+        boards = self.boards[games]
+        index = np.arange(len(games))
+        for dr, dc in DIRECTIONS:
+            count = np.ones(len(games), dtype=np.int16)
+            for sign in (1, -1):
+                alive = np.ones(len(games), dtype=bool)  # La série continue-t-elle dans ce sens ?
+                for k in range(1, self.win_condition):
+                    r = rows + sign * k * dr
+                    c = cols + sign * k * dc
+                    inside = (r >= 0) & (r < self.rows) & (c >= 0) & (c < self.cols)
+                    values = boards[index, np.clip(r, 0, self.rows - 1), np.clip(c, 0, self.cols - 1)]
+                    alive &= inside & (values == pieces)
+                    if not alive.any():
+                        break
+                    count += alive
+            won |= count >= self.win_condition
+        return won
+
+    def run(self, policy1, policy2=None, rng=None):
+        """
+        Joue toutes les parties jusqu'à leur fin.
+
+        Args:
+            policy1 (callable): Politique du joueur 1, appelée avec
+                (plateaux, masque des coups valides, joueurs, rng) pour toutes les parties
+                où le joueur 1 doit jouer, et retournant une colonne par partie.
+            policy2 (callable): Politique du joueur 2 (policy1 si None).
+            rng (np.random.Generator): Générateur aléatoire transmis aux politiques.
+
+        Returns:
+            dict: Nombre de victoires du joueur 1, du joueur 2 et de matchs nuls.
+        """
+        if policy2 is None:
+            policy2 = policy1
+        if rng is None:
+            rng = np.random.default_rng()
+
+        while True:
+            active = self.active_games()
+            if len(active) == 0:
+                break
+            # Groupes calculés avant de jouer : un seul coup par partie et par étape
+            groups = [(policy, active[self.turn[active] == player]) for player, policy in ((1, policy1), (2, policy2))]
+            for policy, games in groups:
+                if len(games) == 0:
+                    continue
+                cols = policy(self.boards[games], self.valid_mask(games), self.turn[games], rng)
+                self.step(games, cols)
+
+        return {
+            'wins_p1': int(np.sum(self.winner == 1)),
+            'wins_p2': int(np.sum(self.winner == 2)),
+            'draws': int(np.sum(self.winner == 0))
+        }
+
+    def move_history(self):
+        """
+        Retourne les coups de chaque partie.
+
+        Returns:
+            list: Pour chaque partie, la liste des colonnes jouées dans l'ordre.
+        """
+        if not self.moves:
+            return [[] for _ in range(self.num_games)]
+        history = np.stack(self.moves, axis=1)
+        return [[int(col) for col in game if col >= 0] for game in history]
+
+
+def random_policy(boards, valid_mask, players, rng):
+    """Politique de référence : une colonne valide tirée uniformément dans chaque partie."""
+    noise = rng.random(valid_mask.shape)
+    return np.argmax(np.where(valid_mask, noise, -1.0), axis=1)
+
+
+def center_policy(boards, valid_mask, players, rng):
+    """Politique simple : préfère les colonnes proches du centre, avec un peu d'aléa pour départager."""
+    cols = valid_mask.shape[1]
+    distance = np.abs(np.arange(cols) - (cols - 1) / 2)
+    preference = -distance + rng.random(valid_mask.shape) * 1.5
+    return np.argmax(np.where(valid_mask, preference, -np.inf), axis=1)
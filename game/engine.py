@@ -0,0 +1,321 @@
+import random
+import numpy as np
+from game.ai import (get_ai_move, anytime_search, get_valid_locations, get_next_open_row, simulate_move, undo_move,
+                     score_position, SearchTimeout, DEFAULT_WEIGHTS, _order_children, _visit_leaf)
+from game.game_logic import winning_move
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+ZOBRIST_SEED = 20240601  # Graine des clés de hachage : les mêmes d'une exécution à l'autre
+MAX_TABLE_ENTRIES = 200000  # Au-delà, les positions antérieures à la position courante sont oubliées
+HISTORY_AGING_SHIFT = 3  # L'historique est divisé par 2**3 à chaque coup joué : les élagages récents comptent plus
+
+# Nature du score conservé dans la table de transposition
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class Engine:
+    """
+    Session de l'IA pour une partie : contrairement à get_ai_move, elle garde ce qu'elle a appris d'un coup
+    à l'autre.
+
+    - Table de transposition : score, nature du score (exact ou borne), profondeur et meilleur coup de
+      chaque position déjà cherchée, indexée par un hachage de Zobrist mis à jour coup par coup
+    - Historique : colonnes ayant provoqué des élagages, essayées plus tôt ensuite
+    - Variation principale de la recherche précédente, avancée à chaque coup joué
+
+    L'Engine doit être informé de chaque coup réellement joué (play) et remis à zéro entre deux parties
+    (reset). Les scores sont, comme pour minimax, du point de vue de AI_PIECE.
+
+    Args:
+        rows (int): Nombre de lignes du plateau.
+        cols (int): Nombre de colonnes du plateau.
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        cache (PositionCache): Cache persistant transmis à get_ai_move (aucun si None).
+    """
+
+    def __init__(self, rows, cols, win_condition, weights=None, cache=None):
+        self.rows = rows
+        self.cols = cols
+        self.win_condition = win_condition
+        self.weights = weights
+        self.cache = cache
+
+        keys = random.Random(ZOBRIST_SEED)
+        # Une clé de 64 bits par (pièce, case) et une pour le joueur maximisant au trait
+        self.zobrist = {piece: [keys.getrandbits(64) for _ in range(rows * cols)] for piece in (PLAYER_PIECE, AI_PIECE)}
+        self.side_key = keys.getrandbits(64)
+        self.config = self._config(win_condition, weights)
+        self.config_keys = {}  # (victoire, poids) autres que ceux de l'Engine -> clé mêlée à celle des positions
+        self.reset()
+
+    def reset(self):
+        """Nouvelle partie : plateau vide et tables oubliées."""
+        self.board = np.zeros((self.rows, self.cols))
+        self.hash = 0
+        self.moves = []
+        self.table = {}  # Clé de position -> (profondeur, nature, score, meilleur coup, pièces posées)
+        self.history = {piece: [0] * self.cols for piece in (PLAYER_PIECE, AI_PIECE)}
+        self.pv = []  # Suite de coups attendue depuis la position courante
+
+    @staticmethod
+    def _config(win_condition, weights):
+        return win_condition, tuple(sorted((DEFAULT_WEIGHTS if weights is None else weights).items()))
+
+    def config_key(self, win_condition, weights):
+        """
+        Clé mêlée au hachage des positions pour une condition de victoire et des poids donnés : 0 pour ceux de
+        l'Engine, une clé propre à chaque autre configuration, dont les scores ne se mélangent pas à ceux de la
+        session dans la table de transposition.
+        """
+        config = self._config(win_condition, weights)
+        if config == self.config:
+            return 0
+        if config not in self.config_keys:
+            self.config_keys[config] = random.Random(repr(config)).getrandbits(64)
+        return self.config_keys[config]
+
+    def hash_board(self, board):
+        """Hachage de Zobrist d'un plateau quelconque (sans le joueur au trait)."""
+        key = 0
+        for index, value in enumerate(board.flat):
+            if value:
+                key ^= self.zobrist[int(value)][index]
+        return key
+
+    def play(self, col, piece):
+        """Informe l'Engine d'un coup joué dans la partie."""
+        row = get_next_open_row(self.board, col)
+        self.board[row][col] = piece
+        self.hash ^= self.zobrist[piece][row * self.cols + col]
+        self.moves.append(col)
+        # La variation attendue reste valable si le coup joué est celui qu'elle prévoyait
+        self.pv = self.pv[1:] if self.pv and self.pv[0] == col else []
+        for counts in self.history.values():
+            counts[:] = [count >> HISTORY_AGING_SHIFT for count in counts]
+        if len(self.table) > MAX_TABLE_ENTRIES:
+            # Les positions qui ont moins de pièces que la position courante ne reviendront plus
+            count = len(self.moves)
+            self.table = {key: entry for key, entry in self.table.items() if entry[4] >= count}
+            if len(self.table) > MAX_TABLE_ENTRIES:
+                self.table.clear()
+
+    def sync(self, grid):
+        """Aligne l'Engine sur la grille de la partie si un coup ne lui a pas été signalé (tables conservées)."""
+        if not np.array_equal(grid, self.board):
+            self.board = np.array(grid, dtype=float)
+            self.hash = self.hash_board(self.board)
+            self.moves = [None] * int(np.count_nonzero(self.board))
+            self.pv = []
+
+    def best_move(self, grid, difficulty, depth=None, time_budget=None, stats=None, rng=None):
+        """
+        Coup de AI_PIECE dans la position `grid`, mêmes paramètres que get_ai_move.
+
+        Returns:
+            int or None: Colonne choisie, ou None si aucune possible.
+        """
+        self.sync(grid)
+        return get_ai_move(self.board, difficulty, self.win_condition, depth=depth, time_budget=time_budget,
+                           weights=self.weights, cache=self.cache, stats=stats, rng=rng, search=self.search)
+
+    def anytime_search(self, grid, max_depth, limits=None, stats=None, rng=None):
+        """
+        Approfondissement itératif sur la position `grid` avec les tables de la session (voir ai.anytime_search).
+
+        Le plateau de la session est cherché en place : aucun coup ne doit être signalé (play) tant que le
+        générateur est utilisé.
+
+        Yields:
+            SearchUpdate: Résultat de chaque profondeur terminée.
+        """
+        self.sync(grid)
+        return anytime_search(self.board, max_depth, self.win_condition, self.weights, limits, stats, rng,
+                              self.search)
+
+    def multi_pv(self, grid, depth, count=None, limits=None, stats=None, rng=None, exact_depth=True):
+        """
+        Score exact et variation principale des `count` meilleurs coups (de tous les coups si None).
+
+        Chaque coup de la racine est cherché séparément, mais avec la table de transposition et l'historique
+        de la session : les positions atteintes par plusieurs coups de la racine ne sont cherchées qu'une fois.
+        Un coup n'est cherché qu'avec la fenêtre (score du count-ième meilleur coup connu, +inf) : s'il ne
+        peut pas entrer dans la sélection, une borne suffit et sa recherche s'arrête tôt.
+
+        Args:
+            grid (ndarray): Position (AI_PIECE au trait).
+            depth (int): Profondeur de recherche (demi-coups depuis la racine).
+            count (int): Nombre de coups demandés (tous si None).
+            limits (SearchLimits): Limites de la recherche (aucune si None).
+            stats (SearchStats): Compteurs à remplir (aucun comptage si None).
+            rng (random.Random): Générateur qui départage les coups de même score (module random si None).
+            exact_depth (bool): N'utiliser que les entrées de la table cherchées exactement à la profondeur
+                demandée. Si False, une entrée plus profonde de la session remplace la recherche de sa position.
+
+        Returns:
+            list: Tuples (colonne, score, variation principale) par score décroissant. Les scores sont ceux de
+            minimax à cette profondeur (avec exact_depth=False, ceux d'une profondeur supérieure pour les
+            positions que la table de la session connaît déjà plus profondément).
+
+        Raises:
+            ValueError: Si depth ou count est inférieur à 1.
+            SearchTimeout: Si une limite est atteinte (le plateau de la session est rétabli).
+        """
+        if depth < 1:
+            raise ValueError("La profondeur doit être au moins 1")
+        if count is not None and count < 1:
+            raise ValueError("Le nombre de coups demandés doit être au moins 1")
+        self.sync(grid)
+        board = self.board
+        valid_locations = get_valid_locations(board)
+        if not valid_locations:
+            return []
+        _order_children(board, valid_locations, AI_PIECE, 2, self.win_condition, self.weights)
+        if count is None:
+            count = len(valid_locations)
+
+        pieces = int(np.count_nonzero(board))
+        original = board.copy()
+        lines = []
+        for col in valid_locations:
+            scores = sorted((score for _, score, _ in lines), reverse=True)
+            alpha = scores[count - 1] if len(scores) >= count else float("-inf")
+            row = get_next_open_row(board, col)
+            simulate_move(board, row, col, AI_PIECE)
+            child_pv = []
+            try:
+                _, score = self._search(board, self.hash ^ self.zobrist[AI_PIECE][row * self.cols + col], depth - 1,
+                                        alpha, float("inf"), False, self.win_condition, self.weights, limits, stats,
+                                        1, rng, child_pv, pieces + 1, exact_depth)
+            except SearchTimeout:
+                board[:] = original  # Coups simulés non annulés par la recherche interrompue
+                raise
+            undo_move(board, row, col)
+            # Au plus alpha : simple borne, le coup ne fait pas partie de la sélection
+            if score > alpha or alpha == float("-inf"):
+                lines.append((col, score, [col] + child_pv))
+
+        lines.sort(key=lambda line: -line[1])
+        lines = lines[:count]
+        if stats is not None:
+            stats.depth = max(stats.depth, depth)
+        self.pv = list(lines[0][2])
+        return lines
+
+    def search(self, board, depth, alpha, beta, maximizing_player, win_condition, weights=None, limits=None,
+               stats=None, ply=0, rng=None, pv=None):
+        """
+        Minimax avec élagage alpha-bêta et table de transposition (même signature que minimax).
+
+        Les scores sont ceux de minimax à cette profondeur, sauf pour les positions que la table de la session
+        a déjà cherchées plus profondément : leur score plus profond est repris. La condition de victoire et les
+        poids font partie de la clé de la table : d'autres valeurs que celles de l'Engine ne réutilisent pas ses
+        scores.
+
+        Returns:
+            tuple: (colonne choisie, score associé)
+        """
+        key = (self.hash if board is self.board else self.hash_board(board)) ^ self.config_key(win_condition, weights)
+        root_pv = [] if pv is None and board is self.board else pv
+        result = self._search(board, key, depth, alpha, beta, maximizing_player, win_condition, weights, limits,
+                              stats, ply, rng, root_pv, int(np.count_nonzero(board)))
+        if board is self.board and root_pv is not None:
+            self.pv = list(root_pv)
+        return result
+
+    def _search(self, board, key, depth, alpha, beta, maximizing_player, win_condition, weights, limits, stats,
+                ply, rng, pv, count, exact_depth=False):
+        if limits is not None:
+            limits.check()
+
+        valid_locations = get_valid_locations(board)
+        ai_wins = winning_move(board, AI_PIECE, win_condition)
+        player_wins = winning_move(board, PLAYER_PIECE, win_condition)
+        if stats is not None:
+            stats.nodes += 1
+            stats.win_checks += 2
+            if ply > stats.max_depth:
+                stats.max_depth = ply
+
+        if ai_wins:
+            return (None, float("inf"))
+        if player_wins:
+            return (None, float("-inf"))
+        if not valid_locations:
+            return (None, 0)
+
+        table_key = key ^ self.side_key if maximizing_player else key
+        entry = self.table.get(table_key)
+        table_move = None
+        if entry is not None:
+            entry_depth, flag, entry_value, table_move, _ = entry
+            # exact_depth : une entrée plus profonde donnerait un autre score que minimax à cette profondeur
+            usable = entry_depth == depth if exact_depth else entry_depth >= depth
+            if usable and (flag == EXACT or (flag == LOWER and entry_value >= beta)
+                           or (flag == UPPER and entry_value <= alpha)):
+                if stats is not None:
+                    stats.tt_hits += 1
+                if pv is not None:
+                    pv[:] = [] if table_move is None else [table_move]
+                return table_move, entry_value
+
+        if depth == 0:
+            if stats is not None:
+                stats.leaf_evaluations += 1
+            return (None, score_position(board, AI_PIECE, weights))
+        if stats is not None:
+            stats.ordering_evaluations += len(valid_locations)
+
+        piece = AI_PIECE if maximizing_player else PLAYER_PIECE
+        value = float("-inf") if maximizing_player else float("inf")
+        best_col = (random if rng is None else rng).choice(valid_locations)
+
+        # Ordre : coup de la table (ou de la variation précédente), puis historique, puis évaluation statique
+        leaves = _order_children(board, valid_locations, piece, depth, win_condition, weights)
+        history = self.history[piece]
+        valid_locations.sort(key=lambda col: -history[col])
+        first = table_move if table_move is not None else (self.pv[ply] if board is self.board and ply < len(self.pv)
+                                                           else None)
+        if first in valid_locations:
+            valid_locations.remove(first)
+            valid_locations.insert(0, first)
+
+        alpha_start, beta_start = alpha, beta
+        for index, col in enumerate(valid_locations):
+            child_pv = None if pv is None else []
+            if leaves is not None:
+                new_score = _visit_leaf(leaves[col], limits, stats, ply + 1)
+            else:
+                row = get_next_open_row(board, col)
+                simulate_move(board, row, col, piece)
+                _, new_score = self._search(board, key ^ self.zobrist[piece][row * self.cols + col], depth - 1,
+                                            alpha, beta, not maximizing_player, win_condition, weights, limits,
+                                            stats, ply + 1, rng, child_pv, count + 1, exact_depth)
+                undo_move(board, row, col)
+
+            if (new_score > value) if maximizing_player else (new_score < value):
+                value = new_score
+                best_col = col
+                if pv is not None:
+                    pv[:] = [col] + child_pv
+            if maximizing_player:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                history[col] += depth * depth
+                if stats is not None:
+                    stats.beta_cutoffs += 1
+                    if index == 0:
+                        stats.first_move_cutoffs += 1
+                break
+
+        if value <= alpha_start:
+            flag = UPPER
+        elif value >= beta_start:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if entry is None or entry[0] <= depth or not exact_depth:  # Garde les entrées plus profondes
+            self.table[table_key] = (depth, flag, value, best_col, count)
+        return best_col, value
@@ -1,18 +1,11 @@
-# Désactive l'affichage graphique de Pygame (utile pour l'exécution sur un serveur ou en test automatique)
-import os
-os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Utilise un pilote vidéo fictif
-
-# Importation des bibliothèques
-import pygame
+# Importation des bibliothèques (aucune dépendance à pygame : l'évaluation tourne sans affichage)
 import numpy as np  # Pour gérer la grille du jeu comme une matrice
-from game.game_screen import GameScreen  # (Import inutilisé ici, peut être supprimé)
 from game.game_logic import winning_move, get_next_open_row, drop_piece, is_valid_location  # Fonctions du moteur du jeu
 from game.ai import get_ai_move  # Fonction pour obtenir le coup d'une IA selon sa difficulté
 
 # Classe permettant d'évaluer les performances des IA en les faisant s'affronter
 class Evaluator:
     def __init__(self):
-        pygame.init()  # Initialisation de Pygame (même sans affichage visible)
         self.results = {}  # Dictionnaire pour stocker les résultats (pas utilisé ici, mais utile pour extensions)
     
     # Fonction pour exécuter une série de matchs entre deux IA de difficultés données
@@ -92,4 +92,29 @@ def winning_move(board, piece, win_condition=4):
             if all(board[r-i][c+i] == piece for i in range(win_condition)):
                 return True
                 
-    return False
\ No newline at end of file
+    return False
+
+def board_from_moves(rows, cols, moves, first_piece=1):
+    """
+    Reconstruit un plateau à partir d'une suite de coups joués alternativement par les deux joueurs.
+
+    Args:
+        rows (int): Nombre de lignes.
+        cols (int): Nombre de colonnes.
+        moves (list): Colonnes jouées, dans l'ordre.
+        first_piece (int): Pièce du joueur qui joue le premier coup (1 ou 2).
+
+    Returns:
+        ndarray: Plateau obtenu.
+
+    Raises:
+        ValueError: Si un coup vise une colonne inexistante ou pleine.
+    """
+    board = create_board(rows, cols)
+    piece = first_piece
+    for col in moves:
+        if not 0 <= col < cols or not is_valid_location(board, col):
+            raise ValueError(f"Coup impossible : colonne {col}")
+        drop_piece(board, get_next_open_row(board, col), col, piece)
+        piece = 3 - piece  # Alterne entre les pièces 1 et 2
+    return board
@@ -1,13 +1,23 @@
+import time
 import pygame
 from settings.constants import *
 import numpy as np
 from game.game_logic import *
 from game.ai import *
-from ui.interface import Button, Label
+from game.engine import Engine
+from game.position_cache import open_position_cache
+from game.search_stats import SearchStats
+from ui.interface import Button, Label, get_overlay
+from ui.performance_hud import PerformanceHUD
 
 class GameScreen:
     """Classe gérant l'affichage du jeu, les interactions avec la grille, et les tours de jeu"""
 
+    # Surfaces pré-rendues, partagées entre les parties : grille vide par (lignes, colonnes, taille de case)
+    # et sprites de pions par (taille de case, couleur)
+    _grid_surfaces = {}
+    _piece_sprites = {}
+
     def __init__(self, rows, cols, win_condition, difficulty, difficulty2, return_to_menu_callback, starting_player):
         """
         Initialise l'écran de jeu avec la configuration de la grille et les paramètres du jeu.
@@ -34,8 +44,21 @@ class GameScreen:
         self.winner = None
         self.is_paused = False  # Variable pour indiquer si le jeu est en pause
 
+        # Cache persistant des recherches, partagé avec les sessions et tournois précédents
+        self.position_cache = open_position_cache()
+        # Une session de l'IA par camp joué par l'ordinateur : tables de recherche conservées d'un coup à l'autre
+        self.engines = {}
+
         self.cell_size = min((BASE_WIDTH - 100) // self.cols, (BASE_HEIGHT - 100) // self.rows)
 
+        # Rendu incrémental : redessin complet seulement si nécessaire, sinon uniquement les nouveaux pions
+        self.full_redraw = True
+        self.dirty_cells = []  # Cases (ligne, colonne) modifiées depuis la dernière image
+        self.layout_size = None  # Taille de l'écran lors du dernier redessin complet
+
+        # Overlay de performance (touche F3) : temps par image et métriques de recherche de l'IA
+        self.hud = PerformanceHUD()
+
         # Boutons pour l'écran de fin et le menu pause
         self.replay_button = Button((0.4, 0.6), (0.2, 0.1), "Rejouer", self.reset_game)
         self.menu_button = Button((0.4, 0.8), (0.2, 0.1), "Menu Principal", self.return_to_menu_callback)
@@ -63,6 +86,12 @@ class GameScreen:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.toggle_pause()
+            elif event.key == pygame.K_F3:
+                self.hud.toggle()
+                self.full_redraw = True
+
+        if self.is_paused or self.game_over:
+            self.full_redraw = True  # Survol ou clic des boutons de l'overlay
 
         if self.is_paused:
             self.resume_button.handle_event(event)
@@ -83,7 +112,7 @@ class GameScreen:
 
             if 0 <= col < self.cols and is_valid_location(self.grid, col):
                 row = get_next_open_row(self.grid, col)
-                drop_piece(self.grid, row, col, PLAYER_PIECE)
+                self.play_piece(row, col, PLAYER_PIECE)
 
                 if winning_move(self.grid, PLAYER_PIECE, self.win_condition):
                     self.game_over = True
@@ -109,13 +138,17 @@ class GameScreen:
                 current_difficulty = self.difficulty  # Mode Joueur vs IA
             else:
                 current_difficulty = self.difficulty if self.turn == 1 else self.difficulty2
-            col = get_ai_move(self.grid, current_difficulty, self.win_condition)
+            # Les compteurs de recherche ne sont collectés que si le HUD est affiché
+            stats = SearchStats() if self.hud.visible else None
+            start = time.perf_counter()
+            col = self.engine(self.turn).best_move(self.grid, current_difficulty, stats=stats)
+            self.hud.record_search(stats, time.perf_counter() - start)
 
             if is_valid_location(self.grid, col):
                 row = get_next_open_row(self.grid, col)
                 piece = self.turn
 
-                drop_piece(self.grid, row, col, piece)
+                self.play_piece(row, col, piece)
 
                 if winning_move(self.grid, piece, self.win_condition):
                     self.game_over = True
@@ -133,9 +166,38 @@ class GameScreen:
                 if self.difficulty2 is not None and not self.game_over:
                     pygame.time.set_timer(AI_MOVE_EVENT, AI_DELAY)
 
+    def needs_redraw(self):
+        """Indique si des changements attendent d'être dessinés (utilisé par le rendu évènementiel)."""
+        return self.full_redraw or bool(self.dirty_cells)
+
+    def engine(self, turn):
+        """Session de l'IA qui joue pour `turn`, créée à son premier coup."""
+        if turn not in self.engines:
+            engine = Engine(self.rows, self.cols, self.win_condition, cache=self.position_cache)
+            engine.sync(self.grid)
+            self.engines[turn] = engine
+        return self.engines[turn]
+
+    def play_piece(self, row, col, piece):
+        """Pose un pion et marque sa case à redessiner (ainsi que tout l'écran si la partie se termine)."""
+        drop_piece(self.grid, row, col, piece)
+        self.dirty_cells.append((row, col))
+        for engine in self.engines.values():
+            engine.play(col, piece)
+
+    @property
+    def game_over(self):
+        return self._game_over
+
+    @game_over.setter
+    def game_over(self, value):
+        self._game_over = value
+        self.full_redraw = True  # Apparition ou disparition de l'écran de fin
+
     def toggle_pause(self):
         """Bascule entre l'état de pause et l'état de jeu"""
         self.is_paused = not self.is_paused
+        self.full_redraw = True
 
     def draw_overlay(self, screen, alpha=100):
         """
@@ -145,55 +207,86 @@ class GameScreen:
             screen (pygame.Surface): Surface d'affichage.
             alpha (int): Valeur de transparence (0 à 255).
         """
-        overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT))
-        overlay.fill((0, 0, 0))  # Remplir d'une couleur noire
-        overlay.set_alpha(alpha)  # Appliquer la transparence
+        overlay = get_overlay((BASE_WIDTH, BASE_HEIGHT), alpha)  # Surface réutilisée d'un appel à l'autre
         screen.blit(overlay, (0, 0))  # Dessiner l'overlay sur l'écran
 
+    def grid_surface(self):
+        """Retourne la grille vide pré-rendue pour la taille de plateau et de case courante."""
+        key = (self.rows, self.cols, self.cell_size)
+        if key not in GameScreen._grid_surfaces:
+            surface = pygame.Surface((self.cols * self.cell_size, self.rows * self.cell_size))
+            surface.fill(BLACK)
+            for row in range(self.rows):
+                for col in range(self.cols):
+                    rect = pygame.Rect(col * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size)
+                    pygame.draw.rect(surface, BLUE, rect, 2)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()  # Même format que l'écran : copie plus rapide
+            GameScreen._grid_surfaces[key] = surface
+        return GameScreen._grid_surfaces[key]
+
+    def piece_sprite(self, piece):
+        """Retourne le sprite pré-rendu (taille d'une case) du pion d'un joueur."""
+        color = RED if piece == PLAYER_PIECE else YELLOW
+        key = (self.cell_size, color)
+        if key not in GameScreen._piece_sprites:
+            sprite = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (self.cell_size // 2, self.cell_size // 2), self.cell_size // 2 - 5)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            GameScreen._piece_sprites[key] = sprite
+        return GameScreen._piece_sprites[key]
+
+    def cell_rect(self, screen, row, col):
+        """Rectangle d'une case à l'écran (la grille est centrée)."""
+        start_x = (screen.get_width() - self.cols * self.cell_size) // 2
+        start_y = (screen.get_height() - self.rows * self.cell_size) // 2
+        return pygame.Rect(start_x + col * self.cell_size, start_y + row * self.cell_size,
+                           self.cell_size, self.cell_size)
+
     def draw(self, screen):
         """
         Affiche le plateau de jeu et les éléments d'interface selon l'état (jeu, pause ou fin).
 
         Args:
             screen (pygame.Surface): Surface d'affichage.
-        """
-        screen.fill(BLACK)
 
-        # Appliquer un overlay si le jeu est en pause ou en fin de partie
-        if self.is_paused or self.game_over:
-            self.draw_overlay(screen, alpha=150)  # Un alpha plus élevé pour l'écran de fin ou pause
-
-        start_x = (screen.get_width() - self.cols * self.cell_size) // 2
-        start_y = (screen.get_height() - self.rows * self.cell_size) // 2
+        Returns:
+            list or None: Rectangles modifiés à rafraîchir, ou None si tout l'écran a été redessiné.
+        """
+        if screen.get_size() != self.layout_size or self.hud.visible:
+            self.full_redraw = True  # Le HUD peut recouvrir la grille : l'image est alors entièrement redessinée
+
+        if not self.full_redraw:
+            # Seuls les pions posés depuis la dernière image sont dessinés
+            dirty_rects = []
+            for row, col in self.dirty_cells:
+                rect = self.cell_rect(screen, row, col)
+                screen.blit(self.piece_sprite(self.grid[row][col]), rect)
+                dirty_rects.append(rect)
+            self.dirty_cells = []
+            return dirty_rects
+
+        self.full_redraw = False
+        self.dirty_cells = []
+        self.layout_size = screen.get_size()
 
-        for row in range(self.rows):
-            for col in range(self.cols):
-                rect = pygame.Rect(
-                    start_x + col * self.cell_size,
-                    start_y + row * self.cell_size,
-                    self.cell_size, self.cell_size
-                )
-                pygame.draw.rect(screen, BLUE, rect, 2)
+        screen.fill(BLACK)
+        grid_rect = self.cell_rect(screen, 0, 0)
+        screen.blit(self.grid_surface(), grid_rect.topleft)
 
         for row in range(self.rows):
             for col in range(self.cols):
-                if self.grid[row][col] == PLAYER_PIECE:
-                    pygame.draw.circle(screen, RED, 
-                                       (start_x + col * self.cell_size + self.cell_size // 2, 
-                                        start_y + row * self.cell_size + self.cell_size // 2), 
-                                       self.cell_size // 2 - 5)
-                elif self.grid[row][col] == AI_PIECE:
-                    pygame.draw.circle(screen, YELLOW, 
-                                       (start_x + col * self.cell_size + self.cell_size // 2, 
-                                        start_y + row * self.cell_size + self.cell_size // 2), 
-                                       self.cell_size // 2 - 5)
+                if self.grid[row][col] != 0:
+                    screen.blit(self.piece_sprite(self.grid[row][col]), self.cell_rect(screen, row, col))
 
+        # Appliquer un overlay si le jeu est en pause ou en fin de partie
         if self.game_over:
             self.draw_end_screen(screen)
         elif self.is_paused:
             self.draw_pause_screen(screen)
-
-        pygame.display.update()
+        self.hud.draw(screen)
+        return None
 
     def draw_end_screen(self, screen):
         """
@@ -230,7 +323,9 @@ class GameScreen:
     def reset_game(self):
         """Réinitialise la partie"""
         self.grid = np.zeros((self.rows, self.cols))
-        self.game_over = False
+        for engine in self.engines.values():
+            engine.reset()
+        self.game_over = False  # Provoque aussi un redessin complet
         self.turn = 1
         self.winner = None
         self.is_paused = False  # Réinitialiser l'état de pause lorsque le jeu est réinitialisé
\ No newline at end of file
@@ -0,0 +1,271 @@
+"""
+Moteur pour les grands plateaux (au-delà de 10x10, par exemple 15x15 ou 20x20 avec une victoire à 5).
+
+Sur un grand plateau, le coût par nœud de minimax croît avec tout le plateau : score_position parcourt toutes
+les fenêtres, winning_move tous les alignements, et chaque colonne est un coup candidat. Ici :
+
+- LargeBoard tient à jour, coup par coup, le nombre de pièces de chaque joueur dans chaque fenêtre de 4 cases et
+  le score qui en découle : jouer ou annuler un coup ne touche que les fenêtres passant par la case jouée
+  (au plus 16), et le score d'une feuille est déjà connu. Le score est exactement celui de
+  score_position(plateau, AI_PIECE).
+- Seul le dernier coup peut créer un alignement : la victoire se teste dans les quatre directions autour de lui.
+- Les coups candidats sont les colonnes à moins de `radius` colonnes d'une pièce déjà posée (un coup gagnant ou
+  une parade est toujours voisin d'une pièce de l'alignement, donc pris en compte dès que radius >= 1).
+
+get_large_move a les paramètres de get_ai_move et les mêmes conventions (AI_PIECE au trait, scores de son point
+de vue, victoire = +inf). Avec un rayon couvrant tout le plateau, ses scores sont ceux de minimax.
+"""
+import time
+import random
+from game.ai import DEFAULT_WEIGHTS, DIFFICULTY_DEPTHS, DEFAULT_DEPTH, SearchLimits, SearchTimeout
+from game.vectorized import line_tables, _window_scores
+from settings.game_constants import PLAYER_PIECE, AI_PIECE, WINDOW_LENGTH
+
+CANDIDATE_RADIUS = 2  # Colonnes candidates : à au plus 2 colonnes d'une pièce posée
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class LargeBoard:
+    """
+    Plateau à mise à jour incrémentale (copie indépendante du plateau NumPy d'origine).
+
+    Args:
+        board (ndarray): Position de départ.
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        radius (int): Distance maximale (en colonnes) entre un coup candidat et une pièce posée.
+    """
+
+    def __init__(self, board, win_condition, weights=None, radius=CANDIDATE_RADIUS):
+        if weights is None:
+            weights = DEFAULT_WEIGHTS
+        self.rows, self.cols = board.shape
+        self.win_condition = win_condition
+        self.radius = radius
+        self.size = self.rows * self.cols
+
+        tables = line_tables(self.rows, self.cols, WINDOW_LENGTH)
+        self.windows_of = [[] for _ in range(self.size)]  # Fenêtres passant par chaque case
+        for window, cells in enumerate(tables.windows.tolist()):
+            for cell in cells:
+                self.windows_of[cell].append(window)
+        # Score d'une fenêtre pour AI_PIECE selon (pièces de l'IA, pièces du joueur), mêmes règles qu'evaluate_window
+        self.window_score = _window_scores(tuple(sorted(weights.items()))).tolist()
+        self.center = set(tables.center.tolist())
+        self.center_weight = weights["center"]
+
+        self.cells = [0] * self.size
+        self.heights = [self.rows - 1] * self.cols  # Prochaine ligne libre de chaque colonne (-1 = pleine)
+        self.counts = {AI_PIECE: [0] * len(tables.windows), PLAYER_PIECE: [0] * len(tables.windows)}
+        self.near = [0] * self.cols  # Pièces posées à moins de radius colonnes
+        self.pieces = 0
+        self.score = 0
+        for col in range(self.cols):
+            for row in range(self.rows - 1, -1, -1):
+                piece = int(board[row][col])
+                if piece == 0:
+                    break
+                self.play(col, piece)
+
+    def _update(self, cell, piece, delta):
+        """Ajoute (delta = 1) ou retire (delta = -1) la pièce de `cell` des fenêtres et du score."""
+        ai_counts, player_counts = self.counts[AI_PIECE], self.counts[PLAYER_PIECE]
+        changed = self.counts[piece]
+        table = self.window_score
+        score = self.score
+        for window in self.windows_of[cell]:
+            score -= table[ai_counts[window]][player_counts[window]]
+            changed[window] += delta
+            score += table[ai_counts[window]][player_counts[window]]
+        if piece == AI_PIECE and cell in self.center:
+            score += delta * self.center_weight
+        self.score = score
+
+    def play(self, col, piece):
+        """
+        Joue `piece` dans `col` (supposée jouable).
+
+        Returns:
+            bool: True si ce coup aligne win_condition pièces.
+        """
+        row = self.heights[col]
+        self.heights[col] = row - 1
+        cell = row * self.cols + col
+        self.cells[cell] = piece
+        self.pieces += 1
+        self._update(cell, piece, 1)
+        for near in range(max(0, col - self.radius), min(self.cols, col + self.radius + 1)):
+            self.near[near] += 1
+        return self.wins_at(row, col, piece)
+
+    def undo(self, col):
+        """Annule le dernier coup joué dans `col`."""
+        row = self.heights[col] + 1
+        self.heights[col] = row
+        cell = row * self.cols + col
+        piece = self.cells[cell]
+        self.cells[cell] = 0
+        self.pieces -= 1
+        self._update(cell, piece, -1)
+        for near in range(max(0, col - self.radius), min(self.cols, col + self.radius + 1)):
+            self.near[near] -= 1
+
+    def wins_at(self, row, col, piece):
+        """True si la pièce en (row, col) fait partie d'un alignement de win_condition pièces."""
+        cells, rows, cols = self.cells, self.rows, self.cols
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * dr, col + sign * dc
+                while 0 <= r < rows and 0 <= c < cols and cells[r * cols + c] == piece:
+                    count += 1
+                    r += sign * dr
+                    c += sign * dc
+            if count >= self.win_condition:
+                return True
+        return False
+
+    def candidates(self):
+        """Colonnes jouables proches d'une pièce posée (colonne centrale sur un plateau vide)."""
+        heights = self.heights
+        if self.pieces == 0:
+            return [self.cols // 2]
+        moves = [col for col in range(self.cols) if heights[col] >= 0 and self.near[col]]
+        if not moves:
+            # Toutes les colonnes proches sont pleines : les autres redeviennent candidates
+            moves = [col for col in range(self.cols) if heights[col] >= 0]
+        return moves
+
+
+def large_minimax(board, depth, alpha, beta, maximizing_player, limits=None, stats=None, ply=0, first=None):
+    """
+    Minimax avec élagage alpha-bêta sur un LargeBoard (restauré à la sortie, sauf interruption par les limites).
+
+    Args:
+        board (LargeBoard): Position, sans alignement gagnant.
+        depth (int): Profondeur restante.
+        alpha (float): Meilleur score assuré pour le joueur maximisant.
+        beta (float): Meilleur score assuré pour le joueur minimisant.
+        maximizing_player (bool): True si AI_PIECE est au trait.
+        limits (SearchLimits): Limites de la recherche (aucune si None).
+        stats (SearchStats): Compteurs à incrémenter (aucun comptage si None).
+        ply (int): Distance à la racine en demi-coups.
+        first (int): Coup essayé en premier (meilleur coup de l'itération précédente, à la racine).
+
+    Returns:
+        tuple: (colonne choisie, score associé)
+
+    Raises:
+        SearchTimeout: Si une limite de `limits` est atteinte.
+    """
+    if limits is not None:
+        limits.check()
+    if stats is not None:
+        stats.nodes += 1
+        if ply > stats.max_depth:
+            stats.max_depth = ply
+
+    if board.pieces == board.size:
+        return (None, 0)
+    if depth == 0:
+        if stats is not None:
+            stats.leaf_evaluations += 1
+        return (None, board.score)
+
+    piece = AI_PIECE if maximizing_player else PLAYER_PIECE
+    # Score de chaque coup candidat après l'avoir joué (mise à jour incrémentale) : ordre des coups, et
+    # un coup gagnant termine la recherche du nœud
+    ordered = []
+    for col in board.candidates():
+        won = board.play(col, piece)
+        score = board.score
+        board.undo(col)
+        if stats is not None:
+            stats.win_checks += 1
+            stats.ordering_evaluations += 1
+        if won:
+            return (col, float("inf") if maximizing_player else float("-inf"))
+        ordered.append((-score if maximizing_player else score, col))
+    ordered.sort()
+    moves = [col for _, col in ordered]
+    if first in moves:
+        moves.remove(first)
+        moves.insert(0, first)
+
+    value = float("-inf") if maximizing_player else float("inf")
+    best_col = moves[0]
+    for index, col in enumerate(moves):
+        board.play(col, piece)
+        _, new_score = large_minimax(board, depth - 1, alpha, beta, not maximizing_player, limits, stats, ply + 1)
+        board.undo(col)
+        if (new_score > value) if maximizing_player else (new_score < value):
+            value = new_score
+            best_col = col
+        if maximizing_player:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            if stats is not None:
+                stats.beta_cutoffs += 1
+                if index == 0:
+                    stats.first_move_cutoffs += 1
+            break
+    return best_col, value
+
+
+def get_large_move(board, difficulty, win_condition=5, depth=None, time_budget=None, weights=None, stats=None,
+                   rng=None, radius=CANDIDATE_RADIUS):
+    """
+    Coup de AI_PIECE sur un grand plateau (mêmes paramètres que get_ai_move).
+
+    Args:
+        board (ndarray): Plateau de jeu (non modifié).
+        difficulty (str): "easy", "medium", ou "hard".
+        win_condition (int): Nombre de pièces alignées pour gagner.
+        depth (int): Profondeur imposée (remplace celle de la difficulté).
+        time_budget (float): Si fourni, approfondissement itératif jusqu'à `depth` dans ce délai (secondes).
+        weights (dict): Poids de l'évaluation (DEFAULT_WEIGHTS si None).
+        stats (SearchStats): Compteurs à remplir (aucun comptage si None).
+        rng (random.Random or int): Générateur (ou graine) du coup de secours (module random si None).
+        radius (int): Distance maximale (en colonnes) entre un coup candidat et une pièce posée.
+
+    Returns:
+        int or None: Colonne choisie, ou None si aucune possible.
+    """
+    if isinstance(rng, int):
+        rng = random.Random(rng)
+    random_source = random if rng is None else rng
+    if depth is None:
+        depth = DIFFICULTY_DEPTHS.get(difficulty, DEFAULT_DEPTH)
+    start = time.perf_counter()
+    large = LargeBoard(board, win_condition, weights, radius)
+    valid_locations = [col for col in range(large.cols) if large.heights[col] >= 0]
+    if not valid_locations:
+        return None
+
+    best_col = None
+    if time_budget is None:
+        best_col, score = large_minimax(large, depth, float("-inf"), float("inf"), True, stats=stats)
+        completed = depth
+    else:
+        limits = SearchLimits(deadline=start + time_budget)
+        completed = 0
+        for current in range(1, depth + 1):
+            try:
+                best_col, score = large_minimax(large, current, float("-inf"), float("inf"), True, limits, stats,
+                                                first=best_col)
+            except SearchTimeout:
+                break
+            completed = current
+            if score in (float("inf"), float("-inf")):
+                break  # Issue forcée : inutile d'aller plus profond
+
+    if best_col is None or best_col not in valid_locations or (completed and score == float("-inf")):
+        # Interrompue avant la première profondeur, ou tout coup perd : coup de secours comme minimax
+        best_col = random_source.choice(large.candidates() if best_col is None else valid_locations)
+    if stats is not None:
+        stats.depth = max(stats.depth, completed)
+        stats.searches += 1
+        stats.elapsed += time.perf_counter() - start
+    return best_col
@@ -0,0 +1,210 @@
+import os
+import time
+import json
+import sqlite3
+from game import profiling
+
+DEFAULT_CACHE_PATH = "position_cache.sqlite"  # Fichier du cache partagé entre les exécutions
+DEFAULT_MAX_ENTRIES = 200000  # Nombre maximal de positions conservées
+CACHE_VERSION = 2  # À incrémenter si l'évaluation ou la recherche change : l'ancien contenu est alors effacé
+EVICTION_CHECK_INTERVAL = 100  # Nombre d'écritures entre deux vérifications de la taille du cache
+EVICTION_RATIO = 0.9  # Après éviction, le cache est ramené à cette fraction de sa taille maximale
+
+class PositionCache:
+    """
+    Cache persistant (SQLite) des résultats de recherche : meilleur coup et score d'une position,
+    et variation principale lorsque la recherche l'a fournie (protocole texte).
+
+    Les entrées sont indexées par la position canonique (le plateau et son symétrique gauche-droite
+    partagent la même entrée lorsque le nombre de colonnes est impair), la configuration du plateau,
+    la profondeur de recherche et les poids d'évaluation. Plusieurs processus peuvent l'utiliser en
+    même temps : SQLite en mode WAL sérialise les écritures et chaque processus ouvre sa propre connexion.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES, timeout=30.0):
+        """
+        Args:
+            path (str): Chemin du fichier SQLite (":memory:" pour un cache non persistant).
+            max_entries (int): Nombre maximal d'entrées avant éviction des moins utilisées
+                (vérifié toutes les EVICTION_CHECK_INTERVAL écritures de chaque processus).
+            timeout (float): Attente maximale (en secondes) d'un verrou tenu par un autre processus.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0  # Statistiques du processus courant
+        self.misses = 0
+        self._conn = None
+        self._pid = None
+        self._writes_since_check = 0
+        self._connect()
+
+    def _connect(self):
+        """Ouvre (ou rouvre après un fork) la connexion du processus courant."""
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        # check_same_thread=False : un moteur peut chercher dans un thread séparé (game.protocol),
+        # les accès restent séquentiels
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or int(row[0]) != CACHE_VERSION:
+                # Ancienne version : le contenu est effacé et la table recréée (le schéma a pu changer)
+                conn.execute("DROP TABLE IF EXISTS positions")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(CACHE_VERSION),))
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS positions ("
+                " key TEXT PRIMARY KEY, best_col INTEGER, score REAL, pv TEXT,"
+                " hits INTEGER NOT NULL DEFAULT 0, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS positions_usage ON positions (hits, last_used)")
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def canonical_key(board, win_condition, depth, weights=None):
+        """
+        Construit la clé canonique d'une position.
+
+        Args:
+            board (ndarray): Plateau de jeu.
+            win_condition (int): Nombre de pièces alignées pour gagner.
+            depth (int): Profondeur de recherche.
+            weights (dict): Poids de l'évaluation (None = poids par défaut).
+
+        Returns:
+            tuple: (clé, True si la clé correspond au plateau symétrique)
+        """
+        rows, cols = board.shape
+        cells = board.astype(int)
+        position = "".join(map(str, cells.ravel()))
+        mirrored = False
+        if cols % 2 == 1:
+            # Le bonus de colonne centrale n'est symétrique que pour un nombre impair de colonnes
+            mirror_position = "".join(map(str, cells[:, ::-1].ravel()))
+            if mirror_position < position:
+                position, mirrored = mirror_position, True
+        weights_key = json.dumps(weights, sort_keys=True) if weights else ""
+        return f"{rows}x{cols}/{win_condition}/d{depth}/{weights_key}/{position}", mirrored
+
+    def get(self, board, win_condition, depth, weights=None, with_pv=False):
+        """
+        Cherche le résultat d'une recherche déjà effectuée.
+
+        Args:
+            with_pv (bool): Retourner aussi la variation principale enregistrée.
+
+        Returns:
+            tuple or None: (colonne, score) si la position est connue, None sinon. Avec with_pv :
+            (colonne, score, variation principale), la variation valant None si elle n'a pas été enregistrée.
+        """
+        key, mirrored = self.canonical_key(board, win_condition, depth, weights)
+        with profiling.phase('io'):
+            conn = self._connect()
+            row = conn.execute("SELECT best_col, score, pv FROM positions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            conn.execute("UPDATE positions SET hits = hits + 1, last_used = ? WHERE key = ?", (time.time(), key))
+        best_col, score, pv = row
+        if pv is not None:
+            pv = [int(col) for col in pv.split()]
+        if mirrored:
+            best_col = board.shape[1] - 1 - best_col
+            if pv is not None:
+                pv = [board.shape[1] - 1 - col for col in pv]
+        if with_pv:
+            return best_col, score, pv
+        return best_col, score
+
+    def put(self, board, win_condition, depth, best_col, score, weights=None, pv=None):
+        """
+        Enregistre le résultat d'une recherche.
+
+        Sans `pv`, la variation principale déjà enregistrée est conservée si le meilleur coup est inchangé.
+        """
+        key, mirrored = self.canonical_key(board, win_condition, depth, weights)
+        if mirrored:
+            best_col = board.shape[1] - 1 - best_col
+            if pv is not None:
+                pv = [board.shape[1] - 1 - col for col in pv]
+        with profiling.phase('io'):
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO positions (key, best_col, score, pv, hits, last_used) VALUES (?, ?, ?, ?, 0, ?)"
+                " ON CONFLICT(key) DO UPDATE SET best_col = excluded.best_col, score = excluded.score,"
+                " pv = CASE WHEN excluded.pv IS NOT NULL THEN excluded.pv"
+                " WHEN positions.best_col = excluded.best_col THEN positions.pv END,"
+                " last_used = excluded.last_used",
+                (key, int(best_col), float(score), None if pv is None else " ".join(map(str, pv)), time.time())
+            )
+            self._writes_since_check += 1
+            if self._writes_since_check >= EVICTION_CHECK_INTERVAL:
+                self.evict()
+
+    def evict(self):
+        """Supprime les entrées les moins utilisées si le cache dépasse sa taille maximale."""
+        self._writes_since_check = 0
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - int(self.max_entries * EVICTION_RATIO)
+                conn.execute(
+                    "DELETE FROM positions WHERE key IN ("
+                    " SELECT key FROM positions ORDER BY hits ASC, last_used ASC LIMIT ?)",
+                    (excess,)
+                )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+    def hit_rate(self):
+        """Proportion des consultations ayant trouvé la position (0 si aucune consultation)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Vide le cache."""
+        self._connect().execute("DELETE FROM positions")
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+    def __getstate__(self):
+        # La connexion n'est pas transmise aux processus de travail : chacun ouvre la sienne
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_pid'] = None
+        return state
+
+
+def open_position_cache(path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+    """
+    Ouvre le cache de positions, ou retourne None s'il est inaccessible (le jeu fonctionne alors sans).
+    """
+    try:
+        return PositionCache(path, max_entries)
+    except sqlite3.Error as e:
+        print(f"Cache de positions indisponible ({path}) : {e}")
+        return None
@@ -0,0 +1,326 @@
+import os
+import sys
+import glob
+import atexit
+import signal
+import threading
+import contextlib
+
+ENV_VAR = "PUISSANCE_X_PROFILE"  # Répertoire de sortie : sa présence active le profilage (processus enfants compris)
+MODE_ENV_VAR = "PUISSANCE_X_PROFILE_MODE"  # "sample" (par défaut) ou "cprofile"
+MODES = ('sample', 'cprofile')
+SAMPLE_INTERVAL = 0.002  # Intervalle entre deux échantillons de pile, en secondes
+MERGED_NAME = "profile"  # Préfixe des fichiers fusionnés
+
+# Fonctions rattachées à une phase quel que soit le contexte d'appel (mode échantillonnage) :
+# les appels de l'évaluation sont trop fréquents pour être encadrés par un gestionnaire de contexte
+FUNCTION_PHASES = {
+    'score_position': 'evaluation',
+    'score_simulated_move': 'evaluation',
+    'evaluate_window': 'evaluation',
+    # Évaluation vectorisée (ai.VECTORIZED_CHILDREN) : _order_children génère et évalue d'un seul passage les
+    # enfants d'un nœud (ordre des coups et feuilles de profondeur 1, à la place des trois fonctions ci-dessus)
+    '_order_children': 'evaluation',
+    'score_positions': 'evaluation',
+    'score_positions_both': 'evaluation',
+    '_score_pieces': 'evaluation',
+}
+
+_NO_PHASE = contextlib.nullcontext()
+_profiler = None  # Profileur du processus courant (None = profilage désactivé)
+
+
+class _SamplingProfiler:
+    """
+    Échantillonne périodiquement la pile de chaque thread du processus.
+
+    Chaque échantillon est compté sous la forme « phase;fichier:fonction;... » (format « collapsed stack »
+    lu par flamegraph.pl, speedscope ou inferno), la phase étant celle de la fonction d'évaluation présente
+    dans la pile, sinon la phase déclarée la plus interne par ce thread. Les piles des threads autres que
+    le thread principal (par exemple la recherche du protocole texte) commencent par « [nom du thread] ».
+
+    Les échantillons sont déclenchés par une minuterie (SIGALRM) traitée dans le thread principal : sa pile est
+    lue là où il s'exécute. Un thread d'échantillonnage n'obtiendrait le GIL que lorsque le thread principal le
+    relâche, c'est-à-dire presque toujours dans un appel NumPy, et ne verrait jamais le code Python pur. Ce
+    thread ne sert qu'en repli (pas de setitimer, ou profilage activé hors du thread principal). Les piles des
+    autres threads sont lues là où ils ont cédé le GIL : leur répartition reste approximative.
+    """
+    extension = ".collapsed"
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.phases = {}  # Pile des phases déclarées par chaque thread (identifiant -> liste)
+        self.counts = {}  # Pile « collapsed » -> nombre d'échantillons
+        self._start()
+
+    def _start(self):
+        self.thread_id = threading.main_thread().ident
+        self._thread = None
+        if hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGALRM, self._on_timer)
+            signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        else:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        else:
+            self._stop.set()
+
+    def _on_timer(self, signum, frame):
+        self._sample_threads(frame)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample_threads(None)
+
+    def _sample_threads(self, main_frame):
+        """Un échantillon par thread ; main_frame : pile du thread principal interrompu par la minuterie."""
+        frames = sys._current_frames()
+        if main_frame is not None:
+            frames[self.thread_id] = main_frame  # Et non la pile du gestionnaire de signal
+        elif self._thread is not None:
+            frames.pop(self._thread.ident, None)
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in frames.items():
+            self._sample(thread_id, frame, names.get(thread_id, str(thread_id)))
+
+    def _sample(self, thread_id, frame, name):
+        phases = tuple(self.phases.get(thread_id, ()))  # Copie : la liste est modifiée par le thread observé
+        phase = phases[-1] if phases else 'other'
+        function_phase = None
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            if function_phase is None:
+                function_phase = FUNCTION_PHASES.get(code.co_name)
+            frame = frame.f_back
+        if thread_id != self.thread_id:
+            stack.append(f"[{name}]")
+        stack.append(function_phase or phase)
+        key = ";".join(reversed(stack))
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def push(self, name):
+        self.phases.setdefault(threading.get_ident(), []).append(name)
+
+    def pop(self):
+        thread_id = threading.get_ident()
+        phases = self.phases[thread_id]
+        phases.pop()
+        if not phases:
+            del self.phases[thread_id]  # Pas d'entrée laissée par les threads terminés
+
+    def after_fork(self):
+        """La minuterie et le thread d'échantillonnage ne survivent pas à un fork : l'enfant repart de zéro."""
+        thread_id = threading.get_ident()  # Seul thread qui survit au fork
+        self.phases = {thread_id: self.phases[thread_id]} if thread_id in self.phases else {}
+        self.counts = {}
+        self._start()
+
+    def write(self, directory):
+        path = os.path.join(directory, f"{os.getpid()}{self.extension}")
+        counts = dict(self.counts)  # Copie : le thread d'échantillonnage continue de compter
+        with open(path, 'w') as f:
+            for stack, count in sorted(counts.items()):
+                f.write(f"{stack} {count}\n")
+        return [path]
+
+
+class _CProfiler:
+    """
+    Un cProfile par phase : seul celui de la phase la plus interne est actif.
+
+    cProfile ne mesure que le thread qui l'active : ce mode ne profile que le thread principal, et les phases
+    déclarées par les autres threads sont ignorées (le mode « sample » couvre tous les threads).
+    """
+    extension = ".prof"
+
+    def __init__(self):
+        self.profiles = {}
+        self.phases = []
+        self._activate('other')
+
+    def _activate(self, name):
+        import cProfile  # Importé seulement si le mode est utilisé : game.ai importe ce module au démarrage
+        if name not in self.profiles:
+            self.profiles[name] = cProfile.Profile()
+        self.profiles[name].enable()
+
+    def _current(self):
+        return self.phases[-1] if self.phases else 'other'
+
+    def push(self, name):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self.profiles[self._current()].disable()
+        self.phases.append(name)
+        self._activate(name)
+
+    def pop(self):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self.profiles[self._current()].disable()
+        self.phases.pop()
+        self._activate(self._current())
+
+    def after_fork(self):
+        current = self._current()
+        self.profiles[current].disable()
+        self.profiles = {}
+        self._activate(current)
+
+    def write(self, directory):
+        current = self._current()
+        self.profiles[current].disable()
+        paths = []
+        for name, profile in self.profiles.items():
+            path = os.path.join(directory, f"{os.getpid()}-{name}{self.extension}")
+            profile.dump_stats(path)
+            paths.append(path)
+        self._activate(current)
+        return paths
+
+
+def enable(output_dir, mode='sample', interval=SAMPLE_INTERVAL, clear=True):
+    """
+    Active le profilage du processus courant et des processus qu'il lancera ensuite.
+
+    Args:
+        output_dir (str): Répertoire où chaque processus écrit ses données (créé si besoin).
+        mode (str): "sample" (piles échantillonnées, format collapsed) ou "cprofile" (un .prof par phase).
+        interval (float): Intervalle d'échantillonnage en secondes (mode "sample").
+        clear (bool): Supprimer les données d'une exécution précédente dans output_dir.
+
+    Raises:
+        ValueError: Si le mode est inconnu.
+    """
+    global _profiler
+    if mode not in MODES:
+        raise ValueError(f"Mode de profilage inconnu : {mode} (attendu : {MODES})")
+    if _profiler is not None:
+        return
+
+    os.makedirs(output_dir, exist_ok=True)
+    if clear:
+        for path in glob.glob(os.path.join(output_dir, "*.collapsed")) + glob.glob(os.path.join(output_dir, "*.prof")):
+            os.remove(path)
+    os.environ[ENV_VAR] = output_dir
+    os.environ[MODE_ENV_VAR] = mode
+    _profiler = _SamplingProfiler(interval) if mode == 'sample' else _CProfiler()
+    if mode == 'sample':
+        atexit.register(_profiler.stop)  # Après l'écriture finale : atexit appelle les fonctions en ordre inverse
+    atexit.register(flush)
+
+
+def is_enabled():
+    return _profiler is not None
+
+
+def phase(name):
+    """
+    Gestionnaire de contexte qui rattache le code exécuté à une phase ("search", "rendering", "io"...).
+    Sans profilage actif, il ne fait rien.
+    """
+    if _profiler is None:
+        return _NO_PHASE
+    return _phase(name)
+
+
+@contextlib.contextmanager
+def _phase(name):
+    _profiler.push(name)
+    try:
+        yield
+    finally:
+        _profiler.pop()
+
+
+def flush():
+    """
+    Écrit les données du processus courant dans le répertoire de profilage (remplace une écriture précédente).
+    À appeler explicitement à la fin d'un processus de travail de multiprocessing : ils ne passent pas par atexit.
+
+    Returns:
+        list: Fichiers écrits (vide si le profilage est désactivé).
+    """
+    if _profiler is None:
+        return []
+    return _profiler.write(os.environ[ENV_VAR])
+
+
+def merge(output_dir):
+    """
+    Fusionne les données de tous les processus d'un répertoire de profilage.
+
+    Écrit profile.collapsed (somme des échantillons par pile, mode "sample") et profile-<phase>.prof
+    (statistiques cProfile cumulées par phase). Affiche la répartition des échantillons par phase.
+
+    Returns:
+        list: Fichiers fusionnés écrits.
+    """
+    written = []
+    merged_prefix = os.path.join(output_dir, MERGED_NAME)
+
+    counts = {}
+    for path in glob.glob(os.path.join(output_dir, "*.collapsed")):
+        if path.startswith(merged_prefix):
+            continue
+        with open(path) as f:
+            for line in f:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                counts[stack] = counts.get(stack, 0) + int(count)
+    if counts:
+        path = merged_prefix + ".collapsed"
+        with open(path, 'w') as f:
+            for stack, count in sorted(counts.items()):
+                f.write(f"{stack} {count}\n")
+        written.append(path)
+
+        total = sum(counts.values())
+        by_phase = {}
+        for stack, count in counts.items():
+            by_phase[stack.split(";", 1)[0]] = by_phase.get(stack.split(";", 1)[0], 0) + count
+        print(f"Profilage : {total} échantillons")
+        for name, count in sorted(by_phase.items(), key=lambda item: item[1], reverse=True):
+            print(f"  {name:<12} {count / total * 100:5.1f} %")
+
+    by_phase = {}
+    for path in glob.glob(os.path.join(output_dir, "*.prof")):
+        if os.path.basename(path).startswith(MERGED_NAME):
+            continue
+        name = os.path.basename(path)[:-len(".prof")].split("-", 1)[1]
+        by_phase.setdefault(name, []).append(path)
+    for name, paths in by_phase.items():
+        import pstats
+        stats = pstats.Stats(paths[0])
+        for path in paths[1:]:
+            stats.add(path)
+        path = f"{merged_prefix}-{name}.prof"
+        stats.dump_stats(path)
+        written.append(path)
+        print(f"Profilage {name} : {stats.total_tt:.2f} s ({len(paths)} processus) -> {path}")
+    return written
+
+
+def _after_fork_in_child():
+    if _profiler is not None:
+        _profiler.after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+# Processus lancé avec la variable d'environnement (interface graphique, ou enfant en mode « spawn »)
+if os.environ.get(ENV_VAR) and _profiler is None:
+    enable(os.environ[ENV_VAR], os.environ.get(MODE_ENV_VAR, 'sample'), clear=False)
+
+
+if __name__ == "__main__":
+    # python -m game.profiling RÉPERTOIRE : fusionne les données d'une exécution
+    if len(sys.argv) != 2:
+        sys.exit("Usage : python -m game.profiling RÉPERTOIRE")
+    merge(sys.argv[1])
@@ -0,0 +1,246 @@
+"""
+Moteur d'analyse persistant : protocole texte ligne par ligne sur l'entrée et la sortie standard.
+
+    python -m game.protocol [--cache FICHIER]
+
+Commandes (une par ligne) :
+    config LIGNES COLONNES VICTOIRE   Dimensions du plateau et condition de victoire (6 7 4 par défaut)
+    position [COUPS]                  Position atteinte par une suite de coups depuis le plateau vide : colonnes
+                                      numérotées à partir de 0, séparées par des espaces ("3 3 4") ou accolées
+                                      ("334", jusqu'à 10 colonnes). Le joueur 1 joue le premier coup.
+    go [depth N] [movetime MS] [nodes N] [infinite]
+                                      Cherche le meilleur coup du joueur au trait. Une ligne "info" est écrite à
+                                      chaque profondeur terminée, puis "bestmove COL score S depth D nodes N pv ...".
+    stop                              Interrompt la recherche en cours (la dernière profondeur terminée est retenue)
+                                      Les autres commandes attendent la fin de la recherche en cours : une suite
+                                      de requêtes peut être envoyée d'un bloc.
+    seed N                            Graine du départage des coups de même score (0 par défaut)
+    newgame                           Vide le cache en mémoire (un cache --cache persistant est conservé)
+    isready                           Répond "readyok" (immédiatement, même pendant une recherche)
+    quit                              Interrompt la recherche en cours et termine le processus
+
+Les scores sont donnés du point de vue du joueur au trait ("win" / "loss" pour une issue forcée).
+Les erreurs sont signalées par une ligne "error MESSAGE". Le processus garde ses caches entre les requêtes.
+"""
+import sys
+import time
+import random
+import argparse
+import threading
+import numpy as np
+from game.ai import minimax, get_valid_locations, SearchLimits, SearchTimeout, DIFFICULTY_DEPTHS
+from game.game_logic import board_from_moves, winning_move
+from game.position_cache import PositionCache
+from game.search_stats import SearchStats
+from game import profiling
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+DEFAULT_CONFIG = (6, 7, 4)
+DEFAULT_DEPTH = DIFFICULTY_DEPTHS['hard']  # Profondeur d'un "go" sans limite
+
+
+def format_score(score):
+    if score == float("inf"):
+        return "win"
+    if score == float("-inf"):
+        return "loss"
+    return f"{score:g}"
+
+
+class ProtocolEngine:
+    """
+    État du moteur entre deux commandes : configuration, position, cache et recherche en cours.
+
+    Args:
+        output (callable): Fonction recevant chaque ligne de réponse.
+        cache (PositionCache): Cache des recherches à profondeur fixe (en mémoire si None). Un cache fourni
+            peut être partagé avec d'autres outils (le jeu, get_ai_move) : newgame ne le vide pas.
+    """
+
+    def __init__(self, output, cache=None):
+        self.output = output
+        self.cache = cache if cache is not None else PositionCache(":memory:")
+        self.owns_cache = cache is None  # Seul le cache en mémoire propre au processus est vidé par newgame
+        self.rows, self.cols, self.win_condition = DEFAULT_CONFIG
+        self.moves = []
+        self.board = board_from_moves(self.rows, self.cols, self.moves)
+        self.seed = 0
+        self.stop_event = threading.Event()
+        self.search_thread = None
+
+    def handle(self, line):
+        """Exécute une commande ; retourne False pour "quit"."""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0].lower(), tokens[1:]
+        if command == 'quit':
+            self.stop()
+            return False
+
+        handler = getattr(self, f"cmd_{command}", None)
+        if handler is None:
+            self.output(f"error commande inconnue : {command}")
+            return True
+        try:
+            handler(args)
+        except ValueError as e:
+            self.output(f"error {e}")
+        return True
+
+    def wait(self):
+        """Attend la fin de la recherche en cours : les commandes qui modifient l'état peuvent être envoyées par lots."""
+        if self.search_thread is not None:
+            self.search_thread.join()
+            self.search_thread = None
+
+    def cmd_isready(self, args):
+        self.output("readyok")
+
+    def cmd_config(self, args):
+        self.wait()
+        if len(args) != 3:
+            raise ValueError("usage : config LIGNES COLONNES VICTOIRE")
+        rows, cols, win_condition = (int(value) for value in args)
+        if rows < 1 or cols < 1 or not 1 < win_condition <= max(rows, cols):
+            raise ValueError(f"configuration impossible : {rows}x{cols}, victoire {win_condition}")
+        self.rows, self.cols, self.win_condition = rows, cols, win_condition
+        self.moves = []
+        self.board = board_from_moves(rows, cols, [])
+
+    def cmd_position(self, args):
+        self.wait()
+        if len(args) == 1 and len(args[0]) > 1 and self.cols <= 10:
+            args = list(args[0])  # Notation accolée : un chiffre par coup
+        moves = [int(token) for token in args]
+        board = board_from_moves(self.rows, self.cols, moves)  # ValueError si un coup est impossible
+        if winning_move(board, PLAYER_PIECE, self.win_condition) or winning_move(board, AI_PIECE, self.win_condition):
+            raise ValueError("la partie est déjà terminée dans cette position")
+        self.moves, self.board = moves, board
+
+    def cmd_seed(self, args):
+        if len(args) != 1:
+            raise ValueError("usage : seed N")
+        self.seed = int(args[0])
+
+    def cmd_newgame(self, args):
+        self.wait()
+        if self.owns_cache:
+            self.cache.clear()
+
+    def cmd_go(self, args):
+        self.wait()
+        max_depth, movetime, max_nodes = None, None, None
+        infinite = False
+        tokens = iter(args)
+        for token in tokens:
+            if token == 'infinite':
+                infinite = True
+            elif token in ('depth', 'movetime', 'nodes'):
+                value = int(next(tokens, '0'))
+                if value <= 0:
+                    raise ValueError(f"valeur invalide pour {token}")
+                if token == 'depth':
+                    max_depth = value
+                elif token == 'movetime':
+                    movetime = value / 1000
+                else:
+                    max_nodes = value
+            else:
+                raise ValueError(f"option de go inconnue : {token}")
+
+        empty_cells = int(np.count_nonzero(self.board == 0))
+        if max_depth is None:
+            max_depth = empty_cells if (infinite or movetime or max_nodes) else DEFAULT_DEPTH
+        max_depth = min(max_depth, empty_cells)
+
+        self.stop_event.clear()
+        deadline = time.perf_counter() + movetime if movetime else None
+        limits = SearchLimits(deadline, max_nodes, self.stop_event)
+        self.search_thread = threading.Thread(target=self._search_thread, args=(max_depth, limits), daemon=True)
+        self.search_thread.start()
+
+    def cmd_stop(self, args):
+        self.stop()
+
+    def stop(self):
+        """Interrompt la recherche en cours et attend sa réponse "bestmove"."""
+        if self.search_thread is not None:
+            self.stop_event.set()
+            self.search_thread.join()
+            self.search_thread = None
+
+    def _side_to_move_view(self):
+        """minimax joue AI_PIECE : si c'est au joueur 1 de jouer, les pièces sont échangées."""
+        if len(self.moves) % 2 == 1:
+            return self.board.copy()
+        return np.where(self.board == PLAYER_PIECE, AI_PIECE,
+                        np.where(self.board == AI_PIECE, PLAYER_PIECE, 0)).astype(self.board.dtype)
+
+    def _search_thread(self, max_depth, limits):
+        with profiling.phase('search'):  # Phases propres à ce thread (profilage échantillonné)
+            self._search(max_depth, limits)
+
+    # Approfondissement itératif : une ligne "info" par profondeur terminée
+    def _search(self, max_depth, limits):
+        board = self._side_to_move_view()
+        rng = random.Random(self.seed)
+        stats = SearchStats()
+        start = time.perf_counter()
+        best = None  # (colonne, score, profondeur, pv)
+
+        if not get_valid_locations(board):
+            self.output("bestmove none")
+            return
+
+        for depth in range(1, max_depth + 1):
+            cached = self.cache.get(board, self.win_condition, depth, with_pv=True)
+            if cached is not None and cached[2]:
+                col, score, pv = cached
+            else:
+                # Position inconnue, ou enregistrée sans variation principale (par get_ai_move) : recherche
+                pv = []
+                try:
+                    col, score = minimax(board, depth, float("-inf"), float("inf"), True, self.win_condition,
+                                         limits=limits, stats=stats, rng=rng, pv=pv)
+                except SearchTimeout:
+                    break
+                pv = pv or [col]
+                self.cache.put(board, self.win_condition, depth, col, score, pv=pv)
+            best = (col, score, depth, pv)
+            elapsed = time.perf_counter() - start
+            self.output(f"info depth {depth} score {format_score(score)} nodes {stats.nodes} "
+                        f"nps {int(stats.nodes / elapsed) if elapsed > 0 else 0} time {int(elapsed * 1000)} "
+                        f"pv {' '.join(map(str, pv))}")
+            if score in (float("inf"), float("-inf")):
+                break  # Issue forcée : inutile d'aller plus profond
+
+        if best is None:
+            # Interrompue avant la fin de la première profondeur : coup de secours
+            best = (rng.choice(get_valid_locations(board)), 0, 0, [])
+        col, score, depth, pv = best
+        self.output(f"bestmove {col} score {format_score(score)} depth {depth} nodes {stats.nodes} "
+                    f"time {int((time.perf_counter() - start) * 1000)} pv {' '.join(map(str, pv or [col]))}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Moteur d'analyse Puissance X (protocole sur stdin/stdout)")
+    parser.add_argument('--cache', default=None, help="Cache persistant des recherches (en mémoire par défaut)")
+    args = parser.parse_args(argv)
+
+    lock = threading.Lock()  # Les lignes de la recherche et de la boucle principale ne s'entremêlent pas
+
+    def output(line):
+        with lock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    engine = ProtocolEngine(output, PositionCache(args.cache) if args.cache else None)
+    for line in sys.stdin:
+        if not engine.handle(line):
+            return
+    engine.wait()  # Fin de l'entrée : la dernière recherche se termine normalement
+
+
+if __name__ == "__main__":
+    main()
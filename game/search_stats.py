@@ -0,0 +1,79 @@
+# Mettre à False pour que get_ai_move ignore tout comptage (les SearchStats transmis restent à zéro), y compris
+# depuis Engine.best_move, les moteurs 'minimax' des tournois et le serveur d'analyse qui passent par lui. Les
+# fonctions de recherche appelées directement (minimax, anytime_search, Engine.search / multi_pv, large_minimax,
+# get_large_move, protocole texte) ignorent ce drapeau et comptent dans tout SearchStats reçu : pour ne rien
+# compter, ne pas leur en transmettre.
+ENABLED = True
+
+# Compteurs additionnés par merge (les autres champs prennent le maximum)
+SUMMED_FIELDS = ('nodes', 'leaf_evaluations', 'ordering_evaluations', 'win_checks', 'beta_cutoffs',
+                 'first_move_cutoffs', 'cache_hits', 'cache_misses', 'tt_hits', 'elapsed', 'searches')
+MAX_FIELDS = ('depth', 'max_depth')
+
+
+class SearchStats:
+    """
+    Compteurs d'une recherche de l'IA.
+
+    Un objet SearchStats n'est rempli que s'il est transmis à get_ai_move / minimax :
+    sans lui, la recherche ne fait aucun comptage. Plusieurs objets peuvent être cumulés
+    avec merge (par exemple toutes les recherches d'un niveau de difficulté lors d'un tournoi).
+    """
+
+    def __init__(self):
+        self.nodes = 0  # Nœuds visités par minimax
+        self.leaf_evaluations = 0  # Appels à score_position sur les feuilles
+        self.ordering_evaluations = 0  # Appels à score_simulated_move pour ordonner les coups
+        self.win_checks = 0  # Appels à winning_move
+        self.beta_cutoffs = 0  # Élagages alpha-bêta (boucle des coups interrompue)
+        self.first_move_cutoffs = 0  # Élagages provoqués dès le premier coup examiné
+        self.depth = 0  # Profondeur atteinte (dernière itération terminée)
+        self.max_depth = 0  # Demi-coup le plus profond visité
+        self.cache_hits = 0  # Positions trouvées dans le cache
+        self.cache_misses = 0  # Positions absentes du cache
+        self.tt_hits = 0  # Nœuds résolus par la table de transposition d'un Engine
+        self.elapsed = 0.0  # Durée de la recherche en secondes
+        self.searches = 0  # Nombre d'appels à get_ai_move comptabilisés
+
+    def nodes_per_second(self):
+        """Nombre de nœuds visités par seconde (0 si la durée est nulle)."""
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def cache_hit_rate(self):
+        """Proportion des consultations du cache ayant trouvé la position (None si aucune consultation)."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else None
+
+    def first_move_cutoff_rate(self):
+        """
+        Proportion des élagages obtenus dès le premier coup examiné (None si aucun élagage).
+        Proche de 1, elle indique un bon ordonnancement des coups.
+        """
+        return self.first_move_cutoffs / self.beta_cutoffs if self.beta_cutoffs else None
+
+    def merge(self, other):
+        """Ajoute les compteurs d'un autre SearchStats à celui-ci et le retourne."""
+        for field in SUMMED_FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        for field in MAX_FIELDS:
+            setattr(self, field, max(getattr(self, field), getattr(other, field)))
+        return self
+
+    def to_dict(self):
+        """Compteurs et taux dérivés, sérialisables en JSON."""
+        data = {field: getattr(self, field) for field in SUMMED_FIELDS + MAX_FIELDS}
+        data['nodes_per_second'] = self.nodes_per_second()
+        data['first_move_cutoff_rate'] = self.first_move_cutoff_rate()
+        data['cache_hit_rate'] = self.cache_hit_rate()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit un SearchStats à partir de to_dict (les taux dérivés sont ignorés)."""
+        stats = cls()
+        for field in SUMMED_FIELDS + MAX_FIELDS:
+            setattr(stats, field, data.get(field, 0))
+        return stats
+
+    def __repr__(self):
+        return f"SearchStats({', '.join(f'{field}={getattr(self, field)}' for field in SUMMED_FIELDS + MAX_FIELDS)})"
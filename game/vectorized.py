@@ -0,0 +1,205 @@
+"""
+Évaluation vectorisée d'une pile de plateaux (N x lignes x colonnes).
+
+Les fenêtres de 4 cases de score_position et les alignements gagnants de winning_move sont précalculés une
+fois par configuration sous forme de tables d'indices dans le plateau aplati : une seule indexation NumPy
+extrait alors toutes les fenêtres de tous les plateaux. Les résultats sont identiques à ceux des fonctions
+scalaires de game/ai.py et game/game_logic.py.
+"""
+import functools
+import numpy as np
+from settings.game_constants import PLAYER_PIECE, AI_PIECE, WINDOW_LENGTH
+
+CHUNK_SIZE = 16384  # Plateaux traités par indexation (borne la mémoire des fenêtres extraites)
+FEATURE_KEYS = ("four", "three", "two", "opp_three", "center")  # Colonnes de position_features
+
+
+def _lines(rows, cols, length):
+    """Indices aplatis de tous les segments de `length` cases, dans l'ordre de parcours de score_position."""
+    lines = []
+    for r in range(rows):  # Horizontales
+        for c in range(cols - length + 1):
+            lines.append([r * cols + c + i for i in range(length)])
+    for c in range(cols):  # Verticales
+        for r in range(rows - length + 1):
+            lines.append([(r + i) * cols + c for i in range(length)])
+    for r in range(rows - length + 1):  # Diagonales ↘
+        for c in range(cols - length + 1):
+            lines.append([(r + i) * cols + c + i for i in range(length)])
+    for r in range(length - 1, rows):  # Diagonales ↙
+        for c in range(cols - length + 1):
+            lines.append([(r - i) * cols + c + i for i in range(length)])
+    return np.array(lines, dtype=np.intp).reshape(len(lines), length)
+
+
+class LineTables:
+    """
+    Tables d'indices d'une configuration de plateau.
+
+    Attributes:
+        windows (ndarray): Fenêtres d'évaluation (W x 4).
+        win_lines (ndarray): Alignements gagnants (L x win_condition).
+        center (ndarray): Cases de la colonne centrale.
+    """
+
+    def __init__(self, rows, cols, win_condition):
+        self.rows = rows
+        self.cols = cols
+        self.win_condition = win_condition
+        self.windows = _lines(rows, cols, WINDOW_LENGTH)
+        self.win_lines = _lines(rows, cols, win_condition)
+        self.center = np.arange(rows, dtype=np.intp) * cols + cols // 2
+
+
+@functools.lru_cache(maxsize=None)
+def line_tables(rows, cols, win_condition):
+    return LineTables(rows, cols, win_condition)
+
+
+@functools.lru_cache(maxsize=64)
+def _window_scores(weights_items):
+    """
+    Score d'une fenêtre selon son nombre de pièces du joueur évalué et de son adversaire (table 5 x 5),
+    mêmes règles qu'evaluate_window.
+    """
+    weights = dict(weights_items)
+    table = np.zeros((WINDOW_LENGTH + 1, WINDOW_LENGTH + 1))
+    for own in range(WINDOW_LENGTH + 1):
+        for opp in range(WINDOW_LENGTH + 1 - own):
+            empty = WINDOW_LENGTH - own - opp
+            score = 0
+            if own == 4:
+                score += weights["four"]
+            elif own == 3 and empty == 1:
+                score += weights["three"]
+            elif own == 2 and empty == 2:
+                score += weights["two"]
+            if opp == 3 and empty == 1:
+                score += weights["opp_three"]
+            table[own, opp] = score
+    return table
+
+
+def _score_pieces(boards, pieces, weights):
+    """Scores de chaque plateau pour chacune des pièces demandées (une seule extraction des fenêtres)."""
+    count, rows, cols = boards.shape
+    tables = line_tables(rows, cols, WINDOW_LENGTH)
+    table = _window_scores(tuple(sorted(weights.items())))
+    flat = boards.reshape(count, rows * cols)
+    scores = [np.empty(count) for _ in pieces]
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = flat[start:start + CHUNK_SIZE]
+        center = chunk[:, tables.center]
+        if len(tables.windows):
+            windows = chunk[:, tables.windows]
+            counts = {PLAYER_PIECE: np.count_nonzero(windows == PLAYER_PIECE, axis=2),
+                      AI_PIECE: np.count_nonzero(windows == AI_PIECE, axis=2)}
+        for result, piece in zip(scores, pieces):
+            score = np.count_nonzero(center == piece, axis=1) * float(weights["center"])
+            if len(tables.windows):
+                opp_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
+                score = score + table[counts[piece], counts[opp_piece]].sum(axis=1)
+            result[start:start + CHUNK_SIZE] = score
+    return scores
+
+
+def score_positions(boards, piece, weights):
+    """
+    Équivalent vectorisé de score_position pour une pile de plateaux.
+
+    Args:
+        boards (ndarray): Plateaux (N x lignes x colonnes) ne contenant que 0, PLAYER_PIECE et AI_PIECE.
+        piece (int): Pièce du joueur évalué.
+        weights (dict): Poids de l'évaluation (mêmes clés que DEFAULT_WEIGHTS).
+
+    Returns:
+        ndarray: Score de chaque plateau (float64, N).
+    """
+    return _score_pieces(boards, (piece,), weights)[0]
+
+
+def score_positions_both(boards, weights):
+    """
+    Scores des deux joueurs pour une pile de plateaux, les fenêtres n'étant extraites qu'une fois.
+
+    Returns:
+        tuple: (scores pour PLAYER_PIECE, scores pour AI_PIECE).
+    """
+    player_scores, ai_scores = _score_pieces(boards, (PLAYER_PIECE, AI_PIECE), weights)
+    return player_scores, ai_scores
+
+
+def position_features(boards, piece):
+    """
+    Termes de score_position pour une pile de plateaux : le score vaut features @ [poids de FEATURE_KEYS].
+
+    Args:
+        boards (ndarray): Plateaux (N x lignes x colonnes).
+        piece (int): Pièce du joueur évalué.
+
+    Returns:
+        ndarray: Pour chaque plateau (N x 5, float64) : fenêtres de 4 pièces du joueur, de 3 pièces et une case
+        vide, de 2 pièces et deux cases vides, de 3 pièces adverses et une case vide, et pièces du joueur dans
+        la colonne centrale.
+    """
+    count, rows, cols = boards.shape
+    tables = line_tables(rows, cols, WINDOW_LENGTH)
+    opp_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
+    flat = boards.reshape(count, rows * cols)
+    features = np.zeros((count, len(FEATURE_KEYS)))
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = flat[start:start + CHUNK_SIZE]
+        result = features[start:start + CHUNK_SIZE]
+        result[:, 4] = np.count_nonzero(chunk[:, tables.center] == piece, axis=1)
+        if len(tables.windows):
+            windows = chunk[:, tables.windows]
+            own = np.count_nonzero(windows == piece, axis=2)
+            opp = np.count_nonzero(windows == opp_piece, axis=2)
+            result[:, 0] = np.count_nonzero(own == WINDOW_LENGTH, axis=1)
+            result[:, 1] = np.count_nonzero((own == WINDOW_LENGTH - 1) & (opp == 0), axis=1)
+            result[:, 2] = np.count_nonzero((own == WINDOW_LENGTH - 2) & (opp == 0), axis=1)
+            result[:, 3] = np.count_nonzero((opp == WINDOW_LENGTH - 1) & (own == 0), axis=1)
+    return features
+
+
+def winning_mask(boards, piece, win_condition):
+    """
+    Équivalent vectorisé de winning_move.
+
+    Returns:
+        ndarray: True pour chaque plateau (N) où `piece` aligne `win_condition` pièces.
+    """
+    count, rows, cols = boards.shape
+    lines = line_tables(rows, cols, win_condition).win_lines
+    if len(lines) == 0:
+        return np.zeros(count, dtype=bool)
+    flat = boards.reshape(count, rows * cols)
+    won = np.empty(count, dtype=bool)
+    for start in range(0, count, CHUNK_SIZE):
+        won[start:start + CHUNK_SIZE] = np.all(flat[start:start + CHUNK_SIZE][:, lines] == piece, axis=2).any(axis=1)
+    return won
+
+
+def play_columns(boards, cols, piece):
+    """
+    Joue un coup par plateau (colonnes supposées jouables).
+
+    Args:
+        boards (ndarray): Plateaux (N x lignes x colonnes), copiés.
+        cols (ndarray): Colonne jouée sur chaque plateau.
+        piece (int): Pièce posée.
+
+    Returns:
+        ndarray: Nouveaux plateaux.
+    """
+    children = boards.copy()
+    index = np.arange(len(children))
+    # Les cases vides d'une colonne sont en haut : la prochaine ligne libre est leur nombre moins un
+    rows = np.count_nonzero(children[index, :, cols] == 0, axis=1) - 1
+    children[index, rows, cols] = piece
+    return children
+
+
+def child_boards(board, cols, piece):
+    """Plateaux obtenus en jouant `piece` dans chacune des colonnes `cols` (supposées jouables) de `board`."""
+    return play_columns(np.repeat(board[np.newaxis], len(cols), axis=0), np.asarray(cols, dtype=np.intp), piece)
@@ -1,4 +1,6 @@
+import time
 import pygame
+from game import profiling
 from menu.main_menu import MainMenu
 from settings.constants import *
 from settings.settings_screen import SettingsScreen
@@ -27,6 +29,9 @@ class Game:
         pygame.display.set_caption("Puissance X") # Titre du jeu 
         
         self.clock = pygame.time.Clock() # Contrôle le framerate pour éviter les latences
+        self.event_driven = EVENT_DRIVEN_RENDERING # Rendu uniquement quand l'écran change (CPU au repos)
+        self.needs_redraw = True # Un évènement ou un changement d'écran impose de redessiner
+        self.waited_event = None # Évènement reçu pendant l'attente, traité au prochain tour de boucle
         self.current_screen = "menu" # Ecran actuelle (menu principal au lancement)
         self.game_mode = None # Mode de jeu actuel
         
@@ -80,7 +85,14 @@ class Game:
         - Interaction avec les boutons/menu
         - Propagation des événements à l'écran actif
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.waited_event is not None:
+            events.insert(0, self.waited_event) # Évènement qui a réveillé la boucle, traité en premier
+            self.waited_event = None
+        if events:
+            self.needs_redraw = True
+
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False # Ferme le jeu si l'on clique sur la croix (éviter la fermeture brut)
             
@@ -112,9 +124,12 @@ class Game:
     def draw_current_screen(self):
         """
         Dessine l'écran actuel (Menu, Configuration ou Jeu) en appelant les méthodes draw() de chaque classe.
+        Chaque écran remplit lui-même son fond noir.
+
+        Returns:
+            list or None: Rectangles modifiés (rendu incrémental de l'écran de jeu), ou None si
+            tout l'écran doit être rafraîchi.
         """
-        self.screen.fill(BLACK) # Tous les écrans ont un fond noir (actuellement)
-        
         # Appel de la méthode draw() au différentes classes
         if self.current_screen == "menu":
             self.main_menu.draw(self.screen)
@@ -123,12 +138,35 @@ class Game:
                 self.settings_screen.draw(self.screen)
         elif self.current_screen == "game":
             if self.game_screen:
-                self.game_screen.draw(self.screen)
+                return self.game_screen.draw(self.screen)
         elif self.current_screen == "credits":
             if self.credits_screen:
                 self.credits_screen.draw(self.screen)
+        return None
 
     
+    def current_screen_needs_redraw(self):
+        """
+        Indique si l'écran actuel a des changements à afficher sans évènement utilisateur
+        (ex : coup de l'IA). Les écrans sans méthode needs_redraw() sont statiques.
+        """
+        screens = {
+            "menu": self.main_menu,
+            "settings": getattr(self, "settings_screen", None),
+            "game": self.game_screen,
+            "credits": self.credits_screen,
+        }
+        screen = screens.get(self.current_screen)
+        return screen is not None and hasattr(screen, "needs_redraw") and screen.needs_redraw()
+
+    def wait_for_event(self):
+        """Bloque jusqu'au prochain évènement (ou IDLE_WAIT_TIMEOUT) quand rien n'est à redessiner"""
+        if self.needs_redraw or self.current_screen_needs_redraw() or pygame.event.peek():
+            return
+        event = pygame.event.wait(IDLE_WAIT_TIMEOUT)
+        if event.type != pygame.NOEVENT:
+            self.waited_event = event
+
     def update(self):
         """
         Mise à jour de la logique du jeu. Actuellement vide mais peut servir à ajouter des fonctionnalités comme des sauvegardes.
@@ -157,15 +195,32 @@ class Game:
 
     def run(self):
         """
-        Boucle principale non bloquante.
+        Boucle principale.
         Gère les événements, met à jour la logique, et redessine les écrans.
+        En mode évènementiel (EVENT_DRIVEN_RENDERING), l'écran n'est redessiné qu'après un évènement
+        ou si l'écran actuel le demande ; sinon la boucle dort dans pygame.event.wait().
         """
         while self.running:
-            self.handle_events()
+            frame_start = time.perf_counter()
+            with profiling.phase('events'):
+                self.handle_events()
             self.update()
-            self.draw_current_screen()
-            pygame.display.flip() # Rafraîchit l'affichage (évitant des latences)
-            self.clock.tick(FPS) # Limite le framerate (évitant des latences également)
+            if not self.event_driven or self.needs_redraw or self.current_screen_needs_redraw():
+                self.needs_redraw = False
+                with profiling.phase('rendering'):
+                    dirty_rects = self.draw_current_screen()
+                    if dirty_rects is None:
+                        pygame.display.flip() # Rafraîchit tout l'affichage
+                    elif dirty_rects:
+                        pygame.display.update(dirty_rects) # Rafraîchit uniquement les zones modifiées
+
+                # Temps de travail de l'image (hors attente), mesuré seulement si le HUD est affiché
+                if self.current_screen == "game" and self.game_screen and self.game_screen.hud.visible:
+                    self.game_screen.hud.record_frame((time.perf_counter() - frame_start) * 1000)
+            with profiling.phase('idle'):
+                self.clock.tick(FPS) # Limite le framerate (évitant des latences également)
+                if self.event_driven:
+                    self.wait_for_event()
         
         pygame.quit() # Quit Pygame avant la fermeture de la fenêtre (si self.running devient false, éviter la manière brut)
 
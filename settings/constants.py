@@ -5,6 +5,8 @@ from typing import Tuple
 BASE_WIDTH = 1280
 BASE_HEIGHT = 720
 FPS = 60 # Images par secodne pour le rafraichissement (inutile retiré après la deuxième version)
+EVENT_DRIVEN_RENDERING = True # Si True, la boucle principale dort en attendant un évènement quand rien ne change à l'écran
+IDLE_WAIT_TIMEOUT = 500 # Attente maximale (ms) d'un évènement avant de revérifier l'écran (les timers comme AI_MOVE_EVENT réveillent la boucle)
 
 # Colors
 BLACK = (0, 0, 0) # Utilisé pour le fond d'écran
@@ -29,19 +31,15 @@ TEXT_MARGIN = 0.02  # 2% d'espace entre les élément
 RED = (255, 0, 0)      # Pion joueur
 YELLOW = (255, 255, 0) # Pion IA
 
-# Pièces
-PLAYER_PIECE = 1
-AI_PIECE = 2
-EMPTY = 2
-
-# Configuration IA
-WINDOW_LENGTH = 4  # Pour Puissance 4
+# Pièces et configuration IA (définies sans pygame pour le moteur et les tournois)
+from settings.game_constants import *
 
 # Fonts
 pygame.font.init() # Intialisation du module "font" de pygame
 TITLE_FONT = pygame.font.Font(None, 72)  # Choisir une police et une taille pour le texte
 BUTTON_FONT = pygame.font.Font(None, 36)  # Choisir une police et une taille pour le texte
 SETTINGS_FONT = pygame.font.Font(None, 24)  # Choisir une police et une taille pour le texte
+SLIDER_FONT = pygame.font.SysFont(None, 30)  # Valeur affichée sur le curseur des sliders
 
 AI_DELAY = 1000  # en millisecondes (1 seconde)
 AI_MOVE_EVENT = pygame.USEREVENT + 1  # Événement personnalisé
\ No newline at end of file
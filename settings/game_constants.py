@@ -0,0 +1,11 @@
+# Constantes du moteur de jeu, sans dépendance à pygame.
+# Le moteur (game.ai, game.game_logic) et les tournois n'importent que ce module :
+# les processus de calcul démarrent sans charger pygame ni ses polices.
+
+# Pièces
+PLAYER_PIECE = 1
+AI_PIECE = 2
+EMPTY = 2
+
+# Configuration IA
+WINDOW_LENGTH = 4  # Pour Puissance 4
@@ -0,0 +1,53 @@
+# Les scores écrits par l'analyse d'après-partie sont ceux de score_moves sur chaque position rejouée, y compris
+# quand les positions symétriques sont regroupées (nombre impair de colonnes) ou ne doivent pas l'être (pair)
+import gzip
+import json
+import numpy as np
+from game.ai import score_moves
+from game.game_logic import drop_piece, get_next_open_row
+from tournament.blunder_analysis import run, encode_score
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+DEPTH = 3
+GAMES = [
+    ((6, 6, 4), [0, 3, 0, 2, 5, 2, 3, 1]),
+    ((6, 6, 4), [5, 2, 5, 3, 0, 3, 2, 4]),  # Symétrique du précédent
+    ((6, 7, 4), [0, 3, 0, 2, 6, 4, 3]),
+    ((6, 7, 4), [6, 3, 6, 4, 0, 2, 3]),  # Symétrique du précédent
+    ((8, 8, 4), [3, 4, 4, 3, 7, 0]),
+]
+
+
+def direct_scores(board_config, moves):
+    rows, cols, win_condition = board_config
+    grid = np.zeros((rows, cols))
+    player = PLAYER_PIECE
+    expected = []
+    for col in moves:
+        view = grid if player == AI_PIECE else np.where(grid == PLAYER_PIECE, AI_PIECE,
+                                                         np.where(grid == AI_PIECE, PLAYER_PIECE, 0))
+        scores = score_moves(view[np.newaxis], win_condition, DEPTH)[0]
+        expected.append([None if np.isnan(score) else float(score) for score in scores])
+        drop_piece(grid, get_next_open_row(grid, col), col, player)
+        player = 3 - player
+    return expected
+
+
+def test_analysis_matches_score_moves_on_each_position(tmp_path):
+    games = [{'board': {'rows': rows, 'cols': cols, 'win_condition': win}, 'engine1': 'a', 'engine2': 'b',
+              'starting_player': PLAYER_PIECE, 'moves': moves, 'winner': 0}
+             for (rows, cols, win), moves in GAMES]
+    input_path, output_path = tmp_path / 'games.json', tmp_path / 'blunders.jsonl.gz'
+    input_path.write_text(json.dumps({'games': games}))
+    run(str(input_path), str(output_path), DEPTH, 50, (6, 7, 4), 0, verbose=False)
+
+    with gzip.open(output_path, 'rt') as f:
+        records = [json.loads(line) for line in f][1:]
+    assert len(records) == len(GAMES)
+    for record, (board_config, moves) in zip(records, GAMES):
+        expected = direct_scores(board_config, moves)
+        for (ply, _, col, score, best_col, best_score, _), column_scores in zip(record['evaluations'], expected):
+            playable = [c for c, value in enumerate(column_scores) if value is not None]
+            assert score == encode_score(column_scores[col]), (board_config, ply)
+            assert best_col == max(playable, key=lambda c: column_scores[c]), (board_config, ply)
+            assert best_score == encode_score(column_scores[best_col]), (board_config, ply)
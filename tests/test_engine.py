@@ -0,0 +1,45 @@
+# Scores de l'Engine face à minimax quand la table de la session connaît déjà des positions plus profondément
+import random
+import numpy as np
+from game.ai import minimax, get_next_open_row, simulate_move, undo_move, DEFAULT_WEIGHTS
+from game.engine import Engine
+from game.game_logic import drop_piece
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+MOVES = [3, 3, 2, 4, 4, 2]
+
+
+def middle_game_board():
+    board = np.zeros((6, 7))
+    piece = PLAYER_PIECE
+    for col in MOVES:
+        drop_piece(board, get_next_open_row(board, col), col, piece)
+        piece = 3 - piece
+    return board
+
+
+def minimax_child_score(board, col, depth):
+    row = get_next_open_row(board, col)
+    simulate_move(board, row, col, AI_PIECE)
+    score = minimax(board, depth - 1, float("-inf"), float("inf"), False, 4, rng=random.Random(0))[1]
+    undo_move(board, row, col)
+    return score
+
+
+def test_multi_pv_after_deeper_search_keeps_requested_depth():
+    board = middle_game_board()
+    engine = Engine(6, 7, 4)
+    engine.multi_pv(board, 5, rng=random.Random(0))
+    for depth in (1, 2, 3):
+        for col, score, _ in engine.multi_pv(board, depth, rng=random.Random(0)):
+            assert score == minimax_child_score(board, col, depth), (depth, col)
+
+
+def test_search_with_other_weights_ignores_session_table():
+    board = middle_game_board()
+    engine = Engine(6, 7, 4)
+    engine.best_move(board, 'hard', depth=4, rng=random.Random(0))
+    weights = {**DEFAULT_WEIGHTS, 'three': 1000}
+    expected = minimax(board.copy(), 4, float("-inf"), float("inf"), True, 4, weights, rng=random.Random(0))[1]
+    score = engine.search(board, 4, float("-inf"), float("inf"), True, 4, weights, rng=random.Random(0))[1]
+    assert score == expected
@@ -0,0 +1,39 @@
+# Une recherche interrompue par ses limites (délai, nœuds) ne doit pas laisser de pièces simulées sur le plateau
+import numpy as np
+from game.ai import iterative_deepening, get_ai_move, SearchLimits
+from game.game_logic import drop_piece, get_next_open_row
+from tournament.scheduler import engine_move
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+
+def middle_game_board():
+    board = np.zeros((6, 7))
+    for col, piece in [(3, PLAYER_PIECE), (3, AI_PIECE), (2, PLAYER_PIECE), (4, AI_PIECE), (4, PLAYER_PIECE)]:
+        drop_piece(board, get_next_open_row(board, col), col, piece)
+    return board
+
+
+def test_interrupted_iterative_deepening_restores_board():
+    board = middle_game_board()
+    original = board.copy()
+    limits = SearchLimits(max_nodes=50)  # Interrompt la deuxième itération en plein milieu
+    col, _ = iterative_deepening(board, 8, 4, limits=limits)
+    assert limits.nodes > 50
+    assert col is not None
+    assert np.array_equal(board, original)
+
+
+def test_timed_get_ai_move_leaves_grid_unchanged():
+    board = middle_game_board()
+    original = board.copy()
+    get_ai_move(board, 'hard', 4, depth=8, time_budget=0.01)
+    assert np.array_equal(board, original)
+
+
+def test_timed_engine_leaves_tournament_grid_unchanged():
+    engine = {'name': 'depth8-10ms', 'depth': 8, 'time_budget': 0.01}
+    for piece in (AI_PIECE, PLAYER_PIECE):
+        board = middle_game_board()
+        original = board.copy()
+        engine_move(engine, board, piece, 4)
+        assert np.array_equal(board, original)
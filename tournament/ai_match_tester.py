@@ -1,17 +1,47 @@
 # Importation des bibliothèques nécessaires
+import os  # Pour l'écriture atomique et la suppression du fichier de reprise
+import time  # Pour mesurer la durée de réflexion de chaque coup
+import random  # Générateurs aléatoires de l'IA (un par match si une graine est fixée)
+import argparse  # Pour les options en ligne de commande (--resume, --seed, ...)
 import numpy as np  # Pour la manipulation de la grille sous forme de matrice
 import json  # Pour sauvegarder les résultats des matchs au format JSON
 from game.game_logic import winning_move, get_next_open_row, drop_piece, is_valid_location  # Fonctions de logique du jeu
-from game.ai import get_ai_move  # Fonction qui calcule le coup de l'IA en fonction de la difficulté
+from game.engine import Engine  # Session de l'IA : tables de recherche conservées pendant un match
+from game.position_cache import PositionCache  # Cache persistant des recherches
+from game.search_stats import SearchStats  # Compteurs de recherche cumulés par difficulté
+from game import profiling  # Profilage optionnel (--profile)
+
+# Duels joués par défaut lors d'un tournoi
+MATCHUPS = [
+    ('easy', 'easy'),
+    ('medium', 'medium'),
+    ('hard', 'hard'),
+    ('easy', 'medium'),
+    ('easy', 'hard'),
+    ('medium', 'hard')
+]
+
+CHECKPOINT_FILE = 'tournament_checkpoint.json'  # Fichier de reprise par défaut
+RESULTS_FILE = 'match_results.json'  # Fichier des résultats finaux
 
 # Classe pour simuler et évaluer des matchs entre IA de différents niveaux de difficulté
 class AIMatchTester:
-    def __init__(self, rows=6, cols=7, win_condition=4, num_games=50):
+    def __init__(self, rows=6, cols=7, win_condition=4, num_games=50, seed=None,
+                 checkpoint_path=None, checkpoint_interval=10, cache=None, collect_stats=False,
+                 record_latency=False):
         # Paramètres du plateau de jeu
         self.rows = rows
         self.cols = cols
         self.win_condition = win_condition
         self.num_games = num_games  # Nombre de matchs par duel de difficultés
+        self.seed = seed  # Graine dont dérive le générateur de chaque match (None = non reproductible)
+        self.cache = cache  # Cache persistant des recherches (PositionCache), désactivé si None
+        self.collect_stats = collect_stats  # Cumuler les compteurs de recherche par difficulté
+        self.record_latency = record_latency  # Conserver la durée de chaque coup par difficulté
+
+        # Points de reprise : chemin du fichier et nombre de matchs entre deux sauvegardes
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
 
         # Historique complet des matchs
         self.match_history = []
@@ -23,99 +53,284 @@ class AIMatchTester:
             'hard': {'wins': 0, 'losses': 0, 'draws': 0}
         }
 
+        # Compteurs de recherche cumulés par niveau de difficulté (si collect_stats)
+        self.search_stats = {difficulty: SearchStats() for difficulty in self.performance}
+
+        # Durée de réflexion (en secondes) de chaque coup, par niveau de difficulté (si record_latency)
+        self.move_latencies = {difficulty: [] for difficulty in self.performance}
+
+        # Avancement du tournoi : résultats des duels terminés et position dans le duel en cours
+        self.matchup_results = []  # Liste de [p1_wins, p2_wins, draws] par duel terminé
+        self.current_matchup = 0  # Indice du duel en cours dans MATCHUPS
+        self.current_counts = [0, 0, 0]  # Compteurs (p1_wins, p2_wins, draws) du duel en cours
+        self.next_match_index = 0  # Prochain match à jouer dans le duel en cours
+        self.games_since_checkpoint = 0
+
+    # Générateur aléatoire propre à un match, dérivé de la graine du tournoi (None sans graine) :
+    # chaque match est reproductible indépendamment de l'ordre d'exécution des autres
+    def game_rng(self, difficulty1, difficulty2, match_index):
+        if self.seed is None:
+            return None
+        return random.Random(f"{self.seed}:{self.rows}x{self.cols}/{self.win_condition}:"
+                             f"{difficulty1}:{difficulty2}:{match_index}")
+
+    # Sessions de l'IA d'un match, une par joueur : chacune est informée de tous les coups joués
+    def new_engines(self):
+        return {turn: Engine(self.rows, self.cols, self.win_condition, cache=self.cache) for turn in (1, 2)}
+
+    # Fonction qui retourne le coup de l'IA d'une difficulté donnée avec la session `engine`
+    # (utilisée aussi par tournament.replay)
+    def choose_move(self, grid, difficulty, engine, rng=None):
+        stats = self.search_stats[difficulty] if self.collect_stats else None
+        start = time.perf_counter()
+        col = engine.best_move(grid, difficulty, stats=stats, rng=rng)
+        if self.record_latency:
+            self.move_latencies[difficulty].append(time.perf_counter() - start)
+        return col
+
+    # Fonction qui simule un seul match entre deux IA et retourne son enregistrement
+    def play_game(self, difficulty1, difficulty2, match_index):
+        grid = np.zeros((self.rows, self.cols))  # Plateau vide
+        rng = self.game_rng(difficulty1, difficulty2, match_index)
+        game_over = False
+        turn = 1 if match_index % 2 == 0 else 2  # Alterner le joueur qui commence
+        engines = self.new_engines()
+
+        moves = []  # Historique des coups de ce match
+
+        while not game_over:
+            # Sélection de la difficulté selon le joueur actif
+            current_difficulty = difficulty1 if turn == 1 else difficulty2
+            col = self.choose_move(grid, current_difficulty, engines[turn], rng)  # Coup joué par l'IA
+
+            if is_valid_location(grid, col):  # Vérifie si la colonne est jouable
+                row = get_next_open_row(grid, col)  # Ligne disponible dans la colonne
+                drop_piece(grid, row, col, turn)  # Place le jeton du joueur
+                for engine in engines.values():
+                    engine.play(col, turn)
+                moves.append({'player': turn, 'row': row, 'col': col})  # Enregistre le coup
+
+                # Vérifie si le joueur courant a gagné
+                if winning_move(grid, turn, self.win_condition):
+                    game_over = True
+                    winner = turn
+                elif np.all(grid != 0):  # Grille pleine → match nul
+                    game_over = True
+                    winner = 0
+                else:
+                    turn = 2 if turn == 1 else 1  # Changement de joueur
+            else:
+                # Cas rare : coup invalide (erreur IA)
+                winner = 0
+                break
+
+        return {
+            'match_index': match_index,
+            'difficulty1': difficulty1,
+            'difficulty2': difficulty2,
+            'starting_player': 1 if match_index % 2 == 0 else 2,
+            'winner': winner,
+            'moves': moves,
+            'final_grid': grid.tolist()
+        }
+
     # Fonction qui simule une série de matchs entre deux IA de difficulté donnée
+    # (reprend au match self.next_match_index si un point de reprise a été chargé)
     def run_match(self, difficulty1, difficulty2):
-        wins_p1 = 0
-        wins_p2 = 0
-        draws = 0
+        wins_p1, wins_p2, draws = self.current_counts
 
         # Simulation des matchs
-        for match_index in range(self.num_games):
-            grid = np.zeros((self.rows, self.cols))  # Plateau vide
-            game_over = False
-            turn = 1 if match_index % 2 == 0 else 2  # Alterner le joueur qui commence
-
-            moves = []  # Historique des coups de ce match
-
-            while not game_over:
-                # Sélection de la difficulté selon le joueur actif
-                current_difficulty = difficulty1 if turn == 1 else difficulty2
-                col = get_ai_move(grid, current_difficulty, self.win_condition)  # Coup joué par l'IA
-
-                if is_valid_location(grid, col):  # Vérifie si la colonne est jouable
-                    row = get_next_open_row(grid, col)  # Ligne disponible dans la colonne
-                    drop_piece(grid, row, col, turn)  # Place le jeton du joueur
-                    moves.append({'player': turn, 'row': row, 'col': col})  # Enregistre le coup
-
-                    # Vérifie si le joueur courant a gagné
-                    if winning_move(grid, turn, self.win_condition):
-                        if turn == 1:
-                            wins_p1 += 1
-                            self.performance[difficulty1]['wins'] += 1
-                            self.performance[difficulty2]['losses'] += 1
-                        else:
-                            wins_p2 += 1
-                            self.performance[difficulty2]['wins'] += 1
-                            self.performance[difficulty1]['losses'] += 1
-                        game_over = True
-                        winner = turn
-                    elif np.all(grid != 0):  # Grille pleine → match nul
-                        draws += 1
-                        self.performance[difficulty1]['draws'] += 1
-                        self.performance[difficulty2]['draws'] += 1
-                        game_over = True
-                        winner = 0
-                    else:
-                        turn = 2 if turn == 1 else 1  # Changement de joueur
-                else:
-                    # Cas rare : coup invalide (erreur IA)
-                    draws += 1
-                    self.performance[difficulty1]['draws'] += 1
-                    self.performance[difficulty2]['draws'] += 1
-                    winner = 0
-                    break
+        for match_index in range(self.next_match_index, self.num_games):
+            record = self.play_game(difficulty1, difficulty2, match_index)
+            winner = record['winner']
+
+            if winner == 1:
+                wins_p1 += 1
+                self.performance[difficulty1]['wins'] += 1
+                self.performance[difficulty2]['losses'] += 1
+            elif winner == 2:
+                wins_p2 += 1
+                self.performance[difficulty2]['wins'] += 1
+                self.performance[difficulty1]['losses'] += 1
+            else:
+                draws += 1
+                self.performance[difficulty1]['draws'] += 1
+                self.performance[difficulty2]['draws'] += 1
 
             # Enregistrement du match dans l'historique
-            self.match_history.append({
-                'match_index': match_index,
-                'difficulty1': difficulty1,
-                'difficulty2': difficulty2,
-                'starting_player': 1 if match_index % 2 == 0 else 2,
-                'winner': winner,
-                'moves': moves,
-                'final_grid': grid.tolist()
-            })
+            self.match_history.append(record)
+
+            # Mise à jour de l'avancement puis sauvegarde périodique
+            self.current_counts = [wins_p1, wins_p2, draws]
+            self.next_match_index = match_index + 1
+            self.games_since_checkpoint += 1
+            if self.games_since_checkpoint >= self.checkpoint_interval:
+                self.save_checkpoint()
 
         return wins_p1, wins_p2, draws
 
+    # Fonction qui écrit l'état complet du tournoi (matchs, compteurs, état du générateur aléatoire global,
+    # utilisé par l'IA quand aucune graine n'est fixée)
+    def save_checkpoint(self):
+        self.games_since_checkpoint = 0
+        if self.checkpoint_path is None:
+            return
+
+        state = {
+            'config': self.config(),
+            'match_history': self.match_history,
+            'performance': self.performance,
+            'matchup_results': self.matchup_results,
+            'current_matchup': self.current_matchup,
+            'current_counts': self.current_counts,
+            'next_match_index': self.next_match_index,
+            'search_stats': {difficulty: stats.to_dict() for difficulty, stats in self.search_stats.items()},
+            'rng_state': random.getstate()
+        }
+
+        # Écriture dans un fichier temporaire puis remplacement atomique :
+        # une interruption pendant l'écriture ne corrompt jamais le dernier point de reprise
+        tmp_path = self.checkpoint_path + '.tmp'
+        with profiling.phase('io'):
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.checkpoint_path)
+
+    # Fonction qui recharge un point de reprise, retourne False s'il n'existe pas
+    def load_checkpoint(self):
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return False
+
+        with open(self.checkpoint_path) as f:
+            state = json.load(f)
+
+        if state['config'] != self.config():
+            raise ValueError(
+                f"Le point de reprise {self.checkpoint_path} correspond à une autre configuration : "
+                f"{state['config']} (attendu : {self.config()})"
+            )
+
+        self.match_history = state['match_history']
+        self.performance = state['performance']
+        self.matchup_results = state['matchup_results']
+        self.current_matchup = state['current_matchup']
+        self.current_counts = state['current_counts']
+        self.next_match_index = state['next_match_index']
+        if 'search_stats' in state:
+            self.search_stats = {difficulty: SearchStats.from_dict(data)
+                                 for difficulty, data in state['search_stats'].items()}
+
+        # JSON transforme les tuples en listes : on reconstruit l'état attendu par random.setstate
+        version, internal_state, gauss_next = state['rng_state']
+        random.setstate((version, tuple(internal_state), gauss_next))
+        return True
+
+    # Paramètres qui doivent être identiques entre une exécution et sa reprise
+    def config(self):
+        return {
+            'rows': self.rows,
+            'cols': self.cols,
+            'win_condition': self.win_condition,
+            'num_games': self.num_games,
+            'seed': self.seed
+        }
+
+    # Fonction qui joue tous les duels de difficulté (en reprenant après le dernier duel terminé) et produit
+    # au fur et à mesure (difficulté 1, difficulté 2, (victoires 1, victoires 2, nuls)) de chaque duel
+    def play_matchups(self):
+        for matchup_index, (d1, d2) in enumerate(MATCHUPS):
+            if matchup_index < self.current_matchup:
+                # Duel déjà terminé avant l'interruption : résultats lus dans le point de reprise
+                yield d1, d2, tuple(self.matchup_results[matchup_index])
+                continue
+            counts = self.run_match(d1, d2)
+            self.matchup_results.append(list(counts))
+            self.current_matchup = matchup_index + 1
+            self.current_counts = [0, 0, 0]
+            self.next_match_index = 0
+            self.save_checkpoint()
+            yield d1, d2, counts
+
     # Fonction qui organise tous les duels de difficulté et affiche les résultats
-    def evaluate(self):
-        matchups = [
-            ('easy', 'easy'),
-            ('medium', 'medium'),
-            ('hard', 'hard'),
-            ('easy', 'medium'),
-            ('easy', 'hard'),
-            ('medium', 'hard')
-        ]
+    def evaluate(self, resume=False):
+        if resume and self.load_checkpoint():
+            print(f"Reprise depuis {self.checkpoint_path} : {len(self.match_history)} matchs déjà joués\n")
 
         print("=== RÉSULTATS DES MATCHS D'IA ===\n")
-        for d1, d2 in matchups:
-            p1_wins, p2_wins, draws = self.run_match(d1, d2)
+        for d1, d2, (p1_wins, p2_wins, draws) in self.play_matchups():
             total = p1_wins + p2_wins + draws
             print(f"Match : {d1.upper()} vs {d2.upper()}")
             print(f"  IA 1 ({d1}) gagne : {p1_wins} ({p1_wins / total * 100:.1f}%)")
             print(f"  IA 2 ({d2}) gagne : {p2_wins} ({p2_wins / total * 100:.1f}%)")
             print(f"  Matchs nuls       : {draws} ({draws / total * 100:.1f}%)\n")
 
+        if self.collect_stats:
+            self.print_search_stats()
+
         # Sauvegarde des résultats et de l'historique des matchs dans un fichier JSON
-        with open('match_results.json', 'w') as f:
-            json.dump({
-                'match_history': self.match_history,
-                'performance': self.performance
-            }, f, indent=2)
+        results = {
+            'match_history': self.match_history,
+            'performance': self.performance
+        }
+        if self.collect_stats:
+            results['search_stats'] = {difficulty: stats.to_dict() for difficulty, stats in self.search_stats.items()}
+        with profiling.phase('io'), open(RESULTS_FILE, 'w') as f:
+            json.dump(results, f, indent=2)
+
+        # Le tournoi est complet : le point de reprise n'a plus d'utilité
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    # Fonction qui affiche les compteurs de recherche cumulés de chaque difficulté
+    def print_search_stats(self):
+        print("=== STATISTIQUES DE RECHERCHE PAR DIFFICULTÉ ===\n")
+        for difficulty, stats in self.search_stats.items():
+            if stats.searches == 0:
+                continue
+            cutoff_rate = stats.first_move_cutoff_rate()
+            hit_rate = stats.cache_hit_rate()
+            print(f"{difficulty.upper()} : {stats.searches} coups, {stats.elapsed / stats.searches * 1000:.1f} ms/coup")
+            print(f"  Nœuds         : {stats.nodes} ({stats.nodes / stats.searches:.0f}/coup, "
+                  f"{stats.nodes_per_second() / 1000:.1f} k/s)")
+            print(f"  Feuilles      : {stats.leaf_evaluations}, tests de victoire : {stats.win_checks}")
+            print(f"  Élagages      : {stats.beta_cutoffs}, dès le 1er coup : "
+                  f"{'-' if cutoff_rate is None else f'{cutoff_rate * 100:.1f}%'}")
+            print(f"  Profondeur    : {stats.depth} (demi-coup le plus profond : {stats.max_depth})")
+            print(f"  Transposition : {stats.tt_hits} nœuds résolus par la table de la session")
+            if hit_rate is not None:
+                print(f"  Cache         : {stats.cache_hits}/{stats.cache_hits + stats.cache_misses} "
+                      f"({hit_rate * 100:.1f}%)")
+            print()
 
 # Point d'entrée du script
 if __name__ == "__main__":
-    tester = AIMatchTester()
-    tester.evaluate()
+    parser = argparse.ArgumentParser(description="Tournoi automatique entre IA de Puissance X")
+    parser.add_argument('--num-games', type=int, default=50, help="Nombre de matchs par duel")
+    parser.add_argument('--seed', type=int, default=None, help="Graine aléatoire pour un tournoi reproductible")
+    parser.add_argument('--checkpoint', default=CHECKPOINT_FILE, help="Fichier de point de reprise")
+    parser.add_argument('--checkpoint-interval', type=int, default=10, help="Nombre de matchs entre deux sauvegardes")
+    parser.add_argument('--resume', action='store_true', help="Reprendre depuis le dernier point de reprise")
+    parser.add_argument('--cache', default=None,
+                        help="Fichier du cache persistant des recherches (désactivé par défaut : "
+                             "un cache déjà rempli modifie le tirage aléatoire et donc la reproductibilité)")
+    parser.add_argument('--stats', action='store_true',
+                        help="Cumuler et afficher les statistiques de recherche par difficulté")
+    parser.add_argument('--profile', default=None, metavar='RÉPERTOIRE',
+                        help="Profiler le tournoi et écrire les données dans ce répertoire")
+    parser.add_argument('--profile-mode', choices=profiling.MODES, default='sample',
+                        help="Piles échantillonnées (format flamegraph) ou cProfile par phase")
+    args = parser.parse_args()
+
+    if args.profile:
+        profiling.enable(args.profile, args.profile_mode)
+
+    tester = AIMatchTester(num_games=args.num_games, seed=args.seed,
+                           checkpoint_path=args.checkpoint,
+                           checkpoint_interval=args.checkpoint_interval,
+                           cache=PositionCache(args.cache) if args.cache else None,
+                           collect_stats=args.stats)
+    tester.evaluate(resume=args.resume)
+
+    if profiling.is_enabled():
+        profiling.flush()
+        profiling.merge(args.profile)
@@ -0,0 +1,266 @@
+# Analyse d'après-partie : où les matchs enregistrés ont-ils été perdus ?
+#
+# Les matchs sont lus au fil de l'eau (match_results.json d'ai_match_tester ou résultats du scheduler), rejoués,
+# et chaque position unique (sur l'ensemble des matchs, au symétrique gauche-droite près si le nombre de colonnes
+# est impair) est analysée une seule fois par un processus de travail : score minimax de chaque coup jouable à
+# profondeur fixe, calculé par lots de positions avec la recherche vectorisée de get_ai_moves (ai.score_moves).
+# Chaque coup joué reçoit son score, celui du meilleur coup et la perte entre les deux ; les grosses pertes sont
+# signalées comme gaffes. Le résultat est un fichier JSON lines compressé (une ligne d'en-tête, puis une ligne
+# par match).
+#
+#   python -m tournament.blunder_analysis [match_results.json] [--output blunders.jsonl.gz] [--workers N]
+#                                        [--depth 4] [--threshold 50] [--rows 6 --cols 7 --win 4] [--limit N]
+import os
+import sys
+import json
+import gzip
+import time
+import argparse
+import concurrent.futures
+import numpy as np
+from game.ai import score_moves, DIFFICULTY_DEPTHS
+from game.game_logic import get_next_open_row, drop_piece, is_valid_location
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+DEFAULT_INPUT = 'match_results.json'
+DEFAULT_OUTPUT = 'blunders.jsonl.gz'
+DEFAULT_THRESHOLD = 50  # Perte (en points d'évaluation) à partir de laquelle un coup est une gaffe
+GAME_ARRAYS = ('match_history', 'games')  # Liste des matchs : ai_match_tester, puis scheduler
+READ_SIZE = 1 << 16  # Octets lus à la fois par le lecteur de matchs
+CHUNK_POSITIONS = 256  # Positions envoyées au plus ensemble à un processus de travail (une recherche vectorisée)
+FIELDS = ['ply', 'player', 'col', 'score', 'best_col', 'best_score', 'loss']
+
+
+# Lecteur incrémental : produit un à un les éléments de la liste des matchs sans charger tout le fichier
+def iter_games(f, arrays=GAME_ARRAYS):
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = -1
+    eof = False
+    while position < 0:
+        chunk = f.read(READ_SIZE)
+        eof = not chunk
+        buffer += chunk
+        for name in arrays:
+            index = buffer.find(f'"{name}"')
+            if index >= 0:
+                position = buffer.find('[', index)
+                break
+        if eof and position < 0:
+            raise ValueError(f"aucune liste de matchs ({', '.join(arrays)}) dans le fichier")
+        if position < 0:
+            buffer = buffer[-64:]  # Garde de quoi retrouver un nom coupé entre deux lectures
+    position += 1
+
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            game, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(READ_SIZE)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield game
+        position = end
+        if position > READ_SIZE:
+            buffer = buffer[position:]
+            position = 0
+
+
+# Match normalisé : (plateau, joueur qui commence, colonnes jouées, description des joueurs, vainqueur)
+def normalize_game(game, default_board):
+    if 'board' in game:
+        board = (game['board']['rows'], game['board']['cols'], game['board']['win_condition'])
+        players = {1: game['engine1'], 2: game['engine2']}
+    else:
+        board = default_board
+        players = {1: game['difficulty1'], 2: game['difficulty2']}
+    moves = [move['col'] if isinstance(move, dict) else move for move in game['moves']]
+    return board, game['starting_player'], moves, players, game.get('winner', 0)
+
+
+# Clé d'une position (joueur au trait vu comme AI_PIECE) et indicateur de symétrie : une position et son
+# symétrique gauche-droite ont les mêmes scores, colonnes inversées, si le nombre de colonnes est impair (le bonus
+# de colonne centrale de score_position n'est symétrique que dans ce cas, comme pour PositionCache.canonical_key)
+def position_key(board_config, view):
+    direct = view.astype(np.int8).tobytes()
+    if board_config[1] % 2 == 1:
+        mirrored = view[:, ::-1].astype(np.int8).tobytes()
+        if mirrored < direct:
+            return (board_config, mirrored), True
+    return (board_config, direct), False
+
+
+# Rejoue un match : pour chaque coup, clé de la position avant le coup et symétrie
+def replay_positions(board_config, starting_player, moves):
+    rows, cols, _ = board_config
+    grid = np.zeros((rows, cols))
+    player = starting_player
+    positions = []
+    for col in moves:
+        if not 0 <= col < cols or not is_valid_location(grid, col):
+            break  # Coup invalide enregistré : la suite du match n'est pas analysée
+        view = grid if player == AI_PIECE else np.where(grid == PLAYER_PIECE, AI_PIECE,
+                                                         np.where(grid == AI_PIECE, PLAYER_PIECE, 0))
+        positions.append(position_key(board_config, view))
+        drop_piece(grid, get_next_open_row(grid, col), col, player)
+        player = 3 - player
+    return positions
+
+
+# Processus de travail : scores de chaque colonne (None si injouable) d'un lot de positions d'un même plateau
+def analyse_chunk(task):
+    (rows, cols, win_condition), depth, boards = task
+    stack = np.frombuffer(b''.join(boards), dtype=np.int8).reshape(len(boards), rows, cols)
+    scores = score_moves(stack, win_condition, depth)
+    return [[None if np.isnan(score) else float(score) for score in row] for row in scores]
+
+
+# Analyse toutes les positions uniques, réparties par lots entre les processus (0 = dans ce processus)
+def analyse_positions(keys, depth, workers):
+    keys = sorted(keys, key=lambda key: key[0])  # Lots homogènes : une seule configuration par lot
+    # Au moins quatre lots par processus, pour que tous restent occupés jusqu'à la fin
+    size = max(1, min(CHUNK_POSITIONS, -(-len(keys) // (4 * max(workers, 1)))))
+    tasks = []
+    for start in range(0, len(keys), size):
+        chunk = keys[start:start + size]
+        for config in sorted({key[0] for key in chunk}):
+            tasks.append((config, depth, [data for key_config, data in chunk if key_config == config]))
+
+    if workers == 0:
+        return _collect(tasks, map(analyse_chunk, tasks))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        return _collect(tasks, executor.map(analyse_chunk, tasks))
+
+
+def _collect(tasks, results):
+    scores = {}
+    for (config, _, boards), chunk_scores in zip(tasks, results):
+        for data, column_scores in zip(boards, chunk_scores):
+            scores[(config, data)] = column_scores
+    return scores
+
+
+def encode_score(score):
+    if score == float("inf"):
+        return "win"
+    if score == float("-inf"):
+        return "loss"
+    return int(score) if float(score).is_integer() else round(score, 2)
+
+
+# Perte du coup joué par rapport au meilleur (None si l'issue forcée change : victoire manquée ou défaite
+# concédée) et indicateur de gaffe
+def move_loss(best_score, score, threshold):
+    if score == best_score:
+        return 0, False
+    if float("inf") in (best_score, -score):
+        return None, True
+    loss = best_score - score
+    return (int(loss) if float(loss).is_integer() else round(loss, 2)), loss >= threshold
+
+
+# Enregistrement compact d'un match analysé
+def game_record(index, game, positions, scores, threshold):
+    board_config, starting_player, moves, players, winner = game
+    evaluations, blunders = [], []
+    decisive = None
+    player = starting_player
+    for ply, ((key, mirrored), col) in enumerate(zip(positions, moves)):
+        column_scores = scores[key][::-1] if mirrored else scores[key]
+        playable = [c for c, value in enumerate(column_scores) if value is not None]
+        best_col = max(playable, key=lambda c: column_scores[c])  # Premier des meilleurs coups
+        best_score, score = column_scores[best_col], column_scores[col]
+        loss, blunder = move_loss(best_score, score, threshold)
+        evaluations.append([ply, player, col, encode_score(score), best_col, encode_score(best_score), loss])
+        if blunder:
+            blunders.append(ply)
+            # Premier coup du perdant qui transforme une position tenable en défaite forcée
+            if decisive is None and player == 3 - winner and score == float("-inf"):
+                decisive = ply
+        player = 3 - player
+    return {'game': index, 'board': list(board_config), 'players': players, 'starting_player': starting_player,
+            'winner': winner, 'evaluations': evaluations, 'blunders': blunders, 'decisive': decisive}
+
+
+def run(input_path, output_path, depth, threshold, default_board, workers, limit=None, verbose=True):
+    """
+    Analyse les matchs d'un fichier de résultats et écrit les évaluations coup par coup.
+
+    Args:
+        input_path (str): match_results.json (ai_match_tester) ou résultats du scheduler.
+        output_path (str): Fichier JSON lines compressé (gzip) produit.
+        depth (int): Profondeur d'analyse de chaque position.
+        threshold (float): Perte à partir de laquelle un coup est signalé comme gaffe.
+        default_board (tuple): (lignes, colonnes, victoire) des matchs qui ne précisent pas leur plateau.
+        workers (int): Processus de travail (0 = analyse dans ce processus).
+        limit (int): Nombre maximal de matchs lus (tous si None).
+
+    Returns:
+        dict: Nombres de matchs, de coups, de positions uniques et de gaffes, et durées des étapes.
+    """
+    start = time.perf_counter()
+    games, game_positions, unique = [], [], set()
+    with open(input_path) as f:
+        for game in iter_games(f):
+            if limit is not None and len(games) >= limit:
+                break
+            game = normalize_game(game, default_board)
+            positions = replay_positions(game[0], game[1], game[2])
+            games.append(game)
+            game_positions.append(positions)
+            unique.update(key for key, _ in positions)
+    moves = sum(len(positions) for positions in game_positions)
+    read_time = time.perf_counter() - start
+    if verbose:
+        print(f"{len(games)} matchs, {moves} coups, {len(unique)} positions uniques ({read_time:.1f} s)")
+
+    start = time.perf_counter()
+    scores = analyse_positions(unique, depth, workers)
+    analysis_time = time.perf_counter() - start
+    if verbose:
+        print(f"Analyse à la profondeur {depth} sur {workers or 1} processus : {analysis_time:.1f} s "
+              f"({len(unique) / analysis_time:.1f} positions/s)")
+
+    blunders = {}  # Gaffes par joueur (difficulté ou moteur)
+    with gzip.open(output_path, 'wt') as out:
+        out.write(json.dumps({'format': 'puissance-x-blunders', 'version': 1, 'depth': depth,
+                              'threshold': threshold, 'fields': FIELDS}) + '\n')
+        for index, (game, positions) in enumerate(zip(games, game_positions)):
+            record = game_record(index, game, positions, scores, threshold)
+            out.write(json.dumps(record, separators=(',', ':')) + '\n')
+            for ply in record['blunders']:
+                name = record['players'][record['evaluations'][ply][1]]
+                blunders[name] = blunders.get(name, 0) + 1
+
+    if verbose:
+        print(f"Gaffes par joueur : {blunders}")
+        print(f"Résultats écrits dans {output_path}")
+    return {'games': len(games), 'moves': moves, 'positions': len(unique), 'blunders': blunders,
+            'read_time': read_time, 'analysis_time': analysis_time}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Évaluation coup par coup et gaffes des matchs enregistrés")
+    parser.add_argument('input', nargs='?', default=DEFAULT_INPUT, help="Fichier de résultats des matchs")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Fichier produit (JSON lines compressé)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Processus de travail (0 = aucun)")
+    parser.add_argument('--depth', type=int, default=DIFFICULTY_DEPTHS['hard'], help="Profondeur d'analyse")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="Perte minimale d'une gaffe")
+    parser.add_argument('--rows', type=int, default=6, help="Plateau des matchs d'ai_match_tester")
+    parser.add_argument('--cols', type=int, default=7)
+    parser.add_argument('--win', type=int, default=4)
+    parser.add_argument('--limit', type=int, default=None, help="Nombre maximal de matchs analysés")
+    args = parser.parse_args()
+    try:
+        run(args.input, args.output, args.depth, args.threshold, (args.rows, args.cols, args.win), args.workers,
+            args.limit)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Erreur : {e}")
@@ -0,0 +1,108 @@
+# Harnais de non-régression : rejoue des matchs enregistrés et vérifie que l'IA choisit les mêmes coups
+#
+#   python -m tournament.replay record     # enregistre les matchs de référence (tournament/recorded_games.json)
+#   python -m tournament.replay check      # rejoue chaque position, code de sortie 1 au premier coup différent
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from game.game_logic import get_next_open_row, drop_piece
+from tournament.ai_match_tester import AIMatchTester, MATCHUPS
+
+RECORD_FILE = os.path.join(os.path.dirname(__file__), 'recorded_games.json')
+RECORD_SEED = 2024
+# Plateaux enregistrés : (lignes, colonnes, victoire, matchs par duel)
+RECORD_BOARDS = [
+    (5, 5, 3, 2),
+    (6, 7, 4, 1),
+]
+
+
+# Fonction qui joue et enregistre les matchs de référence de chaque plateau
+def record_games(seed=RECORD_SEED, boards=RECORD_BOARDS):
+    recorded = []
+    for rows, cols, win_condition, num_games in boards:
+        tester = AIMatchTester(rows, cols, win_condition, num_games=num_games, seed=seed)
+        games = []
+        for d1, d2 in MATCHUPS:
+            for match_index in range(num_games):
+                record = tester.play_game(d1, d2, match_index)
+                games.append({
+                    'match_index': match_index,
+                    'difficulty1': d1,
+                    'difficulty2': d2,
+                    'starting_player': record['starting_player'],
+                    'winner': record['winner'],
+                    'moves': [move['col'] for move in record['moves']]
+                })
+        print(f"{rows}x{cols}/{win_condition} : {len(games)} matchs enregistrés")
+        recorded.append({'rows': rows, 'cols': cols, 'win_condition': win_condition, 'games': games})
+    return {'version': 1, 'seed': seed, 'boards': recorded}
+
+
+# Fonction qui rejoue un match coup par coup et retourne le premier écart (None si aucun)
+def replay_game(tester, game):
+    rng = tester.game_rng(game['difficulty1'], game['difficulty2'], game['match_index'])
+    grid = np.zeros((tester.rows, tester.cols))
+    turn = game['starting_player']
+    engines = tester.new_engines()
+    for ply, expected in enumerate(game['moves']):
+        difficulty = game['difficulty1'] if turn == 1 else game['difficulty2']
+        col = tester.choose_move(grid, difficulty, engines[turn], rng)
+        if col != expected:
+            # Le générateur a divergé : la suite du match ne peut plus être comparée
+            return {'ply': ply, 'expected': expected, 'played': col, 'difficulty': difficulty,
+                    'moves_before': game['moves'][:ply]}
+        drop_piece(grid, get_next_open_row(grid, col), col, turn)
+        for engine in engines.values():
+            engine.play(col, turn)
+        turn = 2 if turn == 1 else 1
+    return None
+
+
+# Fonction qui rejoue tous les matchs d'un enregistrement et retourne la liste des écarts
+def check_games(recorded, verbose=True):
+    mismatches = []
+    for board in recorded['boards']:
+        tester = AIMatchTester(board['rows'], board['cols'], board['win_condition'], seed=recorded['seed'])
+        label = f"{board['rows']}x{board['cols']}/{board['win_condition']}"
+        start = time.perf_counter()
+        moves = 0
+        for game in board['games']:
+            mismatch = replay_game(tester, game)
+            if mismatch is None:
+                moves += len(game['moves'])
+                continue
+            moves += mismatch['ply'] + 1
+            mismatches.append({'board': label, 'match_index': game['match_index'],
+                               'matchup': f"{game['difficulty1']} vs {game['difficulty2']}", **mismatch})
+        if verbose:
+            print(f"{label} : {len(board['games'])} matchs, {moves} coups rejoués en {time.perf_counter() - start:.1f} s")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rejeu de matchs enregistrés (non-régression de l'IA)")
+    parser.add_argument('command', choices=('record', 'check'))
+    parser.add_argument('--file', default=RECORD_FILE, help="Fichier des matchs enregistrés")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        recorded = record_games()
+        with open(args.file, 'w') as f:
+            json.dump(recorded, f, indent=1)
+        sys.exit(0)
+
+    with open(args.file) as f:
+        recorded = json.load(f)
+    mismatches = check_games(recorded)
+    if mismatches:
+        print("\nCoups différents de l'enregistrement :")
+        for mismatch in mismatches:
+            print(f"  - {mismatch['board']} {mismatch['matchup']} (match {mismatch['match_index']}), "
+                  f"coup {mismatch['ply']} ({mismatch['difficulty']}) : {mismatch['played']} au lieu de "
+                  f"{mismatch['expected']} après {mismatch['moves_before']}")
+        sys.exit(1)
+    print("Tous les coups correspondent à l'enregistrement")
@@ -0,0 +1,425 @@
+# Planificateur de tournois : confronte des configurations d'IA arbitraires sur plusieurs tailles de plateau
+import sys  # Pour les messages d'erreur en ligne de commande
+import time  # Pour mesurer la durée des matchs et détecter les dépassements
+import json  # Lecture de la spécification et sauvegarde des résultats
+import random  # Générateur aléatoire propre à chaque match
+import argparse  # Options en ligne de commande
+import itertools  # Génération des paires de moteurs
+import multiprocessing as mp  # Processus de travail
+from multiprocessing.connection import wait  # Attente simultanée sur plusieurs processus
+import numpy as np  # Pour la manipulation de la grille sous forme de matrice
+from game.game_logic import winning_move, get_next_open_row, drop_piece, is_valid_location  # Fonctions de logique du jeu
+from game.ai import get_ai_move, get_valid_locations, DIFFICULTY_DEPTHS, DEFAULT_DEPTH, DEFAULT_WEIGHTS
+from game.large_board import get_large_move, CANDIDATE_RADIUS
+from game.position_cache import PositionCache
+from game import profiling
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+ENGINE_TYPES = ('minimax', 'random', 'large')  # Types de moteurs reconnus
+FORMATS = ('round_robin', 'gauntlet')  # Formats de tournoi reconnus
+MIN_SIZE, MAX_SIZE = 5, 10  # Dimensions de plateau supportées par le jeu
+MAX_LARGE_SIZE = 20  # Dimension maximale quand aucun moteur n'est de type 'minimax' (game/large_board.py)
+MIN_WIN, MAX_WIN = 3, 7  # Conditions de victoire supportées par le jeu
+
+# Valeurs par défaut d'une spécification de tournoi
+DEFAULT_SPEC = {
+    'format': 'round_robin',
+    'games_per_pairing': 10,  # Matchs par paire de moteurs et par plateau (le premier joueur alterne)
+    'include_self_play': False,  # En round-robin, faire aussi jouer chaque moteur contre lui-même
+    'workers': mp.cpu_count(),  # Nombre de processus (0 = tout exécuter dans le processus courant)
+    'game_timeout': 300,  # Durée maximale d'un match en secondes avant abandon
+    'seed': 0,  # Graine de base : chaque match reçoit sa propre graine dérivée
+    'cache': None  # Fichier du cache persistant des recherches, partagé par les processus (désactivé si None)
+}
+
+_caches = {}  # Caches de positions ouverts par le processus courant, par chemin
+
+
+# Fonction qui lit, complète et valide une spécification de tournoi
+def load_spec(spec):
+    """
+    Valide une spécification de tournoi et la complète avec les valeurs par défaut.
+
+    Args:
+        spec (dict or str): Spécification, ou chemin d'un fichier JSON la contenant.
+
+    Returns:
+        dict: Spécification complète.
+
+    Raises:
+        ValueError: Si la spécification est incohérente.
+    """
+    if isinstance(spec, str):
+        with open(spec) as f:
+            spec = json.load(f)
+    spec = {**DEFAULT_SPEC, **spec}
+
+    if spec['format'] not in FORMATS:
+        raise ValueError(f"Format de tournoi inconnu : {spec['format']} (attendu : {FORMATS})")
+    if not spec.get('engines') or not spec.get('boards'):
+        raise ValueError("La spécification doit contenir au moins un moteur ('engines') et un plateau ('boards')")
+
+    names = set()
+    for engine in spec['engines']:
+        if 'name' not in engine:
+            raise ValueError(f"Moteur sans nom : {engine}")
+        if engine['name'] in names:
+            raise ValueError(f"Nom de moteur en double : {engine['name']}")
+        names.add(engine['name'])
+        if engine.get('type', 'minimax') not in ENGINE_TYPES:
+            raise ValueError(f"Type de moteur inconnu pour {engine['name']} : {engine['type']}")
+        unknown = set(engine.get('weights', {})) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Poids inconnus pour {engine['name']} : {sorted(unknown)}")
+
+    # Au-delà de 10x10, seuls les moteurs dont le coût par nœud ne dépend pas de la taille du plateau
+    max_size = MAX_SIZE
+    if all(engine.get('type', 'minimax') != 'minimax' for engine in spec['engines']):
+        max_size = MAX_LARGE_SIZE
+    for board in spec['boards']:
+        rows, cols, win = board['rows'], board['cols'], board['win_condition']
+        if not (MIN_SIZE <= rows <= max_size and MIN_SIZE <= cols <= max_size):
+            raise ValueError(f"Plateau {rows}x{cols} hors limites ({MIN_SIZE} à {max_size})")
+        if not (MIN_WIN <= win <= min(MAX_WIN, max(rows, cols))):
+            raise ValueError(f"Condition de victoire {win} impossible sur un plateau {rows}x{cols}")
+
+    if spec['format'] == 'gauntlet' and spec.get('gauntlet_engine') not in names:
+        raise ValueError("Le format 'gauntlet' nécessite 'gauntlet_engine', le nom d'un des moteurs")
+    return spec
+
+
+# Fonction qui estime le coût relatif d'un match, pour répartir les longs et les courts matchs
+def estimate_cost(engine1, engine2, board):
+    """
+    Estime grossièrement la durée d'un match (unité arbitraire).
+
+    Le nombre de nœuds d'un minimax alpha-bêta bien ordonné croît comme b^(d/2),
+    avec b le nombre de colonnes et d la profondeur, et la partie dure au plus rows * cols coups.
+    Pour le type 'large', b est borné par les colonnes candidates et le coût d'un nœud ne dépend
+    pas de la taille du plateau.
+    """
+    cells = board['rows'] * board['cols']
+    cost = 0.0
+    for engine in (engine1, engine2):
+        if engine.get('type', 'minimax') == 'random':
+            cost += 1
+        elif engine.get('time_budget') is not None:
+            cost += engine['time_budget'] * 1e5  # Le budget de temps borne directement la réflexion
+        else:
+            depth = engine.get('depth') or DIFFICULTY_DEPTHS.get(engine.get('difficulty'), DEFAULT_DEPTH)
+            if engine.get('type', 'minimax') == 'large':
+                branching = min(board['cols'], 2 * engine.get('radius', CANDIDATE_RADIUS) + 3)
+                cost += branching ** (depth / 2) * 16
+            else:
+                cost += board['cols'] ** (depth / 2) * board['rows'] * board['cols']
+    return cells * cost
+
+
+# Fonction qui construit la liste des matchs à jouer à partir de la spécification
+def build_tasks(spec):
+    """
+    Génère un match par (paire de moteurs, plateau, indice de match).
+
+    Args:
+        spec (dict): Spécification validée par load_spec().
+
+    Returns:
+        list: Tâches (dict) triées du match le plus long au plus court.
+    """
+    engines = {engine['name']: engine for engine in spec['engines']}
+    if spec['format'] == 'gauntlet':
+        hero = spec['gauntlet_engine']
+        pairs = [(hero, name) for name in engines if name != hero]
+    else:
+        names = list(engines)
+        pairs = list(itertools.combinations(names, 2))
+        if spec['include_self_play']:
+            pairs += [(name, name) for name in names]
+
+    tasks = []
+    for board in spec['boards']:
+        for name1, name2 in pairs:
+            for game_index in range(spec['games_per_pairing']):
+                task_id = len(tasks)
+                tasks.append({
+                    'task_id': task_id,
+                    'engine1': engines[name1],
+                    'engine2': engines[name2],
+                    'board': board,
+                    'game_index': game_index,
+                    'starting_player': 1 if game_index % 2 == 0 else 2,
+                    'seed': spec['seed'] * 1000003 + task_id,
+                    'cache': spec['cache'],
+                    'cost': estimate_cost(engines[name1], engines[name2], board)
+                })
+
+    # Les plus longs d'abord (ordonnancement LPT) : les petits matchs comblent la fin de la file
+    tasks.sort(key=lambda task: task['cost'], reverse=True)
+    return tasks
+
+
+# Fonction qui retourne le coup d'un moteur configuré
+def engine_move(engine, board, piece, win_condition, cache=None, rng=None):
+    """
+    Calcule le coup d'un moteur décrit par sa configuration.
+
+    get_ai_move et get_large_move raisonnent toujours du point de vue de AI_PIECE : pour le joueur
+    PLAYER_PIECE, on leur présente donc le plateau avec les pièces échangées. Tous les tirages aléatoires
+    passent par `rng` (module random si None).
+    """
+    if engine.get('type', 'minimax') == 'random':
+        return (random if rng is None else rng).choice(get_valid_locations(board))
+
+    if piece == AI_PIECE:
+        view = board.copy()  # Jamais la grille du match : une recherche interrompue ne doit pas la modifier
+    else:
+        view = np.where(board == PLAYER_PIECE, AI_PIECE, np.where(board == AI_PIECE, PLAYER_PIECE, 0)).astype(board.dtype)
+
+    weights = {**DEFAULT_WEIGHTS, **engine['weights']} if engine.get('weights') else None
+    if engine.get('type', 'minimax') == 'large':
+        return get_large_move(view, engine.get('difficulty'), win_condition,
+                              depth=engine.get('depth'), time_budget=engine.get('time_budget'), weights=weights,
+                              rng=rng, radius=engine.get('radius', CANDIDATE_RADIUS))
+    return get_ai_move(view, engine.get('difficulty'), win_condition,
+                       depth=engine.get('depth'), time_budget=engine.get('time_budget'), weights=weights,
+                       cache=cache, rng=rng)
+
+
+# Fonction qui joue un match planifié et retourne son enregistrement
+def play_task(task):
+    rng = random.Random(task['seed'])  # Résultat indépendant du processus qui exécute le match
+    cache = None
+    if task['cache'] is not None:
+        if task['cache'] not in _caches:
+            _caches[task['cache']] = PositionCache(task['cache'])
+        cache = _caches[task['cache']]
+    board_config = task['board']
+    rows, cols, win_condition = board_config['rows'], board_config['cols'], board_config['win_condition']
+    grid = np.zeros((rows, cols))
+    turn = task['starting_player']
+    moves = []
+    winner = 0
+    start = time.perf_counter()
+
+    while True:
+        engine = task['engine1'] if turn == 1 else task['engine2']
+        col = engine_move(engine, grid, turn, win_condition, cache, rng)
+        if col is None or not is_valid_location(grid, col):
+            break  # Coup invalide : match nul, comme dans AIMatchTester
+
+        row = get_next_open_row(grid, col)
+        drop_piece(grid, row, col, turn)
+        moves.append(col)
+
+        if winning_move(grid, turn, win_condition):
+            winner = turn
+            break
+        if np.all(grid != 0):
+            break
+        turn = 2 if turn == 1 else 1
+
+    return task_result(task, 'finished', winner, moves, time.perf_counter() - start)
+
+
+# Fonction qui construit l'enregistrement d'un match (terminé, abandonné ou en erreur)
+def task_result(task, status, winner, moves, duration):
+    return {
+        'task_id': task['task_id'],
+        'engine1': task['engine1']['name'],
+        'engine2': task['engine2']['name'],
+        'board': task['board'],
+        'game_index': task['game_index'],
+        'starting_player': task['starting_player'],
+        'status': status,
+        'winner': winner,
+        'moves': moves,
+        'duration': round(duration, 4)
+    }
+
+
+# Boucle d'un processus de travail : reçoit des tâches par son tube et renvoie les résultats
+def _worker_loop(conn):
+    while True:
+        with profiling.phase('idle'):
+            task = conn.recv()
+        if task is None:
+            break
+        conn.send(play_task(task))
+    profiling.flush()  # Les processus de multiprocessing ne passent pas par atexit
+
+
+class _Worker:
+    """Processus de travail avec son propre tube, pour pouvoir être arrêté sans affecter les autres."""
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task = None  # Tâche en cours
+        self.started_at = None  # Début de la tâche en cours
+
+    def submit(self, task):
+        self.task = task
+        self.started_at = time.perf_counter()
+        self.conn.send(task)
+
+    def stop(self, force=False):
+        if force:
+            self.process.terminate()
+        else:
+            self.conn.send(None)
+        self.process.join()
+        self.conn.close()
+
+
+class TournamentScheduler:
+    """Exécute une spécification de tournoi sur un ensemble de processus de travail."""
+
+    def __init__(self, spec):
+        self.spec = load_spec(spec)
+        self.results = []
+
+    def run(self, verbose=True):
+        """
+        Joue tous les matchs de la spécification.
+
+        Returns:
+            dict: {'games': [...], 'standings': {...}}
+        """
+        tasks = build_tasks(self.spec)
+        if verbose:
+            print(f"{len(tasks)} matchs à jouer sur {self.spec['workers']} processus")
+        start = time.perf_counter()
+
+        if self.spec['workers'] <= 0:
+            # Exécution séquentielle (débogage) : les dépassements sont seulement signalés
+            for task in tasks:
+                result = play_task(task)
+                if result['duration'] > self.spec['game_timeout']:
+                    result['status'] = 'timeout'
+                self._record(result, verbose)
+        else:
+            self._run_parallel(tasks, verbose)
+
+        if verbose:
+            print(f"Tournoi terminé en {time.perf_counter() - start:.1f} s")
+        self.results.sort(key=lambda result: result['task_id'])
+        return {'games': self.results, 'standings': self.standings()}
+
+    def _run_parallel(self, tasks, verbose):
+        ctx = mp.get_context()
+        workers = [_Worker(ctx) for _ in range(min(self.spec['workers'], len(tasks)))]
+        pending = list(tasks)  # Déjà triés du plus long au plus court
+        timeout = self.spec['game_timeout']
+
+        try:
+            while pending or any(worker.task is not None for worker in workers):
+                # Distribution : chaque processus libre prend le plus long match restant
+                for worker in workers:
+                    if worker.task is None and pending:
+                        worker.submit(pending.pop(0))
+
+                busy = [worker for worker in workers if worker.task is not None]
+                with profiling.phase('idle'):
+                    ready = wait([worker.conn for worker in busy], timeout=0.1)
+                for conn in ready:
+                    worker = next(w for w in busy if w.conn is conn)
+                    try:
+                        result = conn.recv()
+                    except EOFError:  # Le processus s'est arrêté brutalement
+                        result = task_result(worker.task, 'error', None, [],
+                                             time.perf_counter() - worker.started_at)
+                        workers[workers.index(worker)] = self._replace(worker, ctx)
+                    else:
+                        worker.task = None
+                    self._record(result, verbose)
+
+                # Abandon des matchs bloqués : le processus est arrêté puis remplacé
+                now = time.perf_counter()
+                for worker in list(workers):
+                    if worker.task is not None and now - worker.started_at > timeout:
+                        self._record(task_result(worker.task, 'timeout', None, [], now - worker.started_at), verbose)
+                        workers[workers.index(worker)] = self._replace(worker, ctx)
+        finally:
+            for worker in workers:
+                worker.stop(force=worker.task is not None)
+
+    def _replace(self, worker, ctx):
+        worker.stop(force=True)
+        return _Worker(ctx)
+
+    def _record(self, result, verbose):
+        self.results.append(result)
+        if verbose and result['status'] != 'finished':
+            board = result['board']
+            print(f"  Match {result['engine1']} vs {result['engine2']} "
+                  f"({board['rows']}x{board['cols']}, {board['win_condition']}) : {result['status']}")
+
+    def standings(self):
+        """
+        Classement par plateau puis par moteur (victoire = 1 point, nul = 0,5 point).
+
+        Returns:
+            dict: {"RxC/W": {nom: {'wins', 'losses', 'draws', 'timeouts', 'points'}}}
+        """
+        table = {}
+        for result in self.results:
+            board = result['board']
+            key = f"{board['rows']}x{board['cols']}/{board['win_condition']}"
+            board_table = table.setdefault(key, {})
+            players = {1: result['engine1'], 2: result['engine2']}
+            for player, name in players.items():
+                entry = board_table.setdefault(name, {'wins': 0, 'losses': 0, 'draws': 0, 'timeouts': 0, 'points': 0.0})
+                if result['status'] != 'finished':
+                    entry['timeouts'] += 1
+                elif result['winner'] == 0:
+                    entry['draws'] += 1
+                    entry['points'] += 0.5
+                elif result['winner'] == player:
+                    entry['wins'] += 1
+                    entry['points'] += 1
+                else:
+                    entry['losses'] += 1
+        return table
+
+
+# Fonction qui affiche le classement de chaque plateau
+def print_standings(standings):
+    for board_key, board_table in standings.items():
+        print(f"\n=== Plateau {board_key} ===")
+        ranking = sorted(board_table.items(), key=lambda item: item[1]['points'], reverse=True)
+        for name, entry in ranking:
+            print(f"  {name:<15} {entry['points']:>6.1f} pts  "
+                  f"V {entry['wins']}  D {entry['losses']}  N {entry['draws']}  T {entry['timeouts']}")
+
+
+# Point d'entrée du script
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tournoi configurable entre moteurs de Puissance X")
+    parser.add_argument('spec', help="Fichier JSON de spécification du tournoi")
+    parser.add_argument('--output', default='scheduler_results.json', help="Fichier JSON des résultats")
+    parser.add_argument('--workers', type=int, default=None, help="Nombre de processus (remplace la spécification)")
+    parser.add_argument('--profile', default=None, metavar='RÉPERTOIRE',
+                        help="Profiler le tournoi (tous les processus) et écrire les données dans ce répertoire")
+    parser.add_argument('--profile-mode', choices=profiling.MODES, default='sample',
+                        help="Piles échantillonnées (format flamegraph) ou cProfile par phase")
+    args = parser.parse_args()
+
+    if args.profile:
+        profiling.enable(args.profile, args.profile_mode)  # Avant le lancement des processus de travail
+
+    try:
+        spec = load_spec(args.spec)
+    except ValueError as e:
+        sys.exit(f"Spécification invalide : {e}")
+    if args.workers is not None:
+        spec['workers'] = args.workers
+
+    outcome = TournamentScheduler(spec).run()
+    print_standings(outcome['standings'])
+    with profiling.phase('io'), open(args.output, 'w') as f:
+        json.dump(outcome, f, indent=2)
+
+    if profiling.is_enabled():
+        profiling.flush()
+        profiling.merge(args.profile)
@@ -0,0 +1,239 @@
+# Ajustement des poids de l'évaluation (DEFAULT_WEIGHTS) sur des parties jouées, à la manière de Texel.
+#
+# 1. Positions étiquetées : chaque position des parties (historique des matchs et/ou parties simulées par lot) est
+#    vue du joueur au trait, avec pour étiquette le résultat final pour ce joueur (1 victoire, 0,5 nul, 0 défaite).
+# 2. Caractéristiques : score_position est linéaire en ses poids ; les termes de chaque position (fenêtres de 4,
+#    3 et 2 pièces, menaces adverses, pièces au centre) sont calculés pour toutes les positions d'un seul passage
+#    NumPy (vectorized.position_features).
+# 3. Ajustement : on cherche d'abord l'échelle K telle que sigmoïde(K x score) prédise au mieux le résultat avec
+#    les poids actuels, puis les poids qui minimisent l'erreur quadratique de cette prédiction, par descente de
+#    gradient (Adam) sur des lots de positions, K restant fixe pour garder l'échelle des poids actuels.
+# 4. Validation : mini-tournoi parallèle (tournament.scheduler) entre les poids ajustés et les poids actuels.
+#
+#   python -m tournament.weight_tuning [match_results.json ...] [--simulate 100000] [--validate 20]
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from game.ai import DEFAULT_WEIGHTS
+from game.vectorized import position_features, FEATURE_KEYS
+from game.batch_simulation import BatchSimulator, center_policy
+from tournament.blunder_analysis import iter_games, normalize_game
+from tournament.scheduler import TournamentScheduler, print_standings
+from settings.game_constants import PLAYER_PIECE, AI_PIECE
+
+DEFAULT_OUTPUT = 'tuned_weights.json'
+DEFAULT_STEPS = 1000  # Pas de gradient (les données sont parcourues autant de fois que nécessaire)
+DEFAULT_BATCH_SIZE = 65536  # Positions par pas de gradient
+DEFAULT_LEARNING_RATE = 0.5  # Pas d'Adam, en unités de poids
+SIMULATION_BATCH = 50000  # Parties simulées ensemble par BatchSimulator (borne la mémoire)
+
+
+# Parties d'un plateau lues dans des fichiers de résultats : (joueur qui commence, colonnes jouées, vainqueur)
+def load_games(paths, board, limit=None):
+    games = []
+    for path in paths:
+        with open(path) as f:
+            for game in iter_games(f):
+                if limit is not None and len(games) >= limit:
+                    return games
+                board_config, starting_player, moves, _, winner = normalize_game(game, board)
+                if board_config == board:
+                    games.append((starting_player, moves, winner))
+    return games
+
+
+# Parties simulées par lot (politique center_policy des deux côtés : coups proches du centre, avec de l'aléa)
+def simulate_games(count, board, seed):
+    rows, cols, win_condition = board
+    rng = np.random.default_rng(seed)
+    games = []
+    for start in range(0, count, SIMULATION_BATCH):
+        simulator = BatchSimulator(min(SIMULATION_BATCH, count - start), rows, cols, win_condition)
+        simulator.run(center_policy, rng=rng)
+        games.extend(zip(simulator.starting_players.tolist(), simulator.move_history(), simulator.winner.tolist()))
+    return games
+
+
+def labelled_positions(games, board, skip_opening=0):
+    """
+    Rejoue toutes les parties ensemble, un demi-coup à la fois, et collecte la position avant chaque coup.
+
+    Args:
+        games (list): Parties (joueur qui commence, colonnes jouées, vainqueur).
+        board (tuple): (lignes, colonnes, victoire).
+        skip_opening (int): Demi-coups du début de partie ignorés.
+
+    Returns:
+        tuple: (plateaux N x lignes x colonnes en int8, joueur au trait vu comme AI_PIECE ; étiquettes N).
+    """
+    rows, cols, _ = board
+    count = len(games)
+    length = max((len(moves) for _, moves, _ in games), default=0)
+    moves = np.full((count, length), -1, dtype=np.intp)
+    for index, (_, played, _) in enumerate(games):
+        moves[index, :len(played)] = played
+    turn = np.array([starting for starting, _, _ in games], dtype=np.int8)
+    winner = np.array([result for _, _, result in games], dtype=np.int8)
+
+    boards = np.zeros((count, rows, cols), dtype=np.int8)
+    heights = np.full((count, cols), rows - 1, dtype=np.intp)
+    positions, labels = [], []
+    for ply in range(length):
+        games_index = np.flatnonzero(moves[:, ply] >= 0)
+        played = moves[games_index, ply]
+        # Coup impossible enregistré : la partie s'arrête là
+        legal = heights[games_index, played] >= 0
+        moves[games_index[~legal], ply:] = -1
+        games_index, played = games_index[legal], played[legal]
+        if len(games_index) == 0:
+            break
+        mover = turn[games_index]
+        if ply >= skip_opening:
+            view = boards[games_index]
+            swap = mover == PLAYER_PIECE  # Pièces échangées : le joueur au trait devient AI_PIECE
+            view[swap] = np.where(view[swap] == 0, 0, PLAYER_PIECE + AI_PIECE - view[swap])
+            positions.append(view)
+            labels.append(np.where(winner[games_index] == 0, 0.5, (winner[games_index] == mover).astype(float)))
+        boards[games_index, heights[games_index, played], played] = mover
+        heights[games_index, played] -= 1
+        turn[games_index] = PLAYER_PIECE + AI_PIECE - mover
+    if not positions:
+        return np.zeros((0, rows, cols), dtype=np.int8), np.zeros(0)
+    return np.concatenate(positions), np.concatenate(labels)
+
+
+def _sigmoid(values):
+    return 1.0 / (1.0 + np.exp(-np.clip(values, -500, 500)))
+
+
+# Erreur quadratique moyenne entre le résultat prédit (sigmoïde du score) et le résultat réel
+def texel_error(features, labels, weights, scale):
+    return float(np.mean((_sigmoid(scale * (features @ weights)) - labels) ** 2))
+
+
+# Échelle K qui minimise l'erreur avec des poids donnés (recherche ternaire sur log K, l'erreur étant unimodale)
+def fit_scale(features, labels, weights, iterations=60):
+    low, high = np.log(1e-5), np.log(10.0)
+    for _ in range(iterations):
+        left, right = low + (high - low) / 3, high - (high - low) / 3
+        if texel_error(features, labels, weights, np.exp(left)) < texel_error(features, labels, weights, np.exp(right)):
+            high = right
+        else:
+            low = left
+    return float(np.exp((low + high) / 2))
+
+
+def fit_weights(features, labels, weights, scale, steps=DEFAULT_STEPS, batch_size=DEFAULT_BATCH_SIZE,
+                learning_rate=DEFAULT_LEARNING_RATE, seed=0):
+    """
+    Descente de gradient (Adam) sur l'erreur de Texel, par lots de positions, mélangées à chaque passage.
+
+    Les poids d'une caractéristique constante dans les données (par exemple "four" quand la victoire se fait
+    à 4 : une position non terminale n'a jamais de fenêtre complète) ne sont pas modifiés.
+
+    Returns:
+        ndarray: Poids ajustés (dans l'ordre de FEATURE_KEYS).
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.array(weights, dtype=float)
+    active = features.std(axis=0) > 0
+    moment, velocity = np.zeros_like(weights), np.zeros_like(weights)
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-8
+    order, start = rng.permutation(len(labels)), 0
+    for step in range(1, steps + 1):
+        if start >= len(order):
+            order, start = rng.permutation(len(labels)), 0
+        batch = order[start:start + batch_size]
+        start += batch_size
+        x, y = features[batch], labels[batch]
+        predicted = _sigmoid(scale * (x @ weights))
+        # d/dw moyenne((p - y)²) = moyenne(2 (p - y) p (1 - p) K x)
+        gradient = (2 * (predicted - y) * predicted * (1 - predicted) * scale) @ x / len(batch)
+        gradient[~active] = 0
+        moment = beta1 * moment + (1 - beta1) * gradient
+        velocity = beta2 * velocity + (1 - beta2) * gradient ** 2
+        corrected = moment / (1 - beta1 ** step)
+        weights -= learning_rate * corrected / (np.sqrt(velocity / (1 - beta2 ** step)) + epsilon)
+    return weights
+
+
+# Mini-tournoi parallèle : poids ajustés contre poids actuels, même difficulté
+def validate(tuned, board, games, difficulty, workers, seed):
+    rows, cols, win_condition = board
+    spec = {
+        'engines': [{'name': 'ajustés', 'difficulty': difficulty, 'weights': tuned},
+                    {'name': 'actuels', 'difficulty': difficulty}],
+        'boards': [{'rows': rows, 'cols': cols, 'win_condition': win_condition}],
+        'games_per_pairing': games,
+        'seed': seed
+    }
+    if workers is not None:
+        spec['workers'] = workers
+    outcome = TournamentScheduler(spec).run()
+    print_standings(outcome['standings'])
+    return outcome['standings']
+
+
+def run(args):
+    board = (args.rows, args.cols, args.win)
+    start = time.perf_counter()
+    games = load_games(args.inputs, board, args.limit)
+    if args.simulate:
+        games += simulate_games(args.simulate, board, args.seed)
+    if not games:
+        raise ValueError(f"aucune partie sur le plateau {args.rows}x{args.cols}/{args.win}")
+    boards, labels = labelled_positions(games, board, args.skip_opening)
+    print(f"{len(games)} parties, {len(labels)} positions ({time.perf_counter() - start:.1f} s)")
+
+    start = time.perf_counter()
+    features = position_features(boards, AI_PIECE)
+    print(f"Caractéristiques : {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    initial = np.array([DEFAULT_WEIGHTS[key] for key in FEATURE_KEYS], dtype=float)
+    scale = fit_scale(features, labels, initial)
+    tuned = fit_weights(features, labels, initial, scale, args.steps, args.batch_size, args.learning_rate, args.seed)
+    print(f"Ajustement : {time.perf_counter() - start:.1f} s (K = {scale:.5f})")
+    print(f"Erreur : {texel_error(features, labels, initial, scale):.5f} -> "
+          f"{texel_error(features, labels, tuned, scale):.5f}")
+
+    tuned_weights = {key: round(float(value), 2) for key, value in zip(FEATURE_KEYS, tuned)}
+    print(f"{'poids':<12}{'actuel':>10}{'ajusté':>10}")
+    for key in FEATURE_KEYS:
+        print(f"{key:<12}{DEFAULT_WEIGHTS[key]:>10}{tuned_weights[key]:>10}")
+    with open(args.output, 'w') as f:
+        json.dump({'board': list(board), 'positions': int(len(labels)), 'scale': scale, 'weights': tuned_weights},
+                  f, indent=2)
+    print(f"Poids écrits dans {args.output} (clé \"weights\" d'un moteur du scheduler)")
+
+    if args.validate:
+        print(f"\nValidation : {args.validate} matchs par plateau, difficulté {args.difficulty}")
+        validate(tuned_weights, board, args.validate, args.difficulty, args.workers, args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ajustement des poids de l'évaluation (méthode de Texel)")
+    parser.add_argument('inputs', nargs='*', help="Fichiers de résultats (match_results.json, scheduler)")
+    parser.add_argument('--simulate', type=int, default=0, help="Parties simulées par lot ajoutées aux données")
+    parser.add_argument('--rows', type=int, default=6)
+    parser.add_argument('--cols', type=int, default=7)
+    parser.add_argument('--win', type=int, default=4)
+    parser.add_argument('--limit', type=int, default=None, help="Nombre maximal de parties lues dans les fichiers")
+    parser.add_argument('--skip-opening', type=int, default=0, help="Demi-coups ignorés en début de partie")
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS, help="Pas de gradient")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--learning-rate', type=float, default=DEFAULT_LEARNING_RATE)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Fichier JSON des poids ajustés")
+    parser.add_argument('--validate', type=int, default=0, help="Matchs par plateau du tournoi de validation (0 = aucun)")
+    parser.add_argument('--difficulty', default='medium', choices=('easy', 'medium', 'hard'))
+    parser.add_argument('--workers', type=int, default=None, help="Processus du tournoi de validation")
+    args = parser.parse_args()
+    if not args.inputs and not args.simulate:
+        args.inputs = ['match_results.json']
+    try:
+        run(args)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Erreur : {e}")
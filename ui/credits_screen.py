@@ -1,7 +1,7 @@
 # Importation des bibliothèques nécessaires
 import pygame
 from settings.constants import *  # Contient les constantes globales comme les couleurs, dimensions, polices, etc.
-from ui.interface import Label, Button, UIManager  # Composants d’interface utilisateur personnalisés
+from ui.interface import Label, Button, UIManager, render_text  # Composants d’interface utilisateur personnalisés
 
 # Classe représentant l'écran de crédits du jeu
 class CreditsScreen:
@@ -14,7 +14,7 @@ class CreditsScreen:
 
         # ----- Création du titre "Crédits" centré en haut -----
         title_text = "Crédits"
-        title_surface = TITLE_FONT.render(title_text, True, WHITE)  # Rend le texte pour obtenir ses dimensions
+        title_surface = render_text(TITLE_FONT, title_text, WHITE)  # Rend le texte pour obtenir ses dimensions
         title_width = title_surface.get_width()
         
         # Calcul de la position x relative pour centrer le texte horizontalement
@@ -34,7 +34,7 @@ class CreditsScreen:
         start_y = 0.4  # Position verticale de départ pour la première ligne
 
         for i, line in enumerate(credit_lines):
-            surface = SETTINGS_FONT.render(line, True, WHITE)  # Rendu pour calcul de la largeur
+            surface = render_text(SETTINGS_FONT, line, WHITE)  # Rendu pour calcul de la largeur
             width = surface.get_width()
             
             # Calcul de la position x pour centrer la ligne horizontalement
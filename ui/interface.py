@@ -1,8 +1,85 @@
 import pygame
-from typing import Callable, Optional, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
 from settings.constants import *
 
 
+class TextCache:
+    """
+    Cache LRU des surfaces de texte rendues, partagé par tous les widgets.
+    Les surfaces retournées sont partagées : elles ne doivent pas être modifiées.
+    """
+    def __init__(self, max_size: int = 256):
+        """max_size : nombre maximal de surfaces conservées (0 = cache désactivé)"""
+        self.max_size = max_size
+        self._surfaces = OrderedDict() # Clé (police, texte, couleur) -> surface, de la moins à la plus récemment utilisée
+        self.hits = 0 # Rendus évités
+        self.misses = 0 # Rendus effectués (font.render)
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Retourne le texte rendu, en réutilisant la surface déjà calculée si possible"""
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key) # Devient la plus récemment utilisée
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        if self.max_size > 0:
+            self._surfaces[key] = surface
+            if len(self._surfaces) > self.max_size:
+                self._surfaces.popitem(last=False) # Éviction de la moins récemment utilisée
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class OverlayCache:
+    """Surfaces noires semi-transparentes réutilisables, une par (taille, alpha)"""
+    def __init__(self):
+        self._surfaces: Dict[Tuple[Tuple[int, int], int], pygame.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size: Tuple[int, int], alpha: int) -> pygame.Surface:
+        key = (tuple(size), alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = pygame.Surface(size)
+        surface.fill(BLACK)
+        surface.set_alpha(alpha)
+        self._surfaces[key] = surface
+        return surface
+
+
+TEXT_CACHE = TextCache() # Cache partagé par tous les widgets
+OVERLAY_CACHE = OverlayCache()
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int] = WHITE) -> pygame.Surface:
+    """Rendu d'un texte via le cache partagé"""
+    return TEXT_CACHE.render(font, text, color)
+
+def get_overlay(size: Tuple[int, int], alpha: int) -> pygame.Surface:
+    """Overlay noir semi-transparent de la taille donnée, réutilisé d'une image à l'autre"""
+    return OVERLAY_CACHE.get(size, alpha)
+
+def cache_stats() -> dict:
+    """Compteurs de succès/échecs des caches de rendu"""
+    return {
+        'text': {'hits': TEXT_CACHE.hits, 'misses': TEXT_CACHE.misses, 'size': len(TEXT_CACHE._surfaces)},
+        'overlay': {'hits': OVERLAY_CACHE.hits, 'misses': OVERLAY_CACHE.misses}
+    }
+
+
 class UIElement:
     """Classe de base (abstraite) pour tous les éléments d'interface utilisateur"""
     def __init__(self, position: Tuple[float, float], size: Tuple[float, float], relative: bool = True) :
@@ -52,7 +129,7 @@ class Button(UIElement):
         callback : fonction à appeler lors du clic de la souris
         """
         # Calcul automatique de la taille en fonction du texte si `size` est None
-        text_surf = BUTTON_FONT.render(text, True, WHITE)
+        text_surf = render_text(BUTTON_FONT, text, WHITE)
         text_width, text_height = text_surf.get_size()
 
         if size is None:
@@ -89,7 +166,7 @@ class Button(UIElement):
         pygame.draw.rect(screen, color, self.rect, border_radius=10)
 
         # Rendu du texte centré dans le bouton
-        text_surf = BUTTON_FONT.render(self.text, True, WHITE)
+        text_surf = render_text(BUTTON_FONT, self.text, WHITE)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -104,13 +181,13 @@ class Title(UIElement):
     def update_position(self, screen_size: Tuple[int, int]):
         """Met à jour la position du titre"""
         super().update_position(screen_size)
-        text_surf = TITLE_FONT.render(self.text, True, WHITE)
+        text_surf = render_text(TITLE_FONT, self.text, WHITE)
         # Centre horizontalement uniquement, la position verticale est fixe
         self.rect = text_surf.get_rect(center=(screen_size[0]//2, int(screen_size[1] * TITLE_TOP_MARGIN_RATIO)))
     
     def draw(self, screen: pygame.Surface) :
         """Dessine le titre"""
-        text_surf = TITLE_FONT.render(self.text, True, WHITE)
+        text_surf = render_text(TITLE_FONT, self.text, WHITE)
         screen.blit(text_surf, self.rect)
 
 class UIManager:
@@ -193,8 +270,7 @@ class Slider(UIElement):
         pygame.draw.circle(screen, BLUE, handle_pos, self.handle_radius)
         
         # Affichage de la valeur (avec une police légèrement plus petite si nécessaire)
-        font = pygame.font.SysFont(None, 30)
-        text_surf = font.render(str(self.value), True, WHITE)
+        text_surf = render_text(SLIDER_FONT, str(self.value), WHITE)
         text_rect = text_surf.get_rect(center=handle_pos)
         screen.blit(text_surf, text_rect)
         
@@ -224,7 +300,7 @@ class Label(UIElement):
         self.text = text
         self.font = font
         self.color = color
-        self.text_surf = font.render(text, True, color)  # Rendu du texte
+        self.text_surf = render_text(font, text, color)  # Rendu du texte
         size = self.text_surf.get_size()  # Calcul automatique de la taille
 
         super().__init__(position, size, relative)  # Appel du constructeur parent
@@ -232,7 +308,7 @@ class Label(UIElement):
     def update_position(self, screen_size: Tuple[int, int]):
         """Met à jour la position du label"""
         super().update_position(screen_size)
-        self.text_surf = self.font.render(self.text, True, self.color)  # Rendu du texte
+        self.text_surf = render_text(self.font, self.text, self.color)  # Rendu du texte
         self.rect = self.text_surf.get_rect(topleft=(self.rect.x, self.rect.y))  # Mise à jour de la position
 
     def draw(self, screen: pygame.Surface):
@@ -243,7 +319,7 @@ class Label(UIElement):
     def set_text(self, new_text: str):
         """Change le texte affiché et met à jour la taille"""
         self.text = new_text
-        self.text_surf = self.font.render(self.text, True, self.color)
+        self.text_surf = render_text(self.font, self.text, self.color)
         self.rect.size = self.text_surf.get_size()  # Ajuste la taille du rect automatiquement
 
 class Dropdown(UIElement):  # Implémente le menu déroulant, Hérite de UIElement
@@ -309,7 +385,7 @@ class Dropdown(UIElement):  # Implémente le menu déroulant, Hérite de UIEleme
         if not self.visible:
             return
         pygame.draw.rect(screen, BLUE, self.rect, border_radius=5)
-        text_surf = BUTTON_FONT.render(str(self.selected_value), True, WHITE)
+        text_surf = render_text(BUTTON_FONT, str(self.selected_value), WHITE)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -326,7 +402,7 @@ class Dropdown(UIElement):  # Implémente le menu déroulant, Hérite de UIEleme
             )
             color = HOVER_BLUE if i == self.hovered_index else BLUE
             pygame.draw.rect(screen, color, option_rect, border_radius=5)
-            opt_text = BUTTON_FONT.render(str(option), True, WHITE)
+            opt_text = render_text(BUTTON_FONT, str(option), WHITE)
             opt_text_rect = opt_text.get_rect(center=option_rect.center)
             screen.blit(opt_text, opt_text_rect)
         
@@ -0,0 +1,92 @@
+import time
+import pygame
+from collections import deque
+from typing import Optional
+from settings.constants import *
+
+
+class PerformanceHUD:
+    """
+    Overlay de performance affiché en haut à gauche de l'écran de jeu (touche F3) :
+    temps par image sur la dernière seconde et métriques du dernier coup de l'IA.
+    Quand il est masqué, aucune mesure n'est enregistrée.
+    """
+    WINDOW = 1.0  # Fenêtre glissante (en secondes) des temps par image
+    POSITION = (10, 10)  # Coin supérieur gauche en pixels
+    PADDING = 6
+    LINE_SPACING = 4
+
+    def __init__(self):
+        self.visible = False
+        self.frame_times = deque()  # (instant, durée en ms) des images de la dernière seconde
+        self.search_stats = None  # SearchStats du dernier coup de l'IA
+        self.think_time = None  # Durée de réflexion du dernier coup de l'IA, en secondes
+        self.cache_hits = 0  # Cumul depuis l'affichage du HUD
+        self.cache_misses = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.frame_times.clear()
+        if self.visible:
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def record_frame(self, frame_ms: float):
+        """Enregistre la durée de travail d'une image (évènements, IA et dessin)"""
+        now = time.perf_counter()
+        self.frame_times.append((now, frame_ms))
+        while self.frame_times and now - self.frame_times[0][0] > self.WINDOW:
+            self.frame_times.popleft()
+
+    def record_search(self, stats, think_time: float):
+        """Enregistre les métriques du dernier coup de l'IA (stats peut être None)"""
+        self.think_time = think_time
+        self.search_stats = stats
+        if stats is not None:
+            self.cache_hits += stats.cache_hits
+            self.cache_misses += stats.cache_misses
+
+    def lines(self):
+        """Lignes de texte affichées"""
+        if self.frame_times:
+            durations = [duration for _, duration in self.frame_times]
+            frame_line = f"Image : moy {sum(durations) / len(durations):.2f} ms, max {max(durations):.2f} ms"
+        else:
+            frame_line = "Image : -"
+
+        if self.think_time is None:
+            return [frame_line, "IA : aucun coup joué"]
+
+        stats = self.search_stats
+        ai_line = f"IA : {self.think_time * 1000:.0f} ms"
+        if stats is None:
+            return [frame_line, ai_line]
+
+        cutoff_rate = stats.first_move_cutoff_rate()
+        cutoff_text = f"{cutoff_rate * 100:.0f} %" if cutoff_rate is not None else "-"
+        lookups = self.cache_hits + self.cache_misses
+        cache_text = f"{self.cache_hits / lookups * 100:.0f} % ({self.cache_hits}/{lookups})" if lookups else "-"
+        return [
+            frame_line,
+            f"{ai_line}, profondeur {stats.depth}",
+            f"Nœuds : {stats.nodes}  ({stats.nodes_per_second() / 1000:.1f} k/s)",
+            f"Feuilles : {stats.leaf_evaluations}, élagages au 1er coup : {cutoff_text}",
+            f"Cache : {cache_text}",
+        ]
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """Dessine le HUD et retourne le rectangle occupé (None s'il est masqué)"""
+        if not self.visible:
+            return None
+        # Rendu direct (sans le cache de texte partagé) : ces textes changent à chaque image
+        surfaces = [SETTINGS_FONT.render(line, True, WHITE) for line in self.lines()]
+        width = max(surface.get_width() for surface in surfaces) + 2 * self.PADDING
+        height = sum(surface.get_height() + self.LINE_SPACING for surface in surfaces) + 2 * self.PADDING
+        rect = pygame.Rect(self.POSITION, (width, height))
+        pygame.draw.rect(screen, DARK_GREY, rect)
+
+        y = rect.y + self.PADDING
+        for surface in surfaces:
+            screen.blit(surface, (rect.x + self.PADDING, y))
+            y += surface.get_height() + self.LINE_SPACING
+        return rect